@@ -43,6 +43,7 @@ from .src.presets import (
     NumberCard,
     ReverseCard,
     SkipCard,
+    TurnEvent,
     UnoCard,
     UnoDeck,
     UnoGame,
@@ -51,21 +52,67 @@ from .src.presets import (
     WildDrawFourCard,
 )
 
+from .src.agents import Agent, BatchRunner, Decision, RandomAgent, Table
+from .src.blackjack import BlackjackGame, BlackjackPlayer, simulate_blackjack
+from .src.envs import Box, Discrete, UnoEnv, VecUnoEnv
+from .src.poker import HandEvaluator, PokerCard, PokerDeck
+from .src.rules import RuleTable
+from .src.sampling import Determinizer
+from .src.search import MCTSAgent
+from .src.seeding import make_rng, SeedSequence
+from .src.shoe import Shoe
+from .src.solver import Solver
+from .src.tournament import Elo, Tournament
+from .src.tracking import CardTracker
+from .src.turns import TurnOrder
+from .src.whist import resolve_tricks, trick_winner, WhistGame, WhistPlayer
+
 __all__ = [
+    "Agent",
+    "BatchRunner",
+    "BlackjackGame",
+    "BlackjackPlayer",
+    "Box",
     "CardMeta",
+    "CardTracker",
+    "Decision",
     "DeckMeta",
+    "Determinizer",
+    "Discrete",
     "DrawTwoCard",
+    "Elo",
     "GenericCard",
     "GenericDeck",
     "GenericGame",
     "GenericPlayer",
+    "HandEvaluator",
+    "make_rng",
+    "MCTSAgent",
     "NumberCard",
+    "PokerCard",
+    "PokerDeck",
+    "RandomAgent",
+    "resolve_tricks",
     "ReverseCard",
+    "RuleTable",
+    "SeedSequence",
+    "Shoe",
+    "simulate_blackjack",
     "SkipCard",
+    "Solver",
+    "Table",
+    "Tournament",
+    "trick_winner",
+    "TurnEvent",
+    "TurnOrder",
     "UnoCard",
     "UnoDeck",
+    "UnoEnv",
     "UnoGame",
     "UnoPlayer",
+    "VecUnoEnv",
+    "WhistGame",
+    "WhistPlayer",
     "WildCard",
     "WildDrawFourCard",
 ]
@@ -0,0 +1,146 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import random
+from abc import ABC, abstractmethod
+
+from .seeding import make_rng
+
+CALLABLE_SUITS = ("Red", "Green", "Blue", "Yellow")
+
+
+class Decision:
+    __slots__ = ("table", "player", "kind", "options")
+
+    def __init__(self, table, player, kind, options):
+        self.table = table
+        self.player = player
+        self.kind = kind
+        self.options = options
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}("
+                f"player={self.player.name!r}, "
+                f"kind={self.kind!r}, "
+                f"options={self.options!r})")
+
+
+class Agent(ABC):
+    @abstractmethod
+    def decide(self, decisions):  # pragma: no cover
+        pass
+
+    def set_seed(self, seed):
+        return self
+
+
+class RandomAgent(Agent):
+    def __init__(self, seed=None):
+        self.rng = None
+        self.set_seed(seed)
+
+    def set_seed(self, seed):
+        # A private generator keeps the agent picklable
+        self.rng = make_rng(seed) if seed is not None else random.Random()
+        return self
+
+    def decide(self, decisions):
+        return [self.rng.choice(decision.options) for decision in decisions]
+
+
+class Table:
+    __slots__ = ("game", "max_turns", "turns", "winner", "done", "decision",
+                 "event", "_card")
+
+    def __init__(self, game, max_turns=None):
+        self.game = game
+        self.max_turns = max_turns
+        self.turns = 0
+        self.winner = None
+        self.done = False
+        self.decision = None
+        self.event = None
+        self._card = None
+
+        if game.get_top_card() is None:
+            game.start_game()
+        self._ask_card()
+
+    def _ask_card(self):
+        game = self.game
+        self.decision = Decision(self, game.get_current_player(), "card",
+                                 tuple(game.get_playable_cards()) + (None,))
+
+    def resolve(self, choice):
+        decision = self.decision
+        if self.done or choice not in decision.options:
+            raise ValueError(f"Invalid choice: {choice!r}")
+
+        if decision.kind == "card" and choice is not None and choice.wild:
+            # The suit is asked for before the wild card is played
+            self._card = choice
+            self.decision = Decision(self, decision.player, "suit",
+                                     CALLABLE_SUITS)
+            return self
+
+        if decision.kind == "suit":
+            card, suit = self._card, choice
+            self._card = None
+        else:
+            card, suit = choice, None
+        self.event = self.game.play_turn(card, suit)
+        self.winner = self.event.winner
+        self.turns += 1
+
+        if self.winner is not None or self.turns == self.max_turns:
+            self.done = True
+            self.decision = None
+        else:
+            self._ask_card()
+        return self
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}("
+                f"game={self.game!r}, "
+                f"turns={self.turns!r}, "
+                f"done={self.done!r})")
+
+
+class BatchRunner:
+    def __init__(self, games, agent, max_turns=None):
+        self.tables = [Table(game, max_turns) for game in games]
+        self.agent = agent
+
+    def pending(self):
+        return [table.decision for table in self.tables if not table.done]
+
+    def step(self):
+        decisions = self.pending()
+        if decisions:
+            choices = self.agent.decide(decisions)
+            if len(choices) != len(decisions):
+                raise ValueError(f"Expected {len(decisions)} choices, got "
+                                 f"{len(choices)}")
+            for decision, choice in zip(decisions, choices):
+                decision.table.resolve(choice)
+        return len(decisions)
+
+    def run(self):
+        while self.step():
+            pass
+        return [table.winner for table in self.tables]
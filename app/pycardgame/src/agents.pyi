@@ -0,0 +1,200 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import (Any, Iterable, List, Literal, Optional, Sequence, Tuple,
+                    Union)
+
+from .base import GenericPlayer
+from .presets import T_UnoSuitsWild, TurnEvent, UnoCard, UnoGame
+from .seeding import T_Seed
+
+T_Choice = Union[Optional[UnoCard], T_UnoSuitsWild]
+
+CALLABLE_SUITS: Tuple[T_UnoSuitsWild, ...] = ...
+
+
+class Decision:
+    """
+    A decision a table is waiting for. Card decisions list the playable cards
+    followed by None, which stands for drawing instead of playing. Suit
+    decisions follow a wild card decision and list the suits that can be
+    called.
+    :param table: The table that is waiting for the decision.
+    :param player: The player who has to decide.
+    :param kind: Either "card" or "suit".
+    :param options: The legal choices.
+    """
+    __slots__ = ("table", "player", "kind", "options")
+
+    def __init__(self, table: Table, player: GenericPlayer[UnoCard],
+                 kind: Literal["card", "suit"],
+                 options: Tuple[T_Choice, ...]) -> None:
+        """
+        Creates a new decision.
+        :param table: The table that is waiting for the decision.
+        :param player: The player who has to decide.
+        :param kind: Either "card" or "suit".
+        :param options: The legal choices.
+        """
+        self.table: Table = ...
+        self.player: GenericPlayer[UnoCard] = ...
+        self.kind: Literal["card", "suit"] = ...
+        self.options: Tuple[T_Choice, ...] = ...
+
+    def __repr__(self) -> str: ...
+
+
+class Agent(ABC):
+    """
+    A policy that makes decisions for many tables at once. Policies that are
+    expensive per call, e.g. neural networks, can evaluate the whole batch in
+    a single pass.
+    """
+
+    @abstractmethod
+    def decide(self, decisions: Sequence[Decision]) -> Sequence[T_Choice]:
+        """
+        Makes a batch of decisions.
+        :param decisions: The pending decisions, at most one per table.
+        :return: One of the options of each decision, in the same order.
+        """
+
+    def set_seed(self, seed: T_Seed) -> Agent:
+        """
+        Reseeds the agent, e.g. before each match of a tournament. Agents
+        without randomness ignore this.
+        :param seed: The new seed.
+        :return: The agent instance.
+        """
+
+
+class RandomAgent(Agent):
+    """
+    An agent that picks uniformly among the legal options.
+    :param seed: The seed of the agent's random number generator.
+    """
+
+    def __init__(self, seed: Optional[T_Seed] = None) -> None:
+        """
+        Creates a new random agent.
+        :param seed: The seed of the agent's random number generator. If
+            omitted, the agent gets its own unseeded generator.
+        """
+        self.rng: Any = ...
+
+    def set_seed(self, seed: T_Seed) -> RandomAgent:
+        """
+        Replaces the agent's random number generator.
+        :param seed: The new seed, or None for an unseeded generator.
+        :return: The agent instance.
+        """
+
+    def decide(self, decisions: Sequence[Decision]) -> List[T_Choice]:
+        """
+        Picks a random option for every decision.
+        :param decisions: The pending decisions.
+        :return: The chosen options, in the same order.
+        """
+
+
+class Table:
+    """
+    A UNO game driven by decisions. The table starts the game if no card has
+    been played yet, and always holds the decision it is waiting for.
+    :param game: The game to drive.
+    :param max_turns: The number of turns after which the game is stopped
+        without a winner. Unlimited if omitted.
+    """
+    __slots__ = ("game", "max_turns", "turns", "winner", "done", "decision",
+                 "event", "_card")
+
+    def __init__(self, game: UnoGame, max_turns: Optional[int] = None) -> None:
+        """
+        Creates a new table and asks the current player for a card.
+        :param game: The game to drive.
+        :param max_turns: The turn limit of the game.
+        """
+        self.game: UnoGame = ...
+        self.max_turns: Optional[int] = ...
+        self.turns: int = ...
+        self.winner: Optional[GenericPlayer[UnoCard]] = ...
+        self.done: bool = ...
+        self.decision: Optional[Decision] = ...
+        self.event: Optional[TurnEvent] = ...
+        self._card: Optional[UnoCard] = ...
+
+    def _ask_card(self) -> None:
+        """Asks the current player which card to play."""
+
+    def resolve(self, choice: T_Choice) -> Table:
+        """
+        Applies the choice for the pending decision. Choosing a wild card asks
+        for a suit before the card is played; any other choice plays a full
+        turn and asks the next player.
+        :param choice: One of the options of the pending decision.
+        :return: The table instance. The event of a played turn is kept in
+            `event`.
+        :raise ValueError: If the choice is not one of the options, or the
+            game is over.
+        """
+
+    def __repr__(self) -> str: ...
+
+
+class BatchRunner:
+    """
+    Runs many tables in lockstep. Each step collects the pending decision of
+    every running table, hands them to the agent as one batch, and scatters
+    the choices back to the tables.
+    :param games: The games to run.
+    :param agent: The agent deciding for all players.
+    :param max_turns: The turn limit of each game.
+    """
+
+    def __init__(self, games: Iterable[UnoGame], agent: Agent,
+                 max_turns: Optional[int] = None) -> None:
+        """
+        Creates a new runner with one table per game.
+        :param games: The games to run.
+        :param agent: The agent deciding for all players.
+        :param max_turns: The turn limit of each game.
+        """
+        self.tables: List[Table] = ...
+        self.agent: Agent = ...
+
+    def pending(self) -> List[Decision]:
+        """
+        Returns the pending decisions of all running tables.
+        :return: The pending decisions, in table order.
+        """
+
+    def step(self) -> int:
+        """
+        Asks the agent for one batch of decisions and applies them.
+        :return: The size of the batch, 0 once all tables are done.
+        :raise ValueError: If the agent does not return one choice per
+            decision.
+        """
+
+    def run(self) -> List[Optional[GenericPlayer[UnoCard]]]:
+        """
+        Steps until all tables are done.
+        :return: The winner of each table, or None if a table was stopped by
+            its turn limit.
+        """
@@ -16,19 +16,127 @@
 
 from __future__ import annotations
 
+import hashlib
 import random
 from abc import ABC, ABCMeta, abstractmethod
-from typing import Generic, get_args, MutableSequence, Type, TypeVar
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import chain
+from math import comb, inf
+from typing import (
+    Generic,
+    get_args,
+    MutableSequence,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from .seeding import make_rng, SeedSequence
+from .turns import TurnOrder
 
 _RankT = TypeVar("_RankT")
 _SuitT = TypeVar("_SuitT")
 
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
+def _hypergeometric_tail(population, successes, draws, at_least):
+    # Probability of drawing at least `at_least` successes in `draws` draws
+    # without replacement
+    favourable = sum(comb(successes, i) * comb(population - successes,
+                                               draws - i)
+                     for i in range(at_least, min(draws, successes) + 1))
+    return favourable / comb(population, draws)
+
+
+def _sort_key(by, trump=None):
+    # Cards of the trump suit sort like cards flagged as trump, without
+    # changing the cards
+    if by == "rank":
+        return lambda c: (
+            not (c.trump or trump is not None and c.suit == trump),
+            c.rank if c.rank is not None else -1,
+            c.suit if c.suit is not None else -1)
+    elif by == "suit":
+        return lambda c: (
+            c.trump or trump is not None and c.suit == trump,
+            c.suit if c.suit is not None else -1,
+            c.rank if c.rank is not None else -1)
+    raise ValueError("Invalid sort key: must be 'rank' or 'suit'")
+
+
+_ZOBRIST_MASK = (1 << 64) - 1
+
+
+@lru_cache(maxsize=None)
+def _zobrist_key(*parts):
+    # Keys are derived from their parts, so hashes agree across processes
+    return int.from_bytes(hashlib.blake2b(repr(parts).encode(),
+                                          digest_size=8).digest(), "little")
+
+
+def _slot_names(klass):
+    names = {}
+    for base in reversed(klass.__mro__):
+        slots = base.__dict__.get("__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if slot not in ("__dict__", "__weakref__"):
+                names[slot] = None
+    return tuple(names)
+
+
+def _frozen_setattr(self, name, value):
+    if self._sealed:
+        raise AttributeError(f"Cannot modify frozen card: {self!r}")
+    object.__setattr__(self, name, value)
+
+
+def _frozen_delattr(self, name):
+    raise AttributeError(f"Cannot modify frozen card: {self!r}")
+
+
+def _frozen_hash(self):
+    return hash((self.rank, self.suit, self.trump))
+
 
 class CardMeta(ABCMeta):
-    def __new__(cls, name, bases, class_dict, rank_type, suit_type):
+    def __new__(cls, name, bases, class_dict, rank_type, suit_type,
+                frozen=None):
         class_dict["RANKS"] = list(get_args(rank_type))
         class_dict["SUITS"] = list(get_args(suit_type))
-        return super().__new__(cls, name, bases, class_dict)
+        # Cards are created in large numbers, so no card class gets a __dict__
+        class_dict.setdefault("__slots__", ())
+
+        frozen_base = any(getattr(base, "_frozen", False) for base in bases)
+        if frozen is None:
+            frozen = frozen_base
+        elif frozen_base and not frozen:
+            raise TypeError(f"Cannot unfreeze frozen card class: {name}")
+        if frozen:
+            class_dict["_frozen"] = True
+            class_dict.setdefault("__hash__", _frozen_hash)
+            class_dict.setdefault("__setattr__", _frozen_setattr)
+            class_dict.setdefault("__delattr__", _frozen_delattr)
+            if not frozen_base:
+                slots = class_dict["__slots__"]
+                class_dict["__slots__"] = ((slots,) if isinstance(slots, str)
+                                           else tuple(slots)) + ("_sealed",)
+
+        new_cls = super().__new__(cls, name, bases, class_dict)
+        new_cls._card_slots = _slot_names(new_cls)
+        return new_cls
+
+    def __call__(cls, *args, **kwargs):
+        if not cls._frozen:
+            return super().__call__(*args, **kwargs)
+        card = cls.__new__(cls)
+        object.__setattr__(card, "_sealed", False)
+        card.__init__(*args, **kwargs)
+        object.__setattr__(card, "_sealed", True)
+        return card
 
 
 class GenericCard(ABC, Generic[_RankT, _SuitT]):
@@ -37,6 +145,11 @@ class GenericCard(ABC, Generic[_RankT, _SuitT]):
     RANKS: MutableSequence[_RankT] = []
     SUITS: MutableSequence[_SuitT] = []
 
+    _card_slots: Tuple[str, ...] = ("rank", "suit", "trump")
+    _frozen = False
+    _sealed = False
+    _kind_flag = "trump"
+
     def __init__(self, rank, suit, trump=False):
         self.rank = None
         self.suit = None
@@ -70,9 +183,15 @@ class GenericCard(ABC, Generic[_RankT, _SuitT]):
             return None
         return self.rank if as_index else self.__class__.RANKS[self.rank]
 
+    def _evolve(self, **changes):
+        card = self.__copy__() if self._sealed else self
+        for name, value in changes.items():
+            object.__setattr__(card, name, value)
+        return card
+
     def change_rank(self, rank):
-        self.rank = self._set_value(rank, self.__class__.RANKS, "rank")
-        return self
+        return self._evolve(
+            rank=self._set_value(rank, self.__class__.RANKS, "rank"))
 
     def get_suit(self, as_index=False):
         if self.suit is None:
@@ -80,20 +199,44 @@ class GenericCard(ABC, Generic[_RankT, _SuitT]):
         return self.suit if as_index else self.__class__.SUITS[self.suit]
 
     def change_suit(self, suit):
-        self.suit = self._set_value(suit, self.__class__.SUITS, "suit")
-        return self
+        return self._evolve(
+            suit=self._set_value(suit, self.__class__.SUITS, "suit"))
 
     def is_trump(self):
         return self.trump
 
+    def kind_key(self):
+        return self.rank, self.suit
+
+    @classmethod
+    def _kind_count(cls):
+        return len(cls.RANKS) * len(cls.SUITS) * 2
+
+    @classmethod
+    def _from_kind(cls, kind):
+        card = cls.__new__(cls)
+        for name in cls._card_slots:
+            object.__setattr__(card, name, False)
+        rank, suit = divmod(kind >> 1, len(cls.SUITS))
+        object.__setattr__(card, "rank", rank)
+        object.__setattr__(card, "suit", suit)
+        object.__setattr__(card, cls._kind_flag, bool(kind & 1))
+        return card
+
     def set_trump(self, trump):
         if not isinstance(trump, bool):
             raise TypeError("Trump must be a boolean value")
-        self.trump = trump
-        return self
+        return self._evolve(trump=trump)
 
     def __copy__(self):
-        return self.__class__(rank=self.rank, suit=self.suit, trump=self.trump)
+        card = object.__new__(self.__class__)
+        for name in self._card_slots:
+            value = getattr(self, name, _MISSING)
+            if value is not _MISSING:
+                object.__setattr__(card, name, value)
+        if hasattr(self, "__dict__"):
+            card.__dict__.update(self.__dict__)
+        return card
 
     def __str__(self):
         rank_str = str(self.get_rank(as_index=False))
@@ -143,33 +286,115 @@ _CardT = TypeVar("_CardT", bound=GenericCard)
 class DeckMeta(ABCMeta):
     def __new__(cls, name, bases, class_dict, card_type):
         class_dict["_card_type"] = card_type
+        class_dict["_prototype"] = None
         return super().__new__(cls, name, bases, class_dict)
 
 
 class GenericDeck(ABC, Generic[_CardT]):
     _card_type: Type[_CardT]
+    _prototype: Optional[Tuple[_CardT, ...]] = None
     __hash__ = None  # type: ignore  # Mutable type, so hash is not defined
 
-    def __init__(self, cards=None):
+    def __init__(self, cards=None, lazy=False, seed=None):
+        self._lazy = lazy
+        self._pending = 0
+        self._rng = make_rng(seed)
+        self._composition = None
         if cards is None:
-            self.cards = self.reset().get_cards()
+            self.reset()
         else:
             self.cards = list(cards)
 
+    @property
+    def cards(self):
+        if self._pending:
+            self._realize()
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards):
+        self._cards = cards
+        self._pending = 0
+        if self._composition is not None:
+            self.track_composition()
+
+    def _realize(self):
+        # Fix the order of the cards that have not been drawn since the last
+        # lazy shuffle
+        pending = self._cards[:self._pending]
+        self._rng.shuffle(pending)
+        self._cards[:self._pending] = pending
+        self._pending = 0
+
+    def _draw_pending(self):
+        cards = self._cards
+        last = self._pending - 1
+        index = self._rng.randrange(self._pending)
+        card = cards[index]
+        cards[index] = cards[last]
+        del cards[last]
+        self._pending = last
+        return card
+
+    @classmethod
+    def _build_cards(cls):
+        return sorted(cls._card_type(rank, suit)
+                      for suit in range(len(cls._card_type.SUITS))
+                      for rank in range(len(cls._card_type.RANKS)))
+
+    @classmethod
+    def _get_prototype(cls):
+        if cls._prototype is None:
+            cls._prototype = tuple(cls._build_cards())
+        return cls._prototype
+
     def reset(self):
-        self.cards = [self._card_type(rank, suit)
-                      for suit in range(len(self._card_type.SUITS))
-                      for rank in range(len(self._card_type.RANKS))]
-        return self.sort()
+        self.cards = [card.__copy__() for card in self._get_prototype()]
+        return self
+
+    def track_composition(self, enabled=True):
+        if enabled:
+            self._composition = (Counter(), Counter(), Counter(),
+                                 defaultdict(Counter))
+            self._update_composition(self._cards, 1)
+        else:
+            self._composition = None
+        return self
+
+    def _update_composition(self, cards, sign):
+        by_card, by_rank, by_suit, by_equal = self._composition  # type: ignore
+        for card in cards:
+            by_card[card.kind_key()] += sign
+            by_rank[card.rank] += sign
+            by_suit[card.suit] += sign
+            by_equal[card.rank, card.suit, card.trump][card.__class__] += sign
+
+    def _count_equal(self, card):
+        # Cards are equal to cards of the same or a related class with the
+        # same rank, suit and trump flag, which is what the index is keyed by
+        classes = self._composition[3].get(  # type: ignore
+            (card.rank, card.suit, card.trump))
+        if not classes:
+            return 0
+        kind = card.__class__
+        return sum(n for cls, n in classes.items()
+                   if issubclass(cls, kind) or issubclass(kind, cls))
 
     def count(self, card):
+        composition = self._composition
         if isinstance(card, self._card_type):
-            return self.cards.count(card)
+            if composition is not None:
+                return self._count_equal(card)
+            return self._cards.count(card)
         elif isinstance(card, str):
             if card in self._card_type.RANKS:
-                return sum(1 for c in self.cards if c.get_rank() == card)
+                if composition is not None:
+                    return composition[1][self._card_type.RANKS.index(card)]
+                return sum(1 for c in self._cards if c.get_rank() == card)
             elif card in self._card_type.SUITS:
-                return sum(1 for c in self.cards if c.get_suit() == card)
+                if composition is not None:
+                    return composition[2][self._card_type.SUITS.index(card)]
+                return sum(1 for c in self._cards if c.get_suit() == card)
             else:
                 raise ValueError(
                     "Invalid card name: must be a rank or suit name")
@@ -177,53 +402,108 @@ class GenericDeck(ABC, Generic[_CardT]):
             raise TypeError(
                 "Invalid card type: must be a Card object, a suit, or a rank")
 
-    def sort(self, by="suit"):
-        if by == "rank":
-            self.cards.sort(key=lambda c: (
-                not c.trump, c.rank if c.rank is not None else -1,
-                c.suit if c.suit is not None else -1))
-        elif by == "suit":
-            self.cards.sort()
+    def draw_probability(self, card, n=1, k=1):
+        if n < 0 or n > len(self._cards):
+            raise ValueError(f"Invalid number of draws: {n} (must be between "
+                             f"0 and {len(self._cards)})")
+        if k < 0:
+            raise ValueError(f"Invalid number of cards: {k}")
+        return _hypergeometric_tail(len(self._cards), self.count(card), n, k)
+
+    def expected_draws(self, card):
+        matches = self.count(card)
+        if matches == 0:
+            return inf
+        return (len(self._cards) + 1) / (matches + 1)
+
+    def sort(self, by="suit", trump=None):
+        if trump is not None:
+            trump = GenericCard._set_value(trump, self._card_type.SUITS,
+                                           "suit")
+        if by == "suit" and trump is None:
+            self._cards.sort()
         else:
-            raise ValueError("Invalid sort key: must be 'rank' or 'suit'")
+            self._cards.sort(key=_sort_key(by, trump))
+        self._pending = 0
+        return self
+
+    def set_seed(self, seed):
+        self._rng = make_rng(seed)
         return self
 
     def shuffle(self, seed=None):
         if seed is not None:
-            random.seed(seed)
-        random.shuffle(self.cards)
+            self._rng.seed(seed)
+        if self._lazy:
+            self._pending = len(self._cards)
+        else:
+            self._rng.shuffle(self._cards)
+            self._pending = 0
         return self
 
     def draw(self, n=1):
-        if n < 1 or n > len(self.cards):
+        cards = self._cards
+        if n < 1 or n > len(cards):
             raise ValueError(f"Cannot draw {n} cards: number of cards to draw "
-                             f"must be between 1 and {len(self.cards)}")
-        return self.cards.pop(0) if n == 1 else [self.cards.pop(0) for _ in (
-            range(n))]
+                             f"must be between 1 and {len(cards)}")
+        if self._pending:
+            drawn = [self._draw_pending() if self._pending else cards.pop(0)
+                     for _ in range(n)]
+        else:
+            drawn = cards[:n]
+            del cards[:n]
+        if self._composition is not None:
+            self._update_composition(drawn, -1)
+        return drawn[0] if n == 1 else drawn
 
     def add(self, *cards, to_top=False):
         if not all(isinstance(card, self._card_type) for card in cards):
             raise TypeError("Invalid card type: must be a Card object")
         if to_top:
-            self.cards = list(cards) + self.cards
+            self._realize()
+            self._cards[:0] = cards
         else:
-            self.cards.extend(cards)
+            self._cards.extend(cards)
+        if self._composition is not None:
+            self._update_composition(cards, 1)
         return self
 
+    def _kind_counts(self):
+        # Reads the cards as they are stored, so a lazy order is not realized
+        if self._composition is not None:
+            return self._composition[0].items()
+        return Counter(card.kind_key() for card in self._cards).items()
+
+    def _lacks(self, card):
+        # The composition index can rule out a card without scanning the deck
+        return self._composition is not None and not self._count_equal(card)
+
     def remove(self, *cards):
         if not all(isinstance(card, self._card_type) for card in cards):
             raise TypeError("Invalid card type: must be a Card object")
         for card in cards:
-            self.cards.remove(card)
+            if self._lacks(card):
+                raise ValueError(f"Card not in deck: {card!r}")
+            index = self._cards.index(card)
+            del self._cards[index]
+            if index < self._pending:
+                self._pending -= 1
+        if self._composition is not None:
+            self._update_composition(cards, -1)
         return self
 
     def clear(self):
-        self.cards.clear()
+        self._cards.clear()
+        self._pending = 0
+        if self._composition is not None:
+            self.track_composition()
         return self
 
     def get_index(self, card):
         if not isinstance(card, self._card_type):
             raise TypeError("Invalid card type: must be a Card object")
+        if self._lacks(card):
+            return []
         return [i for i, c in enumerate(self.cards) if c == card]
 
     def get_cards(self):
@@ -253,13 +533,24 @@ class GenericDeck(ABC, Generic[_CardT]):
         return not self.__eq__(other)
 
     def __copy__(self):
-        return self.__class__(cards=self.cards.copy())
+        deck = self.__class__(cards=self._cards.copy(), lazy=self._lazy)
+        # The copy keeps the cards that are still lazily shuffled and goes on
+        # with the same random sequence, without realizing the order here
+        deck._pending = self._pending
+        if isinstance(self._rng, random.Random):
+            deck._rng = random.Random()
+            deck._rng.setstate(self._rng.getstate())
+        else:
+            deck._rng = self._rng
+        if self._composition is not None:
+            deck.track_composition()
+        return deck
 
     def __getitem__(self, key):
         return self.cards[key]
 
     def __len__(self):
-        return len(self.cards)
+        return len(self._cards)
 
     def __iter__(self):
         return iter(self.cards)
@@ -267,10 +558,12 @@ class GenericDeck(ABC, Generic[_CardT]):
     def __contains__(self, item):
         if not isinstance(item, self._card_type):
             return False
-        return item in self.cards
+        if self._composition is not None:
+            return self._count_equal(item) > 0
+        return item in self._cards
 
     def __bool__(self):
-        return bool(self.cards)
+        return bool(self._cards)
 
 
 class GenericPlayer(ABC, Generic[_CardT]):
@@ -284,16 +577,41 @@ class GenericPlayer(ABC, Generic[_CardT]):
     def add_cards(self, *cards):
         self.hand.extend(cards)
 
+    def _remove_from_hand(self, cards):
+        hand = self.hand
+        if len(cards) > 1 and all(getattr(card, "_frozen", False)
+                                  for card in chain(cards, hand)):
+            # Hashable cards can be removed in a single pass over the hand
+            pending = Counter(cards)
+            kept = []
+            for card in hand:
+                if pending[card]:
+                    pending[card] -= 1
+                else:
+                    kept.append(card)
+            missing = [card for card, n in pending.items() if n]
+            if missing:
+                raise ValueError(f"Card not in hand: {missing[0]!r}")
+            hand[:] = kept
+        else:
+            for card in cards:
+                # Prefer the same object, since equal mutable cards can differ
+                # later on, e.g. after a wild card is given a suit
+                for i, held in enumerate(hand):
+                    if held is card:
+                        del hand[i]
+                        break
+                else:
+                    hand.remove(card)
+
     def remove_cards(self, *cards):
-        for card in cards:
-            self.hand.remove(card)
+        self._remove_from_hand(cards)
         return self
 
     def play_cards(self, *cards):
         if not cards:
-            cards = self.hand
-        for card in cards:
-            self.hand.remove(card)
+            cards = tuple(self.hand)
+        self._remove_from_hand(cards)
         return list(cards)
 
     def get_hand(self):
@@ -358,17 +676,34 @@ class GenericPlayer(ABC, Generic[_CardT]):
 
 
 class GenericGame(ABC, Generic[_CardT]):
+    EVENTS = ("card_played", "cards_drawn", "pile_reshuffled",
+              "direction_reversed", "trump_changed", "game_started",
+              "game_ended")
+
+    rules = None
+    # Replaced, never mutated, so that dispatch works on a stable snapshot
+    _listeners = {}
+
     def __init__(self, card_type, deck_type, draw_pile=None, discard_pile=None,
                  trump=None, hand_size=4, starting_player_index=0,
-                 do_not_shuffle=False, *players):
+                 do_not_shuffle=False, *players, seed=None):
         self._card_type = card_type
         self._deck_type = deck_type
 
         if trump is not None and trump not in self._card_type.SUITS:
             raise ValueError(f"Invalid suit for trump: {trump}")
 
+        self.seed_sequence = None
+        self.rng = random
+        if seed is not None:
+            self.seed_sequence = seed if isinstance(seed, SeedSequence) \
+                else SeedSequence(seed)
+            self.rng = self.seed_sequence.child(0).random()
+
         self.draw_pile = draw_pile if draw_pile is not None \
             else self._deck_type()
+        if self.seed_sequence is not None:
+            self.draw_pile.set_seed(self.seed_sequence.child(1))
         if not do_not_shuffle:
             self.draw_pile.shuffle()
 
@@ -379,9 +714,11 @@ class GenericGame(ABC, Generic[_CardT]):
         self.players = list(players) if players else []
 
         self.trump = None
+        self._trump_suit = None
+        # Whether the cards carry trump flags that must follow the trump suit
+        self._trump_applied = False
         if trump is not None:
             self.set_trump(trump)
-        self.apply_trump()
 
         start_idx = starting_player_index
         if start_idx != 0:  # 0 is a valid index
@@ -391,6 +728,14 @@ class GenericGame(ABC, Generic[_CardT]):
         self.current_player_index = start_idx
 
         self.direction = 1  # 1 for clockwise, -1 for counter-clockwise
+        # Optional ring that takes over the turn handling, see use_turn_order
+        self.turn_order = None
+
+        # Hash of where the cards are, computed on first use and then kept up
+        # to date by the methods that move cards
+        self._card_hash = None
+        # Seats of the players by identity, built along with the card hash
+        self._seats = {}
 
     @abstractmethod
     def check_valid_play(self, card1, card2):  # pragma: no cover
@@ -404,8 +749,103 @@ class GenericGame(ABC, Generic[_CardT]):
     def end_game(self):  # pragma: no cover
         pass
 
+    def subscribe(self, event, listener):
+        if event not in self.EVENTS:
+            raise ValueError(f"Unknown event: {event}")
+        listeners = dict(self._listeners)
+        listeners[event] = listeners.get(event, ()) + (listener,)
+        self._listeners = listeners
+        return self
+
+    def unsubscribe(self, event, listener):
+        current = self._listeners.get(event, ())
+        if listener not in current:
+            raise ValueError(f"Listener not subscribed to {event}: "
+                             f"{listener!r}")
+        remaining = list(current)
+        remaining.remove(listener)
+        listeners = dict(self._listeners)
+        if remaining:
+            listeners[event] = tuple(remaining)
+        else:
+            del listeners[event]
+        self._listeners = listeners
+        return self
+
+    def _emit(self, event, *args):
+        for listener in self._listeners.get(event, ()):
+            listener(self, *args)
+
+    def rule_state(self):
+        return 0
+
+    def _hash_state(self):
+        return (("player", self.current_player_index),
+                ("direction", self.direction), ("trump", self._trump_suit))
+
+    def _hash_cards(self, location, cards, sign=1):
+        if self._card_hash is None or location is None:
+            return
+        value = self._card_hash
+        for card in cards:
+            value += sign * _zobrist_key(location, *card.kind_key())
+        self._card_hash = value & _ZOBRIST_MASK
+
+    def _hash_pile(self, location, pile):
+        value = self._card_hash
+        for key, n in pile._kind_counts():
+            value += n * _zobrist_key(location, *key)
+        self._card_hash = value & _ZOBRIST_MASK
+
+    def _get_seat(self, player):
+        entry = self._seats.get(id(player))
+        if entry is None or entry[0] is not player:
+            # A copied game still holds the identities of the original players
+            self._seats = {id(p): (p, seat)
+                           for seat, p in enumerate(self.players)}
+            entry = self._seats.setdefault(id(player), (player, None))
+        return entry[1]
+
+    def _hash_hand(self, player, cards, sign=1):
+        if self._card_hash is not None:
+            self._hash_cards(self._get_seat(player), cards, sign)
+
+    def zobrist_hash(self):
+        if self._card_hash is None:
+            self._card_hash = 0
+            self._seats = {}
+            self._hash_pile("draw", self.draw_pile)
+            self._hash_pile("discard", self.discard_pile)
+            for seat, player in enumerate(self.players):
+                self._hash_cards(seat, player.hand)
+        value = self._card_hash
+        top_card = self.get_top_card()
+        if top_card is not None:
+            # The top card is hashed as it is, e.g. with a called suit
+            value += _zobrist_key("top", top_card.rank, top_card.suit)
+        for part in self._hash_state():
+            value += _zobrist_key(*part)
+        return value & _ZOBRIST_MASK
+
+    def rehash(self):
+        self._card_hash = None
+        return self
+
+    def get_playable_cards(self, player=None):
+        top_card = self.get_top_card()
+        if top_card is None:
+            return []
+        if player is None:
+            player = self.get_current_player()
+        if self.rules is not None:
+            return self.rules.playable(player.hand, top_card,
+                                       self.rule_state())
+        return [card for card in player.hand
+                if self.check_valid_play(card, top_card)]
+
     def discard_cards(self, *cards):
         self.discard_pile.add(*cards, to_top=True)
+        self._hash_cards("discard", cards)
         return self
 
     def get_discard_pile(self):
@@ -419,17 +859,28 @@ class GenericGame(ABC, Generic[_CardT]):
             self.draw_pile.add(*self.discard_pile.get_cards())
             self.discard_pile.clear()
             self.draw_pile.shuffle()
+            self._card_hash = None
+            if self._listeners:
+                self._emit("pile_reshuffled")
         return self
 
+    def _draw_to(self, player, n):
+        drawn = self.draw_pile.draw(n)
+        if not isinstance(drawn, list):
+            drawn = [drawn]
+        player.add_cards(*drawn)
+        if self._card_hash is not None:
+            self._hash_cards("draw", drawn, -1)
+            self._hash_hand(player, drawn)
+        if self._listeners:
+            self._emit("cards_drawn", player, drawn)
+        return drawn
+
     def draw_cards(self, player=None, n=1):
         if len(self.draw_pile) >= n:
             if player is None:
                 player = self.get_current_player()
-            drawn = self.draw_pile.draw(n)
-            if not isinstance(drawn, list):
-                drawn = [drawn]
-            player.add_cards(*drawn)
-            return drawn
+            return self._draw_to(player, n)
         if len(self.draw_pile) == 0:
             return self.reshuffle_discard_pile().draw_cards(player, n)
         raise ValueError("Not enough cards in the draw pile.")
@@ -439,22 +890,68 @@ class GenericGame(ABC, Generic[_CardT]):
         for player in players_to_deal:
             cards_needed = max(0, self.hand_size - len(player.hand))
             if cards_needed > 0:
-                player.add_cards(*self.draw_pile.draw(cards_needed))
+                self._draw_to(player, cards_needed)
+        return self
+
+    def use_turn_order(self, enabled=True):
+        if enabled:
+            current = self.get_current_player() if self.players else None
+            self.turn_order = TurnOrder(self.players, current, self.direction)
+        else:
+            self.turn_order = None
         return self
 
     def add_players(self, *players):
-        self.players.extend(players)
+        if self.turn_order is not None:
+            self.turn_order.add(*players)
+        # New players are seated after the others, whose seats stay the same
+        for player in players:
+            self._seats[id(player)] = (player, len(self.players))
+            self.players.append(player)
+            self._hash_hand(player, player.hand)
         return self
 
+    def _unseat(self, player):
+        # The ring holds the turn order, so the last player takes the free
+        # seat and only the seats of these two players change
+        seat = self._get_seat(player)
+        self._hash_hand(player, player.hand, -1)
+        del self._seats[id(player)]
+        last = self.players.pop()
+        if last is not player:
+            self._hash_hand(last, last.hand, -1)
+            self.players[seat] = last
+            self._seats[id(last)] = (last, seat)
+            self._hash_hand(last, last.hand)
+
     def remove_players(self, *players):
+        turn_order = self.turn_order
+        if turn_order is not None:
+            for player in players:
+                turn_order.remove(player)
+                self._unseat(player)
+            self.current_player_index = self._get_seat(
+                turn_order.get_current()) if self.players else 0
+            return self
         for player in players:
-            self.players.remove(player)
+            index = self.players.index(player)
+            del self.players[index]
+            # The current player keeps the turn, and if it was the removed
+            # player, the turn passes to whoever would have played next
+            if index < self.current_player_index or (
+                    index == self.current_player_index and
+                    self.direction == -1):
+                self.current_player_index -= 1
+            self.current_player_index = self.current_player_index % len(
+                self.players) if self.players else 0
+        self._card_hash = None
+        self._seats = {}
         return self
 
     def deal(self, num_cards=1, *players):
         players = players or self.players
         for player in players:
-            player.add_cards(*self.draw_pile.draw(num_cards))
+            self._draw_to(player, num_cards)
         return self
 
     def play_card(self, card, player=None, *args):
@@ -469,7 +966,11 @@ class GenericGame(ABC, Generic[_CardT]):
 
             self.discard_cards(card)
             player.play_cards(card)
-
+            self._hash_hand(player, (card,), -1)
+            # Listeners see the play before the effect, which may draw cards
+            # and reshuffle the discard pile the card was just put on
+            if self._listeners:
+                self._emit("card_played", player, card)
             card.effect(self, player, *args)
 
             return True
@@ -486,20 +987,39 @@ class GenericGame(ABC, Generic[_CardT]):
         if suit not in self._card_type.SUITS:
             raise ValueError(f"Invalid suit for trump: {suit}")
         self.trump = suit
+        self._trump_suit = self._card_type.SUITS.index(suit)
+        if self._listeners:
+            self._emit("trump_changed", suit)
         return self
 
+    def is_trump(self, card):
+        return card.trump or (self._trump_suit is not None and
+                              card.suit == self._trump_suit)
+
+    def card_key(self, card, by="suit"):
+        return _sort_key(by, self._trump_suit)(card)
+
+    def sort_cards(self, cards, by="suit"):
+        return sorted(cards, key=_sort_key(by, self._trump_suit))
+
     def apply_trump(self):
         for deck in ([self.draw_pile.get_cards(), self.discard_pile.get_cards()]
                      + [player.hand for player in self.players]):
             for card in deck:
                 card.set_trump(card.get_suit() == self.trump)
+        # The flags are part of what the composition indexes compare
+        for pile in (self.draw_pile, self.discard_pile):
+            if getattr(pile, "_composition", None) is not None:
+                pile.track_composition()
+        self._trump_applied = True
         return self
 
     def change_trump(self, suit):
         if suit not in self._card_type.SUITS:
             raise ValueError(f"Invalid suit for trump: {suit}")
         self.set_trump(suit)
-        self.apply_trump()
+        if self._trump_applied:
+            self.apply_trump()
         return self
 
     def get_current_player(self):
@@ -511,10 +1031,15 @@ class GenericGame(ABC, Generic[_CardT]):
                 raise ValueError("Invalid player index")
             self.current_player_index = player
         elif isinstance(player, GenericPlayer):
-            self.current_player_index = self.players.index(player)
+            # With the ring, the seat is looked up by identity
+            seat = None if self.turn_order is None else self._get_seat(player)
+            self.current_player_index = self.players.index(player) \
+                if seat is None else seat
         else:
             raise TypeError(
                 "Invalid player type: must be an integer or a Player object")
+        if self.turn_order is not None:
+            self.turn_order.set_current(self.players[self.current_player_index])
         return self
 
     def get_players(self):
@@ -523,6 +1048,10 @@ class GenericGame(ABC, Generic[_CardT]):
     def next_player(self):
         self.reshuffle_discard_pile()
 
+        if self.turn_order is not None:
+            self.current_player_index = self._get_seat(
+                self.turn_order.advance())
+            return self
         new_index = (self.current_player_index + self.direction) % len(
             self.players)
         self.set_current_player(new_index)
@@ -530,6 +1059,10 @@ class GenericGame(ABC, Generic[_CardT]):
 
     def reverse_direction(self):
         self.direction *= -1
+        if self.turn_order is not None:
+            self.turn_order.reverse()
+        if self._listeners:
+            self._emit("direction_reversed", self.direction)
         return self
 
     def get_draw_pile(self):
@@ -537,6 +1070,7 @@ class GenericGame(ABC, Generic[_CardT]):
 
     def set_draw_pile(self, deck):
         self.draw_pile = deck
+        self._card_hash = None
         return self
 
     def __str__(self):
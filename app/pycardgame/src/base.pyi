@@ -19,7 +19,11 @@ from __future__ import annotations
 from abc import ABC, ABCMeta, abstractmethod
 from typing import (
     Any,
+    Callable,
+    Counter,
+    Dict,
     Generic,
+    Iterable,
     Iterator,
     List,
     Literal,
@@ -27,11 +31,16 @@ from typing import (
     Optional,
     overload,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
 )
 
+from .seeding import SeedSequence, T_Seed
+from .turns import TurnOrder
+from .rules import RuleTable
+
 _RankT = TypeVar("_RankT")
 _SuitT = TypeVar("_SuitT")
 _CardT = TypeVar("_CardT", bound="GenericCard")
@@ -39,12 +48,58 @@ _GameT_co = TypeVar("_GameT_co", bound="GenericGame", covariant=True)
 _PlayerT_co = TypeVar("_PlayerT_co", bound="GenericPlayer", covariant=True)
 
 
+def _hypergeometric_tail(population: int, successes: int, draws: int,
+                         at_least: int) -> float: ...
+
+
+def _sort_key(by: Literal["suit", "rank"],
+              trump: Optional[int] = None) -> Callable[[Any], Tuple[Any, ...]]:
+    """
+    Returns the sort key of cards for a sort attribute and trump suit.
+    :param by: The attribute to sort by. Sorting by suit places trump cards
+        last, like comparing cards; sorting by rank places them first.
+    :param trump: The index of the trump suit. Cards of this suit sort like
+        cards flagged as trump.
+    :return: The key function.
+    :raise ValueError: If the `by` parameter is not a valid attribute.
+    """
+
+
+_ZOBRIST_MASK: int
+
+
+def _zobrist_key(*parts: Any) -> int:
+    """
+    Returns the 64-bit Zobrist key of a hashed feature. Keys are derived from
+    the parts with BLAKE2b, so they are the same in every process.
+    :param parts: The parts naming the feature, e.g. a location and a card
+        kind.
+    :return: The key.
+    """
+
+
+def _frozen_setattr(self: GenericCard[Any, Any], name: str,
+                    value: Any) -> None: ...
+
+
+def _frozen_delattr(self: GenericCard[Any, Any], name: str) -> None: ...
+
+
+def _frozen_hash(self: GenericCard[Any, Any]) -> int: ...
+
+
 class CardMeta(ABCMeta):
-    """A metaclass for automatically creating custom card classes."""
+    """
+    A metaclass for automatically creating custom card classes. Card classes
+    that do not declare `__slots__` get an empty `__slots__`, so no card
+    carries a per-instance `__dict__`. Attributes added by a subclass must be
+    declared in its `__slots__`.
+    """
 
     def __new__(cls, name: str, bases: tuple[Any, ...],
                 class_dict: dict[str, Any], rank_type: Type[_RankT],
-                suit_type: Type[_SuitT]) -> CardMeta:
+                suit_type: Type[_SuitT],
+                frozen: Optional[bool] = None) -> CardMeta:
         """
         Creates a new card class with the given rank and suit types.
         :param name: The name of the class.
@@ -52,7 +107,19 @@ class CardMeta(ABCMeta):
         :param class_dict: The class dictionary.
         :param rank_type: The type of the card rank.
         :param suit_type: The type of the card suit.
+        :param frozen: If `True`, the cards of the class are immutable and
+            hashable, so they can be used in sets and as dictionary keys.
+            Methods that would change a frozen card return a changed copy
+            instead. If omitted, the class is frozen if any base class is.
         :return: The new card class.
+        :raise TypeError: If `frozen` is `False` but a base class is frozen.
+        """
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        """
+        Creates a new card instance. Frozen cards are sealed once their
+        constructor has finished.
+        :return: The new card.
         """
 
 
@@ -68,6 +135,11 @@ class GenericCard(ABC, Generic[_RankT, _SuitT]):
     RANKS: MutableSequence[_RankT] = ...
     SUITS: MutableSequence[_SuitT] = ...
 
+    _card_slots: Tuple[str, ...] = ...
+    _frozen: bool = ...
+    _sealed: bool = ...
+    _kind_flag: str = ...
+
     def __init__(self, rank: Optional[Union[_RankT, int]],
                  suit: Optional[Union[_SuitT, int]],
                  trump: bool = False) -> None:
@@ -111,12 +183,21 @@ class GenericCard(ABC, Generic[_RankT, _SuitT]):
         :return: The rank of the card.
         """
 
+    def _evolve(self, **changes: Any) -> GenericCard[_RankT, _SuitT]:
+        """
+        Applies changes to the card's attributes. A frozen card is copied
+        first, so it stays unchanged.
+        :param changes: The new values of the attributes.
+        :return: The changed card, which is a new card if this card is frozen.
+        """
+
     def change_rank(self, rank: Optional[Union[_RankT, int]]) -> GenericCard[
         _RankT, _SuitT]:
         """
         Sets the card’s rank. Accepts a rank name or an integer index.
         :param rank: The rank to set.
-        :return: The card with the rank set.
+        :return: The card with the rank set. For a frozen card, this is a new
+            card, and the original card is unchanged.
         :raise ValueError: If the given string is not found in `rank_names` or
             the index is out of range.
         """
@@ -134,7 +215,8 @@ class GenericCard(ABC, Generic[_RankT, _SuitT]):
         """
         Sets the card’s suit. Accepts a suit name or an integer index.
         :param suit: The suit to set.
-        :return: The card instance with the updated suit.
+        :return: The card instance with the updated suit. For a frozen card,
+            this is a new card, and the original card is unchanged.
         :raise ValueError: If the given string is not found in `suit_names` or
             the index is out of range.
         """
@@ -146,21 +228,56 @@ class GenericCard(ABC, Generic[_RankT, _SuitT]):
         """
         pass
 
+    def kind_key(self) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Returns the key of the card's kind, which identifies the card within
+        a deck regardless of state that changes during a game, such as the
+        trump flag. Card classes whose cards change while in play override
+        this.
+        :return: The rank and suit indices of the card.
+        """
+
+    @classmethod
+    def _kind_count(cls) -> int:
+        """
+        Returns the number of card kinds. A kind is a combination of rank,
+        suit, and the boolean attribute named by `_kind_flag`.
+        :return: The number of card kinds.
+        """
+
+    @classmethod
+    def _from_kind(cls, kind: int) -> GenericCard[_RankT, _SuitT]:
+        """
+        Creates a representative card of a kind without calling `__init__`.
+        Attributes other than the rank, the suit and the kind flag are set to
+        `False`.
+        :param kind: The kind index, as computed by `RuleTable.kind()`.
+        :return: The representative card.
+        """
+
     def set_trump(self, trump: bool) -> GenericCard[_RankT, _SuitT]:
         """
         Set whether the card is a trump card.
         :param trump: Whether the card is a trump card.
-        :return: The card with the trump status set.
+        :return: The card with the trump status set. For a frozen card, this
+            is a new card, and the original card is unchanged.
         """
 
     def __copy__(self) -> GenericCard[_RankT, _SuitT]:
         """
-        Creates a shallow copy of the card.
+        Creates a shallow copy of the card. The copy is made by cloning the
+        card's slots directly, so the constructor is not called again.
         :return: A new card instance with the same rank, suit, and trump status.
         """
 
     def __lt__(self, other: GenericCard[_RankT, _SuitT]) -> bool: ...
 
+    def __hash__(self) -> int:
+        """
+        Returns the hash of the card. Only frozen cards are hashable.
+        :return: The hash of the card's rank, suit, and trump status.
+        """
+
     @overload
     def __eq__(self, other: GenericCard[_RankT, _SuitT]) -> bool: ...
 
@@ -181,7 +298,11 @@ class GenericCard(ABC, Generic[_RankT, _SuitT]):
 
 
 class DeckMeta(ABCMeta):
-    """A metaclass for automatically creating custom deck classes."""
+    """
+    A metaclass for automatically creating custom deck classes. Every deck
+    class gets its own prototype slot, which holds the canonical composition
+    of the deck once it has been built.
+    """
 
     def __new__(cls, name: str, bases: tuple[Any, ...],
                 class_dict: dict[str, Any],
@@ -201,28 +322,108 @@ class GenericDeck(ABC, Generic[_CardT]):
     A deck of cards.
     :param cards: A custom list of `Card` objects. If omitted, a full deck is
         created using the `reset()` method.
+    :param lazy: If `True`, shuffling is deferred until cards are drawn.
+    :param seed: The seed of the deck's random number generator.
     """
     _card_type: Type[_CardT]
+    _prototype: Optional[Tuple[_CardT, ...]]
 
-    def __init__(self, cards: Optional[Sequence[_CardT]] = None) -> None:
+    def __init__(self, cards: Optional[Sequence[_CardT]] = None,
+                 lazy: bool = False, seed: Optional[T_Seed] = None) -> None:
         """
         Creates a new deck instance.
         :param cards: A custom list of `Card` objects. If omitted, a full deck
             is created using the `reset()` method.
+        :param lazy: If `True`, the deck is shuffled lazily: `shuffle()` only
+            marks the cards as unordered, and every draw picks a uniformly
+            random card among them. Reading the order of the cards (e.g., via
+            `get_cards()`) fixes the order of the remaining unordered cards.
+        :param seed: The seed of the deck's random number generator, e.g., an
+            integer or a `SeedSequence`. If omitted, the deck uses the global
+            generator of the `random` module.
+        """
+        self._lazy: bool = ...
+        self._pending: int = ...
+        self._rng: Any = ...
+        self._composition: Optional[Tuple[
+            Counter[Tuple[Optional[int], Optional[int]]],
+            Counter[Optional[int]],
+            Counter[Optional[int]],
+            Dict[Tuple[Optional[int], Optional[int], bool],
+                 Counter[Type[_CardT]]]]] = ...
+        self._cards: List[_CardT] = ...
+
+    @property
+    def cards(self) -> List[_CardT]:
+        """
+        The cards in the deck, from top to bottom. For a lazily shuffled deck,
+        accessing this property fixes the order of the unordered cards.
+        """
+
+    @cards.setter
+    def cards(self, cards: List[_CardT]) -> None: ...
+
+    def _realize(self) -> None:
+        """Fixes the order of the cards left unordered by a lazy shuffle."""
+
+    def _draw_pending(self) -> _CardT:
+        """
+        Draws a uniformly random card among the cards left unordered by a lazy
+        shuffle.
+        :return: The drawn card.
+        """
+
+    @classmethod
+    def _build_cards(cls) -> List[_CardT]:
+        """
+        Builds the canonical composition of the deck. By default, this is every
+        combination of suit and rank from the `Card` class, sorted. Subclasses
+        with a different composition override this method.
+        :return: The list of cards of a full deck.
+        """
+
+    @classmethod
+    def _get_prototype(cls) -> Tuple[_CardT, ...]:
+        """
+        Returns the prototype of the deck class, building it on first use.
+        :return: The canonical composition of the deck.
         """
-        self.cards: List[_CardT] = ...
 
     def reset(self) -> GenericDeck[_CardT]:
         """
-        Creates a full deck by iterating over every combination of suit and rank
-            from the `Card` class, then sorts the deck.
+        Restores the full deck by cloning the canonical composition of the deck
+            class. The composition is built and sorted only once per class.
         :return: The deck instance.
         """
 
+    def track_composition(self, enabled: bool = True) -> GenericDeck[_CardT]:
+        """
+        Enables or disables the composition index of the deck. While enabled,
+        the deck keeps the number of cards per rank, per suit, per kind (see
+        `GenericCard.kind_key()`), and per rank, suit, trump flag and class,
+        which is what card equality compares, up to date on every `add()`,
+        `remove()`, `draw()`, `clear()`, and `reset()`. Counting cards, ranks
+        and suits and checking whether the deck contains a card then run in
+        constant time. Cards must not be modified while they are in an
+        indexed deck, except for the suits that UNO wild cards call, which
+        keep their kind and update the suit counts, and the trump flags set
+        by `GenericGame.apply_trump()`, which rebuilds the index.
+        :param enabled: Whether the index is maintained.
+        :return: The deck instance.
+        """
+
+    def _update_composition(self, cards: Iterable[_CardT], sign: int) -> None:
+        """
+        Adds cards to or removes cards from the composition index.
+        :param cards: The cards to add or remove.
+        :param sign: `1` to add the cards or `-1` to remove them.
+        """
+
     def count(self, card: Union[_CardT, _RankT, _SuitT]) -> int:
         """
         Counts the number of occurrences of a specific card, rank, or
-        suit in the deck.
+        suit in the deck. Cards are counted by equality. If the composition
+        index is enabled, this runs in constant time.
         :param card: Either a card instance, a rank (as a `string`), or a suit
             (as a `string`).
         :return: The number of occurrences of the specified card, rank, or suit
@@ -232,19 +433,65 @@ class GenericDeck(ABC, Generic[_CardT]):
         :raise TypeError: If the given input is not a valid type.
         """
 
-    def sort(self, by: Literal["suit", "rank"] = "suit") -> GenericDeck[_CardT]:
+    def draw_probability(self, card: Union[_CardT, _RankT, _SuitT],
+                         n: int = 1, k: int = 1) -> float:
+        """
+        Computes the exact probability of drawing at least `k` cards matching
+        the given card, rank, or suit in the next `n` draws, assuming the order
+        of the deck is unknown. The result follows the hypergeometric
+        distribution over the deck's composition and is cached per
+        composition.
+        :param card: Either a card instance, a rank (as a `string`), or a suit
+            (as a `string`), matched as in `count()`.
+        :param n: The number of cards drawn.
+        :param k: The minimum number of matching cards.
+        :return: The probability as a float between 0 and 1.
+        :raise ValueError: If `n` is not between 0 and the number of cards in
+            the deck, `k` is negative, or the card is not a valid rank or suit.
+        :raise TypeError: If the given card is not a valid type.
+        """
+
+    def expected_draws(self, card: Union[_CardT, _RankT, _SuitT]) -> float:
+        """
+        Computes the expected number of draws until the first card matching
+        the given card, rank, or suit is drawn, assuming the order of the deck
+        is unknown.
+        :param card: Either a card instance, a rank (as a `string`), or a suit
+            (as a `string`), matched as in `count()`.
+        :return: The expected number of draws, including the matching one, or
+            `inf` if no card in the deck matches.
+        :raise ValueError: If the card is not a valid rank or suit.
+        :raise TypeError: If the given card is not a valid type.
+        """
+
+    def sort(self, by: Literal["suit", "rank"] = "suit",
+             trump: Optional[Union[_SuitT, int]] = None) -> GenericDeck[_CardT]:
         """
         Sorts and returns the deck.
         :param by: The attribute to sort by.
+        :param trump: A trump suit (name or index) whose cards sort like trump
+            cards. The cards themselves are not changed.
         :return: The sorted deck.
-        :raise ValueError: If the `by` parameter is not a valid attribute.
+        :raise ValueError: If the `by` parameter is not a valid attribute, or
+            the trump suit is invalid.
+        """
+
+    def set_seed(self, seed: Optional[T_Seed]) -> GenericDeck[_CardT]:
+        """
+        Replaces the deck's random number generator.
+        :param seed: The seed of the new generator, e.g., an integer or a
+            `SeedSequence`. If `None`, the global generator of the `random`
+            module is used.
+        :return: The deck instance.
         """
 
     def shuffle(self, seed: Optional[
         Union[int, float, str, bytes, bytearray]] = None) -> GenericDeck[
         _CardT]:
         """
-        Randomly shuffles the cards in the deck.
+        Randomly shuffles the cards in the deck. For a lazy deck, this runs in
+        constant time, and the cards are picked at random when they are drawn.
+        :param seed: The seed for the random number generator.
         :return: The deck instance.
         """
 
@@ -279,6 +526,34 @@ class GenericDeck(ABC, Generic[_CardT]):
         :return: The deck instance.
         """
 
+    def _kind_counts(self) -> Iterable[
+            Tuple[Tuple[Optional[int], Optional[int]], int]]:
+        """
+        Counts the cards of the deck by kind key, without realizing a lazy
+        order.
+        :return: `(kind key, count)` pairs. Kinds with a count of 0 may be
+            included.
+        """
+
+    def _count_equal(self, card: _CardT) -> int:
+        """
+        Counts the cards equal to the given card with the composition index:
+        the cards of the same rank, suit and trump flag whose class is the
+        card's class, a subclass or a base class of it. The index must be
+        enabled.
+        :param card: The card to count.
+        :return: The number of equal cards in the deck.
+        """
+
+    def _lacks(self, card: _CardT) -> bool:
+        """
+        Checks whether the composition index rules out that the deck contains
+        the given card.
+        :param card: The card to look for.
+        :return: `True` if the index is enabled and has no card equal to the
+            given card; otherwise, `False`.
+        """
+
     def remove(self, *cards: _CardT) -> GenericDeck[_CardT]:
         """
         The cards to be removed from the deck.
@@ -326,7 +601,14 @@ class GenericDeck(ABC, Generic[_CardT]):
     @overload
     def __ne__(self, other: object) -> bool: ...
 
-    def __copy__(self) -> GenericDeck[_CardT]: ...
+    def __copy__(self) -> GenericDeck[_CardT]:
+        """
+        Creates a copy of the deck with the same cards. The copy keeps the
+        lazily shuffled cards unrealized and gets a clone of the deck's random
+        number generator, so it draws the same cards as the original would.
+        An unseeded deck's copy shares the `random` module.
+        :return: The new deck.
+        """
 
     @overload
     def __getitem__(self, index: int) -> _CardT: ...
@@ -370,6 +652,15 @@ class GenericPlayer(ABC, Generic[_CardT]):
         :return: The player object.
         """
 
+    def _remove_from_hand(self, cards: Sequence[_CardT]) -> None:
+        """
+        Removes cards from the player's hand. If all cards involved are frozen,
+        they are removed in a single pass over the hand. Otherwise, the same
+        card object is removed if it is in the hand, and an equal card if not.
+        :param cards: The cards to remove.
+        :raise ValueError: If a card is not in the player's hand.
+        """
+
     def remove_cards(self, *cards: _CardT) -> GenericPlayer[_CardT]:
         """
         Remove one or more cards from the player's hand.
@@ -464,7 +755,12 @@ class GenericGame(ABC, Generic[_CardT]):
     :param hand_size: The size of each player's hand.
     :param starting_player_index: The index of the starting player.
     :param players: The players in the game.
+    :param seed: The root seed of the game's random number generators.
     """
+    EVENTS: Tuple[str, ...] = ...
+
+    rules: Optional[RuleTable[_CardT]] = ...
+    _listeners: Dict[str, Tuple[Callable[..., Any], ...]] = ...
 
     def __init__(self,
                  card_type: Type[_CardT],
@@ -475,7 +771,8 @@ class GenericGame(ABC, Generic[_CardT]):
                  hand_size: int = 4,
                  starting_player_index: int = 0,
                  do_not_shuffle: bool = False,
-                 *players: GenericPlayer[_CardT]) -> None:
+                 *players: GenericPlayer[_CardT],
+                 seed: Optional[Union[int, SeedSequence]] = None) -> None:
         """
         Constructor for the GenericGame class.
         :param card_type: The type of card to use.
@@ -491,8 +788,15 @@ class GenericGame(ABC, Generic[_CardT]):
             to 0.
         :param do_not_shuffle: If True, the deck will not be shuffled.
         :param players: The players in the game.
+        :param seed: The root seed of the game, either an integer or a node of
+            a `SeedSequence`. The game derives independent generators for
+            itself and its draw pile from it, so games created from the same
+            seed are reproducible. If omitted, the global generator of the
+            `random` module is used.
         :raises ValueError: If trump is not None and not in card_type.SUITS.
         """
+        self.seed_sequence: Optional[SeedSequence] = ...
+        self.rng: Any = ...
         self._card_type: Type[_CardT] = ...
         self._deck_type: Type[GenericDeck[_CardT]] = ...
 
@@ -500,10 +804,16 @@ class GenericGame(ABC, Generic[_CardT]):
         self.discard_pile: GenericDeck[_CardT] = ...
 
         self.trump: Optional[_SuitT] = ...
+        self._trump_suit: Optional[int] = ...
+        self._trump_applied: bool = ...
         self.hand_size: int = ...
         self.players: List[GenericPlayer[_CardT]] = ...
         self.current_player_index: int = ...
         self.direction: Literal[1, -1] = ...
+        self.turn_order: Optional[TurnOrder[GenericPlayer[_CardT]]] = ...
+        self._card_hash: Optional[int] = ...
+        self._seats: Dict[int, Tuple[GenericPlayer[_CardT],
+                                     Optional[int]]] = ...
 
     @abstractmethod
     def check_valid_play(self, card1: _CardT, card2: _CardT) -> bool:
@@ -525,6 +835,126 @@ class GenericGame(ABC, Generic[_CardT]):
     def end_game(self) -> Any:
         """End the game and determine the winner."""
 
+    def subscribe(self, event: str,
+                  listener: Callable[..., Any]) -> GenericGame[_CardT]:
+        """
+        Registers a listener for a game event. Listeners are called with the
+        game followed by the event's arguments:
+
+        - "card_played": the player and the card, before the card's effect,
+        - "cards_drawn": the player and the list of cards drawn or dealt,
+        - "pile_reshuffled": no arguments,
+        - "direction_reversed": the new direction,
+        - "trump_changed": the new trump suit,
+        - "game_started": no arguments, once the cards are dealt and any
+          starter card is turned up without playing it,
+        - "game_ended": the winner, or None.
+
+        Games without listeners skip dispatch entirely, so events cost
+        nothing unless somebody subscribes.
+        :param event: The name of the event, one of `EVENTS`.
+        :param listener: The callable to register.
+        :return: The game instance.
+        :raise ValueError: If the event is unknown.
+        """
+
+    def unsubscribe(self, event: str,
+                    listener: Callable[..., Any]) -> GenericGame[_CardT]:
+        """
+        Removes a listener registered with `subscribe()`.
+        :param event: The name of the event.
+        :param listener: The listener to remove.
+        :return: The game instance.
+        :raise ValueError: If the listener is not subscribed to the event.
+        """
+
+    def _emit(self, event: str, *args: Any) -> None:
+        """
+        Calls the listeners of an event. Call sites check `_listeners` first
+        to skip the call when nobody listens.
+        :param event: The name of the event.
+        :param args: The arguments of the event.
+        """
+
+    def rule_state(self) -> int:
+        """
+        Returns the state flags passed to the compiled `rules` as a bitmask.
+        Subclasses that declare `rules` with state flags override this.
+        :return: The state bitmask.
+        """
+
+    def _hash_state(self) -> Tuple[Tuple[Any, ...], ...]:
+        """
+        Returns the features besides card locations that make up the Zobrist
+        hash. Subclasses with more state extend this.
+        :return: The features, each a tuple of a name and values.
+        """
+
+    def _hash_cards(self, location: Optional[Union[int, str]],
+                    cards: Iterable[_CardT], sign: Literal[1, -1] = 1) -> None:
+        """
+        Adds cards to, or removes them from, a location in the kept card hash.
+        Does nothing while the card hash is not computed or for no location.
+        :param location: The seat index of a hand, "draw" or "discard".
+        :param cards: The cards.
+        :param sign: 1 to add the cards, -1 to remove them.
+        """
+
+    def _hash_pile(self, location: str, pile: Any) -> None:
+        """
+        Adds the cards of a pile to the card hash that is being computed. The
+        cards are counted by kind, so the order of the pile is not realized.
+        :param location: "draw" or "discard".
+        :param pile: A deck or a `Shoe`.
+        """
+
+    def _get_seat(self, player: GenericPlayer[_CardT]) -> Optional[int]:
+        """
+        Looks up the seat of a player by identity in O(1). The lookup table
+        is rebuilt with the card hash and whenever it does not know the
+        player.
+        :param player: The player.
+        :return: The seat index, or None if the player has no seat.
+        """
+
+    def _hash_hand(self, player: GenericPlayer[_CardT],
+                   cards: Iterable[_CardT], sign: Literal[1, -1] = 1) -> None:
+        """
+        Adds cards to, or removes them from, a player's hand in the kept card
+        hash. Players without a seat in the game are not hashed.
+        :param player: The player.
+        :param cards: The cards.
+        :param sign: 1 to add the cards, -1 to remove them.
+        """
+
+    def zobrist_hash(self) -> int:
+        """
+        Returns a 64-bit Zobrist hash of the game state: the kinds of cards in
+        each hand, the draw pile and the discard pile, the top card, the
+        current player, the direction and the trump suit. The order of the
+        piles is not hashed. The card part is computed once and then updated
+        by the methods that move cards, so this is O(1).
+        :return: The hash.
+        """
+
+    def rehash(self) -> GenericGame[_CardT]:
+        """
+        Drops the kept card hash so that the next `zobrist_hash` computes it
+        again. Call this after moving cards without the game's methods.
+        :return: The game object.
+        """
+
+    def get_playable_cards(
+            self, player: Optional[GenericPlayer[_CardT]] = None
+    ) -> List[_CardT]:
+        """
+        Returns the cards in a player's hand that can be played on top of the
+        discard pile. Uses the compiled `rules` if the game declares them, and
+        `check_valid_play()` otherwise.
+        :param player: The player. Defaults to the current player.
+        :return: The playable cards, in hand order.
+        """
+
     def discard_cards(self, *cards: _CardT) -> GenericGame[_CardT]:
         """
         Discard one or more cards from the player's hand.
@@ -550,6 +980,17 @@ class GenericGame(ABC, Generic[_CardT]):
         :return: The game object.
         """
 
+    def _draw_to(self, player: GenericPlayer[_CardT],
+                 n: int) -> List[_CardT]:
+        """
+        Moves cards from the draw pile into a player's hand and emits a
+        "cards_drawn" event.
+        :param player: The player receiving the cards.
+        :param n: The number of cards.
+        :return: The cards.
+        :raise ValueError: If the draw pile holds fewer than `n` cards.
+        """
+
     def draw_cards(self, player: Optional[GenericPlayer[_CardT]] = None,
                    n: int = 1) -> List[_CardT]:
         """
@@ -574,6 +1015,22 @@ class GenericGame(ABC, Generic[_CardT]):
         :return: The game object.
         """
 
+    def use_turn_order(self, enabled: bool = True) -> GenericGame[_CardT]:
+        """
+        Enables or disables a `TurnOrder` ring for the turn handling. While
+        enabled, `next_player`, `set_current_player`, `reverse_direction`,
+        `add_players` and `remove_players` go through the ring and keep
+        `current_player_index` in sync with it. Moving to the next player
+        and eliminating players then take constant time, which suits games
+        with many players and frequent eliminations. The ring holds the
+        seating order: a removed player's place in `players` is taken by the
+        last player in the list. Turns must then be changed through these
+        methods, not by setting `current_player_index`.
+        :param enabled: Whether to use a turn order. Enabling it seats the
+            current players, starting with the current player's turn.
+        :return: The game object.
+        """
+
     def add_players(self, *players: GenericPlayer[_CardT]) -> GenericGame[
         _CardT]:
         """
@@ -585,9 +1042,14 @@ class GenericGame(ABC, Generic[_CardT]):
     def remove_players(self, *players: GenericPlayer[_CardT]) -> GenericGame[
         _CardT]:
         """
-        Remove one or multiple players from the game.
+        Remove one or multiple players from the game. The current player keeps
+        the turn. If the current player is removed, the turn passes to the
+        player who would have played next. For games with many players and
+        frequent eliminations, see `use_turn_order`, with which the last player
+        in `players` takes the place of a removed player.
         :param players: The players to remove.
         :return: The game object.
+        :raise ValueError: If a player is not in the game.
         """
 
     def deal(self, num_cards: int = 1, *players: GenericPlayer[_CardT]) -> \
@@ -636,15 +1098,52 @@ class GenericGame(ABC, Generic[_CardT]):
             self._card_type.SUITS.
         """
 
+    def is_trump(self, card: _CardT) -> bool:
+        """
+        Checks if a card is a trump card in this game: either it is of the
+        game's trump suit, or it is flagged as trump itself.
+        :param card: The card to check.
+        :return: True if the card is a trump card, False otherwise.
+        """
+
+    def card_key(self, card: _CardT,
+                 by: Literal["suit", "rank"] = "suit") -> Tuple[Any, ...]:
+        """
+        Returns the sort key of a card under the game's trump suit. Keys
+        compare like the cards would if the cards of the trump suit were
+        flagged as trump.
+        :param card: The card.
+        :param by: The attribute to sort by, as in `GenericDeck.sort()`.
+        :return: The key.
+        :raise ValueError: If the `by` parameter is not a valid attribute.
+        """
+
+    def sort_cards(self, cards: Iterable[_CardT],
+                   by: Literal["suit", "rank"] = "suit") -> List[_CardT]:
+        """
+        Sorts cards under the game's trump suit, without changing them.
+        :param cards: The cards to sort.
+        :param by: The attribute to sort by, as in `GenericDeck.sort()`.
+        :return: A new sorted list of the cards.
+        :raise ValueError: If the `by` parameter is not a valid attribute.
+        """
+
     def apply_trump(self) -> GenericGame[_CardT]:
         """
-        Apply the trump suit to all cards in the deck.
+        Flag every card in the draw pile, the discard pile and the players'
+        hands as trump if it is of the trump suit. The game itself does not
+        need the flags: `is_trump()`, `card_key()` and `sort_cards()` consult
+        the trump suit directly, so this is only for code that reads the
+        `trump` attribute of cards. The composition indexes of the piles are
+        rebuilt, since they compare the flags.
         :return: The game object.
         """
 
     def change_trump(self, suit: Optional[_SuitT]) -> GenericGame[_CardT]:
         """
-        Change the trump suit for the game.
+        Change the trump suit for the game. The cards are not changed, so
+        this takes constant time, unless `apply_trump()` flagged them before:
+        then the flags are applied again for the new trump suit.
         :param suit: The new trump suit to set. Must be a valid suit or None to
             unset the trump suit.
         :return: The game object.
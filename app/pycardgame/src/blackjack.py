@@ -0,0 +1,377 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from math import sqrt
+
+from .base import GenericGame, GenericPlayer
+from .poker import PokerCard, PokerDeck
+from .seeding import make_rng
+from .shoe import Shoe
+
+# The value of every rank, with aces counted as 11
+_VALUES = (2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11)
+_ACTIONS = "HSDd"
+
+# Basic strategy for a multi-deck shoe without splits or surrender, for the
+# dealer's upcards 2 to 10 and Ace. "H" hits, "S" stands, "D" doubles if
+# allowed and hits otherwise, and "d" doubles if allowed and stands otherwise.
+BASIC_STRATEGY = {
+    "hard": {
+        **{total: "HHHHHHHHHH" for total in range(4, 9)},
+        9: "HDDDDHHHHH",
+        10: "DDDDDDDDHH",
+        11: "DDDDDDDDDH",
+        12: "HHSSSHHHHH",
+        **{total: "SSSSSHHHHH" for total in range(13, 17)},
+        **{total: "SSSSSSSSSS" for total in range(17, 22)},
+    },
+    "soft": {
+        12: "HHHHHHHHHH",
+        13: "HHHDDHHHHH",
+        14: "HHHDDHHHHH",
+        15: "HHDDDHHHHH",
+        16: "HHDDDHHHHH",
+        17: "HDDDDHHHHH",
+        18: "SddddSSHHH",
+        **{total: "SSSSSSSSSS" for total in range(19, 22)},
+    },
+}
+
+
+def hand_total(cards):
+    total = 0
+    aces = 0
+    for card in cards:
+        value = _VALUES[card.rank]
+        total += value
+        if value == 11:
+            aces += 1
+    while total > 21 and aces:
+        total -= 10
+        aces -= 1
+    return total, aces > 0
+
+
+def _compile_strategy(strategy):
+    # Flat table indexed by (soft * 22 + total) * 12 + upcard value
+    table = [0] * (2 * 22 * 12)
+    for soft, rows in enumerate((strategy["hard"], strategy["soft"])):
+        for total in range(22):
+            row = rows.get(total, "H" * 10 if total < 21 else "S" * 10)
+            if len(row) != 10 or any(a not in _ACTIONS for a in row):
+                raise ValueError(f"Invalid strategy row for total {total}: "
+                                 f"{row!r}")
+            for upcard, action in zip(range(2, 12), row):
+                table[(soft * 22 + total) * 12 + upcard] = \
+                    _ACTIONS.index(action)
+    return table
+
+
+class BlackjackPlayer(GenericPlayer[PokerCard]):
+    __slots__ = ()
+
+    def __init__(self, name, hand=None, score=0):
+        super().__init__(name, hand, score)
+
+    def get_total(self):
+        return hand_total(self.hand)[0]
+
+    def is_soft(self):
+        return hand_total(self.hand)[1]
+
+    def is_blackjack(self):
+        return len(self.hand) == 2 and self.get_total() == 21
+
+    def is_bust(self):
+        return self.get_total() > 21
+
+
+class BlackjackGame(GenericGame[PokerCard]):
+    def __init__(self, *players, decks=6, penetration=0.75, hit_soft_17=False,
+                 blackjack_pays=1.5, seed=None):
+        if not 0 < penetration <= 1:
+            raise ValueError(f"Invalid penetration: {penetration} (must be "
+                             f"greater than 0 and at most 1)")
+        super().__init__(PokerCard, PokerDeck, Shoe(PokerDeck, decks), None,
+                         None, 2, 0, False, *players, seed=seed)
+        self.dealer = BlackjackPlayer("Dealer")
+        self.penetration = penetration
+        self.hit_soft_17 = hit_soft_17
+        self.blackjack_pays = blackjack_pays
+        # The shoe is reshuffled before a round once fewer cards are left
+        self.cut_card = int(decks * 52 * (1 - penetration))
+        self.stakes = [1] * len(self.players)
+        self.results = None
+        self.round_over = True
+
+    def check_valid_play(self, card1, card2=None):
+        # Cards are never played onto the discard pile in blackjack
+        return False
+
+    def _hash_state(self):
+        # The dealer has no seat, so its hand is hashed with the state
+        return super()._hash_state() + (
+            ("dealer",) + tuple(card.kind_key() for card in self.dealer.hand),)
+
+    def reshuffle_discard_pile(self):
+        if len(self.draw_pile) == 0 or len(self.draw_pile) < self.cut_card:
+            self.draw_pile.add(*self.discard_pile.get_cards())
+            self.discard_pile.clear()
+            self._card_hash = None
+            if self._listeners:
+                self._emit("pile_reshuffled")
+        return self
+
+    def _hit(self, player):
+        if len(self.draw_pile) == 0:
+            self.reshuffle_discard_pile()
+        return self._draw_to(player, 1)[0]
+
+    def start_game(self):
+        if not self.round_over:
+            raise RuntimeError("The current round has not ended yet")
+        # Hands left over from a round that was not ended are collected first
+        self._collect_hands()
+        self.reshuffle_discard_pile()
+        self.stakes = [1] * len(self.players)
+        self.results = None
+        self.round_over = False
+        for _ in range(2):
+            for player in self.players + [self.dealer]:
+                self._hit(player)
+        self.current_player_index = -1
+        if self._listeners:
+            self._emit("game_started")
+        if self.dealer.is_blackjack():
+            # The dealer checks the hole card, and the round ends at once
+            self._settle()
+        else:
+            self._advance()
+        return self
+
+    def _advance(self):
+        index = self.current_player_index + 1
+        while (index < len(self.players) and
+               self.players[index].is_blackjack()):
+            index += 1
+        self.current_player_index = index
+        if index == len(self.players):
+            self.play_dealer()
+
+    def _check_turn(self, player):
+        if self.round_over:
+            raise RuntimeError("No round in progress")
+        if player is None:
+            player = self.get_current_player()
+        elif player is not self.get_current_player():
+            raise ValueError(f"It is not {player.name}'s turn")
+        return player
+
+    def get_dealer_upcard(self):
+        return self.dealer.hand[0] if self.dealer.hand else None
+
+    def hit(self, player=None):
+        player = self._check_turn(player)
+        card = self._hit(player)
+        if player.get_total() >= 21:
+            self._advance()
+        return card
+
+    def stand(self, player=None):
+        self._check_turn(player)
+        self._advance()
+        return self
+
+    def double(self, player=None):
+        player = self._check_turn(player)
+        if len(player.hand) != 2:
+            raise ValueError("Can only double down on the first two cards")
+        self.stakes[self.current_player_index] *= 2
+        card = self._hit(player)
+        self._advance()
+        return card
+
+    def play_dealer(self):
+        dealer = self.dealer
+        # The dealer only draws if a player is still in the round
+        if any(not player.is_bust() for player in self.players):
+            while True:
+                total, soft = hand_total(dealer.hand)
+                if total > 17 or total == 17 and not (
+                        soft and self.hit_soft_17):
+                    break
+                self._hit(dealer)
+        self._settle()
+        return self
+
+    def _settle(self):
+        dealer_total = self.dealer.get_total()
+        dealer_blackjack = self.dealer.is_blackjack()
+        results = []
+        for player, stake in zip(self.players, self.stakes):
+            total = player.get_total()
+            if player.is_blackjack():
+                result = 0 if dealer_blackjack else self.blackjack_pays
+            elif dealer_blackjack or total > 21:
+                result = -stake
+            elif dealer_total > 21 or total > dealer_total:
+                result = stake
+            elif total < dealer_total:
+                result = -stake
+            else:
+                result = 0
+            player.score += result
+            results.append(result)
+        self.results = results
+        self.round_over = True
+        self.current_player_index = 0
+
+    def _collect_hands(self):
+        collected = False
+        for player in self.players + [self.dealer]:
+            if player.hand:
+                self.discard_pile.add(*player.hand)
+                player.hand.clear()
+                collected = True
+        if collected:
+            self.rehash()
+        return collected
+
+    def end_game(self):
+        self._collect_hands()
+        if self._listeners:
+            self._emit("game_ended", None)
+        return self.results
+
+    def __str__(self):
+        return (f"Blackjack game with {len(self.players)} players and "
+                f"{len(self.draw_pile)} cards in the shoe")
+
+
+def _refill(shoe, start, rng):
+    # The shoe ran out during a round: the discards of the previous rounds
+    # are reshuffled behind the cards of the current round
+    discards = shoe[:start]
+    rng.shuffle(discards)
+    return shoe[start:] + discards
+
+
+def simulate_blackjack(rounds, strategy=None, decks=6, penetration=0.75,
+                       hit_soft_17=False, blackjack_pays=1.5, seed=None):
+    if rounds < 1:
+        raise ValueError(f"Invalid number of rounds: {rounds}")
+    if not 0 < penetration <= 1:
+        raise ValueError(f"Invalid penetration: {penetration} (must be "
+                         f"greater than 0 and at most 1)")
+    table = _compile_strategy(strategy or BASIC_STRATEGY)
+    rng = make_rng(seed)
+    shoe = [_VALUES[card.rank] for card in PokerDeck._get_prototype()] * decks
+    size = len(shoe)
+    # Same as BlackjackGame: reshuffle once fewer cards than this are left
+    cut = size - int(size * (1 - penetration))
+    rng.shuffle(shoe)
+    position = 0
+    total_return = 0.0
+    total_squares = 0.0
+
+    for _ in range(rounds):
+        if position > cut:
+            rng.shuffle(shoe)
+            position = 0
+        elif position > size - 4:
+            shoe = _refill(shoe, position, rng)
+            position = 0
+        start = position
+        card1, up, card2, hole = shoe[position:position + 4]
+        position += 4
+
+        player = card1 + card2
+        player_aces = (card1 == 11) + (card2 == 11)
+        if player > 21:
+            player -= 10
+            player_aces -= 1
+        dealer = up + hole
+        dealer_aces = (up == 11) + (hole == 11)
+        if dealer > 21:
+            dealer -= 10
+            dealer_aces -= 1
+
+        if dealer == 21 or player == 21:
+            if player != 21:
+                result = -1.0
+            elif dealer != 21:
+                result = blackjack_pays
+            else:
+                result = 0.0
+            total_return += result
+            total_squares += result * result
+            continue
+
+        stake = 1.0
+        first = True
+        while player < 21:
+            action = table[((player_aces > 0) * 22 + player) * 12 + up]
+            # Stand, or double down without being allowed to do so
+            if action == 1 or action == 3 and not first:
+                break
+            if position == size:
+                shoe = _refill(shoe, start, rng)
+                position -= start
+                start = 0
+            card = shoe[position]
+            position += 1
+            player += card
+            if card == 11:
+                player_aces += 1
+            if player > 21 and player_aces:
+                player -= 10
+                player_aces -= 1
+            if action >= 2 and first:
+                stake = 2.0
+                break
+            first = False
+
+        if player > 21:
+            result = -stake
+        else:
+            while dealer < 17 or (dealer == 17 and dealer_aces and
+                                  hit_soft_17):
+                if position == size:
+                    shoe = _refill(shoe, start, rng)
+                    position -= start
+                    start = 0
+                card = shoe[position]
+                position += 1
+                dealer += card
+                if card == 11:
+                    dealer_aces += 1
+                if dealer > 21 and dealer_aces:
+                    dealer -= 10
+                    dealer_aces -= 1
+            if dealer > 21 or player > dealer:
+                result = stake
+            elif player < dealer:
+                result = -stake
+            else:
+                result = 0.0
+        total_return += result
+        total_squares += result * result
+
+    mean = total_return / rounds
+    variance = max(total_squares / rounds - mean * mean, 0.0)
+    return mean, sqrt(variance / rounds)
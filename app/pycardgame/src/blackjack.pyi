@@ -0,0 +1,297 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .base import GenericGame, GenericPlayer
+from .poker import PokerCard
+from .seeding import SeedSequence, T_Seed
+
+_VALUES: Tuple[int, ...]
+_ACTIONS: str
+
+BASIC_STRATEGY: Dict[str, Dict[int, str]]
+
+
+def hand_total(cards: Iterable[PokerCard]) -> Tuple[int, bool]:
+    """
+    Computes the total of a blackjack hand. Number cards count their rank,
+    face cards count 10, and aces count 11 unless that busts the hand, in which
+    case they count 1.
+    :param cards: The cards of the hand.
+    :return: The total and whether the hand is soft, i.e., whether an ace
+        still counts 11.
+    """
+
+
+def _compile_strategy(strategy: Dict[str, Dict[int, str]]) -> List[int]:
+    """
+    Compiles a strategy into a flat lookup table.
+    :param strategy: The strategy in the format of `BASIC_STRATEGY`. Missing
+        totals are hit below 21 and stood on at 21.
+    :return: The index of the action for every combination of softness, total
+        and dealer upcard value.
+    :raise ValueError: If a row of the strategy is invalid.
+    """
+
+
+class BlackjackPlayer(GenericPlayer[PokerCard]):
+    """
+    A player in a blackjack game. The score of a player is the total amount
+    won over all rounds, in units of the initial bet.
+    :param name: The name of the player.
+    :param hand: The cards in the player's hand.
+    :param score: The initial score of the player.
+    """
+    __slots__ = ()
+
+    def __init__(self, name: str, hand: Optional[List[PokerCard]] = None,
+                 score: float = 0) -> None:
+        """
+        Creates a new blackjack player.
+        :param name: The name of the player.
+        :param hand: The cards in the player's hand.
+        :param score: The initial score of the player.
+        """
+
+    def get_total(self) -> int:
+        """
+        Returns the total of the player's hand.
+        :return: The total, see `hand_total()`.
+        """
+
+    def is_soft(self) -> bool:
+        """
+        Checks if an ace in the player's hand still counts 11.
+        :return: True if the hand is soft, False otherwise.
+        """
+
+    def is_blackjack(self) -> bool:
+        """
+        Checks if the player's hand is a blackjack, i.e., 21 with two cards.
+        :return: True if the hand is a blackjack, False otherwise.
+        """
+
+    def is_bust(self) -> bool:
+        """
+        Checks if the player's hand is over 21.
+        :return: True if the hand is bust, False otherwise.
+        """
+
+
+class BlackjackGame(GenericGame[PokerCard]):
+    """
+    A blackjack game against the dealer, played from a multi-deck `Shoe`.
+    Every game of blackjack is a series of rounds: `start_game()` deals a
+    round, the players act in order with `hit()`, `stand()` and `double()`,
+    the dealer plays once the last player is done, and `end_game()` moves the
+    cards of the round to the discard pile. Splitting, surrender and insurance
+    are not supported.
+
+    Cards drawn from the shoe go to the discard pile at the end of a round.
+    The shoe is refilled from the discard pile before a round once the
+    penetration is reached, and during a round if it runs out.
+    """
+
+    def __init__(self, *players: GenericPlayer[PokerCard], decks: int = 6,
+                 penetration: float = 0.75, hit_soft_17: bool = False,
+                 blackjack_pays: float = 1.5,
+                 seed: Optional[Union[int, SeedSequence]] = None) -> None:
+        """
+        Creates a new blackjack game.
+        :param players: The players, in the order they act.
+        :param decks: The number of decks in the shoe.
+        :param penetration: The share of the shoe that is dealt before the
+            discards are shuffled back in.
+        :param hit_soft_17: Whether the dealer hits a soft 17.
+        :param blackjack_pays: The payout of a player's blackjack, per unit of
+            the initial bet.
+        :param seed: The root seed of the game's random number generators.
+        :raise ValueError: If the penetration is not greater than 0 and at
+            most 1.
+        """
+        self.dealer: BlackjackPlayer = ...
+        self.penetration: float = ...
+        self.hit_soft_17: bool = ...
+        self.blackjack_pays: float = ...
+        self.cut_card: int = ...
+        self.stakes: List[float] = ...
+        self.results: Optional[List[float]] = ...
+        self.round_over: bool = ...
+
+    def check_valid_play(self, card1: PokerCard,
+                         card2: Optional[PokerCard] = None) -> bool:
+        """
+        Cards are never played onto the discard pile in blackjack.
+        :return: False.
+        """
+
+    def _hash_state(self) -> Tuple[Tuple[Any, ...], ...]:
+        """
+        Adds the dealer's hand to the hashed state.
+        :return: The features, each a tuple of a name and values.
+        """
+
+    def reshuffle_discard_pile(self) -> BlackjackGame:
+        """
+        Shuffles the discard pile back into the shoe if the shoe is empty or
+        fewer cards than the cut card are left.
+        :return: The game instance (for method chaining).
+        """
+
+    def _hit(self, player: GenericPlayer[PokerCard]) -> PokerCard:
+        """
+        Deals one card to a player, refilling the shoe if it is empty.
+        :param player: The player or the dealer.
+        :return: The dealt card.
+        """
+
+    def start_game(self) -> BlackjackGame:
+        """
+        Starts a new round: moves any hands left from the previous round to
+        the discard pile, resets the stakes and deals two cards to every
+        player and the dealer. If the dealer has a blackjack, the round is
+        settled at once. Players with a blackjack do not act.
+        :return: The game instance (for method chaining).
+        :raise RuntimeError: If the previous round has not ended yet.
+        """
+
+    def _advance(self) -> None:
+        """
+        Moves on to the next player who acts, or lets the dealer play after
+        the last one.
+        """
+
+    def _check_turn(
+            self, player: Optional[GenericPlayer[PokerCard]]
+    ) -> GenericPlayer[PokerCard]:
+        """
+        Checks that it is the given player's turn.
+        :param player: The player, or None for the current player.
+        :return: The player whose turn it is.
+        :raise RuntimeError: If no round is in progress.
+        :raise ValueError: If it is not the given player's turn.
+        """
+
+    def get_dealer_upcard(self) -> Optional[PokerCard]:
+        """
+        Returns the dealer's face-up card.
+        :return: The first card of the dealer, or None if no cards are dealt.
+        """
+
+    def hit(self, player: Optional[GenericPlayer[PokerCard]] = None
+            ) -> PokerCard:
+        """
+        Deals a card to the current player. The player's turn ends once the
+        total reaches 21 or more.
+        :param player: The current player. Default is the current player.
+        :return: The dealt card.
+        :raise RuntimeError: If no round is in progress.
+        :raise ValueError: If it is not the given player's turn.
+        """
+
+    def stand(self, player: Optional[GenericPlayer[PokerCard]] = None
+              ) -> BlackjackGame:
+        """
+        Ends the current player's turn.
+        :param player: The current player. Default is the current player.
+        :return: The game instance (for method chaining).
+        :raise RuntimeError: If no round is in progress.
+        :raise ValueError: If it is not the given player's turn.
+        """
+
+    def double(self, player: Optional[GenericPlayer[PokerCard]] = None
+               ) -> PokerCard:
+        """
+        Doubles the current player's stake, deals exactly one more card and
+        ends the player's turn.
+        :param player: The current player. Default is the current player.
+        :return: The dealt card.
+        :raise RuntimeError: If no round is in progress.
+        :raise ValueError: If it is not the given player's turn, or the player
+            has more than two cards.
+        """
+
+    def play_dealer(self) -> BlackjackGame:
+        """
+        Plays the dealer's hand and settles the round. The dealer draws to 17
+        and hits a soft 17 only if `hit_soft_17` is set. If every player is
+        bust, the dealer does not draw.
+        :return: The game instance (for method chaining).
+        """
+
+    def _settle(self) -> None:
+        """
+        Computes the result of every player, adds it to their score, and
+        ends the round.
+        """
+
+    def _collect_hands(self) -> bool:
+        """
+        Moves the cards of every hand, including the dealer's, to the discard
+        pile.
+        :return: Whether any cards were collected.
+        """
+
+    def end_game(self) -> Optional[List[float]]:
+        """
+        Ends the round and moves the cards of every hand to the discard pile.
+        :return: The result of every player in the round, in units of the
+            initial bet, or None if the round was not settled.
+        """
+
+    def __str__(self) -> str: ...
+
+
+def _refill(shoe: List[int], start: int, rng: random.Random) -> List[int]:
+    """
+    Refills a simulated shoe that ran out during a round.
+    :param shoe: The card values of the shoe.
+    :param start: The position of the first card of the current round.
+    :return: The cards of the current round, followed by the reshuffled cards
+        of the previous rounds.
+    """
+
+
+def simulate_blackjack(rounds: int,
+                       strategy: Optional[Dict[str, Dict[int, str]]] = None,
+                       decks: int = 6, penetration: float = 0.75,
+                       hit_soft_17: bool = False, blackjack_pays: float = 1.5,
+                       seed: Optional[T_Seed] = None) -> Tuple[float, float]:
+    """
+    Simulates rounds of a single player against the dealer under the rules of
+    `BlackjackGame`, to estimate the player's expected return. Instead of
+    card objects, the simulation works on a shuffled list of card values, and
+    the player's decisions are lookups in a compiled strategy table, so a
+    round costs a few microseconds.
+    :param rounds: The number of rounds to play.
+    :param strategy: The player's strategy in the format of `BASIC_STRATEGY`:
+        one row of actions per total, for the dealer's upcards 2 to 10 and
+        Ace. Default is `BASIC_STRATEGY`.
+    :param decks: The number of decks in the shoe.
+    :param penetration: The share of the shoe that is dealt before it is
+        reshuffled.
+    :param hit_soft_17: Whether the dealer hits a soft 17.
+    :param blackjack_pays: The payout of a player's blackjack.
+    :param seed: The seed of the simulation's random number generator.
+    :return: The mean return per round, in units of the initial bet (the
+        negative house edge), and its standard error.
+    :raise ValueError: If `rounds` is less than 1, the penetration is invalid,
+        or the strategy is invalid.
+    """
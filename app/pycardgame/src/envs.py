@@ -0,0 +1,369 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import random
+from array import array
+
+from .agents import CALLABLE_SUITS, RandomAgent, Table
+from .presets import UnoCard, UnoDeck, UnoGame, UnoPlayer
+from .seeding import SeedSequence
+
+_N_COLORS = len(CALLABLE_SUITS)
+_N_RANKS = len(UnoCard.RANKS)
+_N_SUITS = len(UnoCard.SUITS)
+_FIRST_WILD = UnoCard.RANKS.index("Wild")
+_N_CARDS = len(UnoDeck._get_prototype())
+
+_N_COLORED_KINDS = _FIRST_WILD * _N_COLORS
+
+N_CARD_KINDS = _N_COLORED_KINDS + (_N_RANKS - _FIRST_WILD)
+N_ACTIONS = _N_COLORED_KINDS + (_N_RANKS - _FIRST_WILD) * _N_COLORS + 1
+DRAW_ACTION = N_ACTIONS - 1
+
+
+def _card_kind(card):
+    if card.rank >= _FIRST_WILD:
+        return _N_COLORED_KINDS + card.rank - _FIRST_WILD
+    return card.rank * _N_COLORS + card.suit
+
+
+def _card_action(card):
+    # Wild cards take one action per suit that can be called
+    if card.rank >= _FIRST_WILD:
+        return _N_COLORED_KINDS + (card.rank - _FIRST_WILD) * _N_COLORS
+    return card.rank * _N_COLORS + card.suit
+
+
+def observation_size(n_players):
+    return ObservationEncoder(n_players).size
+
+
+class ObservationEncoder:
+    __slots__ = ("n_players", "size", "top_rank", "top_suit", "draw_count",
+                 "direction", "opponents", "discard", "_zeros")
+
+    def __init__(self, n_players):
+        if n_players < 2:
+            raise ValueError(f"Invalid number of players: {n_players}")
+        self.n_players = n_players
+        # The hand counts come first, at offset 0
+        self.top_rank = N_CARD_KINDS
+        self.top_suit = self.top_rank + _N_RANKS
+        self.draw_count = self.top_suit + _N_SUITS
+        self.direction = self.draw_count + 1
+        self.opponents = self.direction + 1
+        self.discard = self.opponents + n_players - 1
+        self.size = self.discard + N_CARD_KINDS
+        self._zeros = memoryview(array("f", bytes(4 * self.size)))
+
+    def _write(self, game, player, buf, base):
+        buf[base:base + self.size] = self._zeros
+        wild = base + _N_COLORED_KINDS - _FIRST_WILD
+        for card in player.hand:
+            rank = card.rank
+            if rank >= _FIRST_WILD:
+                buf[wild + rank] += 1
+            else:
+                buf[base + rank * _N_COLORS + card.suit] += 1
+
+        top_card = game.get_top_card()
+        if top_card is not None:
+            buf[base + self.top_rank + top_card.rank] = 1.0
+            buf[base + self.top_suit + top_card.suit] = 1.0
+        buf[base + self.draw_count] = game.draw_count
+        buf[base + self.direction] = game.direction
+
+        # Opponents in turn order, starting with the next player
+        players = game.players
+        n_players = len(players)
+        if n_players != self.n_players:
+            raise ValueError(f"Expected {self.n_players} players, got "
+                             f"{n_players}")
+        seat = players.index(player)
+        direction = game.direction
+        offset = base + self.opponents - 1
+        for i in range(1, n_players):
+            buf[offset + i] = len(players[(seat + i * direction) % n_players])
+
+        discard = base + self.discard
+        composition = game.discard_pile._composition
+        if composition is not None:
+            # The composition index saves a pass over the whole pile. Wild
+            # cards are counted by rank, since their suit may have been called
+            wild = discard + _N_COLORED_KINDS - _FIRST_WILD
+            for (rank, suit), n in composition[0].items():
+                if rank >= _FIRST_WILD:
+                    buf[wild + rank] += n
+                elif n:
+                    buf[discard + rank * _N_COLORS + suit] = n
+        else:
+            for card in game.discard_pile._cards:
+                buf[discard + _card_kind(card)] += 1
+
+    def encode(self, game, player, out=None):
+        if out is None:
+            out = array("f", bytes(4 * self.size))
+        buf = memoryview(out).cast("B").cast("f")
+        if len(buf) != self.size:
+            raise ValueError(f"Invalid buffer size: {len(buf)}")
+        self._write(game, player, buf, 0)
+        return out
+
+    def encode_batch(self, games, players, out=None):
+        n = len(games)
+        if len(players) != n:
+            raise ValueError(f"Expected {n} players, got {len(players)}")
+        if out is None:
+            out = memoryview(array("f", bytes(4 * self.size * n))).cast(
+                "B").cast("f", (n, self.size))
+        buf = memoryview(out).cast("B").cast("f")
+        if len(buf) != self.size * n:
+            raise ValueError(f"Invalid buffer size: {len(buf)}")
+        size = self.size
+        write = self._write
+        for i in range(n):
+            write(games[i], players[i], buf, i * size)
+        return out
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(n_players={self.n_players!r})"
+
+
+def encode_observation(game, player):
+    return ObservationEncoder(len(game.players)).encode(game, player)
+
+
+class Discrete:
+    __slots__ = ("n",)
+
+    def __init__(self, n):
+        self.n = n
+
+    def contains(self, x):
+        return isinstance(x, int) and 0 <= x < self.n
+
+    def sample(self, rng=random):
+        return rng.randrange(self.n)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.n!r})"
+
+
+class Box:
+    __slots__ = ("low", "high", "shape")
+
+    def __init__(self, low, high, shape):
+        self.low = low
+        self.high = high
+        self.shape = tuple(shape)
+
+    def contains(self, x):
+        values = memoryview(x).cast("B").cast("f").tolist()
+        size = 1
+        for dim in self.shape:
+            size *= dim
+        return len(values) == size and all(
+            self.low <= value <= self.high for value in values)
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}("
+                f"low={self.low!r}, "
+                f"high={self.high!r}, "
+                f"shape={self.shape!r})")
+
+
+def _play_opponents(envs, opponent):
+    # Opponent decisions of all environments are made in batches
+    pending = [env for env in envs if env._waiting()]
+    while pending:
+        decisions = [env.table.decision for env in pending]
+        for decision, choice in zip(decisions, opponent.decide(decisions)):
+            decision.table.resolve(choice)
+        pending = [env for env in pending if env._waiting()]
+
+
+class UnoEnv:
+    def __init__(self, n_players=2, opponent=None, max_turns=None, seed=None):
+        if n_players < 2:
+            raise ValueError(f"Invalid number of players: {n_players}")
+        self.n_players = n_players
+        self.max_turns = max_turns
+        self.seed_sequence = seed if isinstance(seed, SeedSequence) \
+            else SeedSequence(seed)
+        self._default_opponent = opponent is None
+        self.opponent = opponent if opponent is not None \
+            else RandomAgent(self.seed_sequence.child(0))
+        self.encoder = ObservationEncoder(n_players)
+        self.observation_space = Box(-1.0, float(_N_CARDS),
+                                     (self.encoder.size,))
+        self.action_space = Discrete(N_ACTIONS)
+        self.table = None
+        self.player = None
+        self.episodes = 0
+
+    def _start(self):
+        game = UnoGame(*[UnoPlayer(f"Player {i + 1}")
+                         for i in range(self.n_players)],
+                       seed=self.seed_sequence.child(1, self.episodes))
+        self.episodes += 1
+        game.discard_pile.track_composition()
+        self.player = game.players[0]
+        self.table = Table(game, self.max_turns)
+
+    def _waiting(self):
+        return (not self.table.done
+                and self.table.decision.player is not self.player)
+
+    def _act(self, action):
+        table = self.table
+        if table is None or table.done:
+            raise ValueError("The episode is over, call reset() first")
+        if not self.action_space.contains(action):
+            raise ValueError(f"Invalid action: {action!r}")
+
+        if action == DRAW_ACTION:
+            table.resolve(None)
+            return
+        base = action
+        suit = None
+        if action >= _N_COLORED_KINDS:
+            suit = CALLABLE_SUITS[(action - _N_COLORED_KINDS) % _N_COLORS]
+            base = action - CALLABLE_SUITS.index(suit)
+        for card in table.decision.options:
+            if card is not None and _card_action(card) == base:
+                table.resolve(card)
+                if suit is not None:
+                    table.resolve(suit)
+                return
+        raise ValueError(f"Illegal action: {action}")
+
+    def _outcome(self):
+        table = self.table
+        terminated = table.winner is not None
+        truncated = table.done and not terminated
+        reward = 0.0
+        if terminated:
+            reward = 1.0 if table.winner is self.player else -1.0
+        return reward, terminated, truncated
+
+    def observe(self):
+        return memoryview(self.encoder.encode(self.table.game, self.player))
+
+    def action_mask(self):
+        mask = bytearray(N_ACTIONS)
+        mask[DRAW_ACTION] = 1
+        if not self.table.done:
+            for card in self.table.decision.options:
+                if card is None:
+                    continue
+                action = _card_action(card)
+                if card.wild:
+                    mask[action:action + _N_COLORS] = b"\x01" * _N_COLORS
+                else:
+                    mask[action] = 1
+        return memoryview(mask).cast("?")
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.seed_sequence = seed if isinstance(seed, SeedSequence) \
+                else SeedSequence(seed)
+            self.episodes = 0
+            if self._default_opponent:
+                self.opponent = RandomAgent(self.seed_sequence.child(0))
+        self._start()
+        _play_opponents([self], self.opponent)
+        return self.observe(), {}
+
+    def step(self, action):
+        self._act(action)
+        _play_opponents([self], self.opponent)
+        reward, terminated, truncated = self._outcome()
+        return (self.observe(), reward, terminated, truncated,
+                {"turns": self.table.turns})
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}("
+                f"n_players={self.n_players!r}, "
+                f"opponent={self.opponent!r}, "
+                f"max_turns={self.max_turns!r})")
+
+
+class VecUnoEnv:
+    def __init__(self, n_envs, n_players=2, opponent=None, max_turns=None,
+                 seed=None):
+        if n_envs < 1:
+            raise ValueError(f"Invalid number of environments: {n_envs}")
+        self.seed_sequence = seed if isinstance(seed, SeedSequence) \
+            else SeedSequence(seed)
+        self.opponent = opponent if opponent is not None \
+            else RandomAgent(self.seed_sequence.child(0))
+        self.envs = [UnoEnv(n_players, self.opponent, max_turns, seq)
+                     for seq in self.seed_sequence.child(1).spawn(n_envs)]
+        self.n_envs = n_envs
+        self.encoder = self.envs[0].encoder
+        self.observation_space = Box(
+            -1.0, float(_N_CARDS), (n_envs, self.encoder.size))
+        self.action_space = self.envs[0].action_space
+
+    def _observe(self):
+        envs = self.envs
+        return self.encoder.encode_batch([env.table.game for env in envs],
+                                         [env.player for env in envs])
+
+    def action_masks(self):
+        masks = bytearray()
+        for env in self.envs:
+            masks += env.action_mask()
+        return memoryview(masks).cast("?", (self.n_envs, N_ACTIONS))
+
+    def reset(self):
+        for env in self.envs:
+            env._start()
+        _play_opponents(self.envs, self.opponent)
+        return self._observe(), [{} for _ in self.envs]
+
+    def step(self, actions):
+        if len(actions) != self.n_envs:
+            raise ValueError(f"Expected {self.n_envs} actions, got "
+                             f"{len(actions)}")
+        envs = self.envs
+        for env, action in zip(envs, actions):
+            env._act(action)
+        _play_opponents(envs, self.opponent)
+
+        rewards = array("f", bytes(4 * self.n_envs))
+        dones = bytearray(self.n_envs)
+        infos = [{} for _ in envs]
+        finished = []
+        for i, env in enumerate(envs):
+            rewards[i], terminated, truncated = env._outcome()
+            if terminated or truncated:
+                # Finished games are replaced without calling end_game()
+                dones[i] = 1
+                infos[i]["terminal_observation"] = env.observe()
+                infos[i]["truncated"] = truncated
+                finished.append(env)
+                env._start()
+        _play_opponents(finished, self.opponent)
+        return (self._observe(), memoryview(rewards),
+                memoryview(dones).cast("?"), infos)
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}("
+                f"n_envs={self.n_envs!r}, "
+                f"envs={self.envs!r})")
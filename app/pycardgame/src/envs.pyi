@@ -0,0 +1,406 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import random
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .agents import Agent, Table
+from .base import GenericPlayer
+from .presets import UnoCard, UnoGame
+from .seeding import SeedSequence, T_Seed
+
+_N_COLORS: int = ...
+_N_RANKS: int = ...
+_N_SUITS: int = ...
+_FIRST_WILD: int = ...
+_N_CARDS: int = ...
+_N_COLORED_KINDS: int = ...
+
+N_CARD_KINDS: int = ...
+N_ACTIONS: int = ...
+DRAW_ACTION: int = ...
+
+
+def _card_kind(card: UnoCard) -> int:
+    """
+    Returns the index of a card's kind in the hand counts of an observation.
+    Coloured cards have one kind per rank and colour, and wild cards have one
+    kind per rank.
+    :param card: The card.
+    :return: The kind index.
+    """
+
+
+def _card_action(card: UnoCard) -> int:
+    """
+    Returns the first action that plays a card. Wild cards have one action
+    per callable suit, starting with this one.
+    :param card: The card.
+    :return: The action index.
+    """
+
+
+def observation_size(n_players: int) -> int:
+    """
+    Returns the length of an observation for a game with the given number of
+    players.
+    :param n_players: The number of players.
+    :return: The observation length.
+    """
+
+
+class ObservationEncoder:
+    """
+    Encodes a player's view of a UNO game into a fixed layout of 32-bit
+    floats. The layout is:
+
+    - the number of cards of each kind in the player's hand, at offset 0,
+    - the rank and the suit of the top card, one-hot encoded, at `top_rank`
+      and `top_suit`,
+    - the accumulated draw count at `draw_count`, and the direction of play
+      at `direction`,
+    - the hand sizes of the opponents in turn order, at `opponents`,
+    - the number of cards of each kind on the discard pile, at `discard`.
+
+    Observations are written into buffers provided by the caller, so many
+    games can be encoded into the rows of one 2D buffer without allocating
+    anything per game. The discard pile is read from its composition index
+    if it tracks one (see `GenericDeck.track_composition()`), which avoids
+    a pass over the whole pile.
+    :param n_players: The number of players of the encoded games.
+    """
+    __slots__ = ("n_players", "size", "top_rank", "top_suit", "draw_count",
+                 "direction", "opponents", "discard", "_zeros")
+
+    def __init__(self, n_players: int) -> None:
+        """
+        Creates a new encoder and computes its layout.
+        :param n_players: The number of players of the encoded games.
+        :raise ValueError: If there are fewer than two players.
+        """
+        self.n_players: int = ...
+        self.size: int = ...
+        self.top_rank: int = ...
+        self.top_suit: int = ...
+        self.draw_count: int = ...
+        self.direction: int = ...
+        self.opponents: int = ...
+        self.discard: int = ...
+        self._zeros: memoryview = ...
+
+    def _write(self, game: UnoGame, player: GenericPlayer[UnoCard],
+               buf: memoryview, base: int) -> None:
+        """
+        Writes an observation into a flat buffer.
+        :param game: The game.
+        :param player: The observing player.
+        :param buf: A flat memoryview of 32-bit floats.
+        :param base: The offset of the observation in the buffer.
+        :raise ValueError: If the game has the wrong number of players.
+        """
+
+    def encode(self, game: UnoGame, player: GenericPlayer[UnoCard],
+               out: Any = None) -> Any:
+        """
+        Encodes a player's view of a game.
+        :param game: The game.
+        :param player: The observing player.
+        :param out: A writable buffer of `size` 32-bit floats. A new array is
+            allocated if omitted.
+        :return: The buffer holding the observation.
+        :raise ValueError: If the buffer has the wrong size.
+        """
+
+    def encode_batch(self, games: Sequence[UnoGame],
+                     players: Sequence[GenericPlayer[UnoCard]],
+                     out: Any = None) -> Any:
+        """
+        Encodes the views of many games, one row per game.
+        :param games: The games.
+        :param players: The observing player of each game.
+        :param out: A writable buffer of `len(games) * size` 32-bit floats,
+            e.g. a preallocated NumPy array. A new 2D memoryview is allocated
+            if omitted.
+        :return: The buffer holding the observations.
+        :raise ValueError: If the numbers of games and players differ, or the
+            buffer has the wrong size.
+        """
+
+    def __repr__(self) -> str: ...
+
+
+def encode_observation(game: UnoGame,
+                       player: GenericPlayer[UnoCard]) -> array[float]:
+    """
+    Encodes a player's view of a UNO game with a new `ObservationEncoder`.
+    :param game: The game.
+    :param player: The observing player.
+    :return: The observation.
+    """
+
+
+class Discrete:
+    """
+    A space of the integers from 0 to `n - 1`.
+    :param n: The number of elements.
+    """
+    __slots__ = ("n",)
+
+    def __init__(self, n: int) -> None:
+        """
+        Creates a new discrete space.
+        :param n: The number of elements.
+        """
+        self.n: int = ...
+
+    def contains(self, x: Any) -> bool:
+        """
+        Checks whether a value is an element of the space.
+        :param x: The value.
+        :return: `True` if the value is in the space; otherwise, `False`.
+        """
+
+    def sample(self, rng: Any = random) -> int:
+        """
+        Draws a uniformly random element.
+        :param rng: The random number generator.
+        :return: The element.
+        """
+
+    def __repr__(self) -> str: ...
+
+
+class Box:
+    """
+    A space of 32-bit float arrays of a fixed shape with bounded values.
+    :param low: The lower bound of every value.
+    :param high: The upper bound of every value.
+    :param shape: The shape of the arrays.
+    """
+    __slots__ = ("low", "high", "shape")
+
+    def __init__(self, low: float, high: float,
+                 shape: Sequence[int]) -> None:
+        """
+        Creates a new box space.
+        :param low: The lower bound of every value.
+        :param high: The upper bound of every value.
+        :param shape: The shape of the arrays.
+        """
+        self.low: float = ...
+        self.high: float = ...
+        self.shape: Tuple[int, ...] = ...
+
+    def contains(self, x: Any) -> bool:
+        """
+        Checks whether a buffer of 32-bit floats is an element of the space.
+        :param x: An object supporting the buffer protocol.
+        :return: `True` if the buffer has the size of the space and all values
+            are within bounds; otherwise, `False`.
+        """
+
+    def __repr__(self) -> str: ...
+
+
+def _play_opponents(envs: Sequence[UnoEnv], opponent: Agent) -> None:
+    """
+    Lets the opponent play until every environment waits for its learning
+    player or is done. The pending decisions of all environments are handed
+    to the opponent as one batch.
+    :param envs: The environments.
+    :param opponent: The opponent agent.
+    """
+
+
+class UnoEnv:
+    """
+    A reinforcement learning environment for UNO in the style of Gymnasium.
+    The learning player takes the first seat, and the opponent agent plays
+    all other seats. Observations are 1D buffers of 32-bit floats, which
+    `numpy.asarray()` wraps without copying.
+
+    Actions 0 to 51 play the coloured card of the kind with the same index,
+    actions 52 to 59 play a Wild or Wild Draw Four card and call a suit, and
+    `DRAW_ACTION` draws instead. The reward is 1 for winning, -1 for losing,
+    and 0 otherwise.
+    :param n_players: The number of players.
+    :param opponent: The agent playing the other seats. Defaults to a
+        `RandomAgent`.
+    :param max_turns: The number of turns after which an episode is
+        truncated.
+    :param seed: The seed of the environment.
+    """
+
+    def __init__(self, n_players: int = 2, opponent: Optional[Agent] = None,
+                 max_turns: Optional[int] = None,
+                 seed: Optional[T_Seed] = None) -> None:
+        """
+        Creates a new environment. Call `reset()` before stepping.
+        :param n_players: The number of players.
+        :param opponent: The agent playing the other seats.
+        :param max_turns: The turn limit of an episode.
+        :param seed: The seed of the environment. Episode `i` is played with
+            the game seed `seed.child(1, i)`.
+        :raise ValueError: If there are fewer than two players.
+        """
+        self.n_players: int = ...
+        self.max_turns: Optional[int] = ...
+        self.seed_sequence: SeedSequence = ...
+        self._default_opponent: bool = ...
+        self.opponent: Agent = ...
+        self.encoder: ObservationEncoder = ...
+        self.observation_space: Box = ...
+        self.action_space: Discrete = ...
+        self.table: Optional[Table] = ...
+        self.player: Optional[GenericPlayer[UnoCard]] = ...
+        self.episodes: int = ...
+
+    def _start(self) -> None:
+        """
+        Starts a new episode without letting the opponent play. The discard
+        pile of the new game tracks its composition for the encoder.
+        """
+
+    def _waiting(self) -> bool:
+        """
+        Returns whether the episode waits for an opponent decision.
+        :return: `True` if an opponent has to decide; otherwise, `False`.
+        """
+
+    def _act(self, action: int) -> None:
+        """
+        Plays the learning player's action.
+        :param action: The action.
+        :raise ValueError: If the episode is over, or the action is invalid or
+            illegal.
+        """
+
+    def _outcome(self) -> Tuple[float, bool, bool]:
+        """
+        Returns the reward and the end state of the episode.
+        :return: The reward, whether the game was won, and whether it was
+            truncated.
+        """
+
+    def observe(self) -> memoryview:
+        """
+        Encodes the learning player's view of the game.
+        :return: The observation.
+        """
+
+    def action_mask(self) -> memoryview:
+        """
+        Returns which actions are legal. Drawing is always legal.
+        :return: A buffer of booleans, one per action.
+        """
+
+    def reset(self, seed: Optional[T_Seed] = None
+              ) -> Tuple[memoryview, Dict[str, Any]]:
+        """
+        Starts a new episode and plays until it is the learning player's turn.
+        :param seed: A new seed for the environment, if given. This restarts
+            the episode count and reseeds the default opponent.
+        :return: The first observation and an empty info dictionary.
+        """
+
+    def step(self, action: int
+             ) -> Tuple[memoryview, float, bool, bool, Dict[str, Any]]:
+        """
+        Plays the learning player's action, then lets the opponent play until
+        it is the learning player's turn again or the game is over.
+        :param action: The action.
+        :return: The observation, the reward, whether the game was won,
+            whether it was truncated, and an info dictionary with the number
+            of turns played.
+        :raise ValueError: If the episode is over, or the action is invalid or
+            illegal.
+        """
+
+    def __repr__(self) -> str: ...
+
+
+class VecUnoEnv:
+    """
+    Steps many UNO environments at once. Observations, rewards and done flags
+    are stacked into single buffers, and opponent decisions are made in
+    batches across all environments. Finished games are replaced by new ones
+    right away, without calling `end_game()`.
+    :param n_envs: The number of environments.
+    :param n_players: The number of players per game.
+    :param opponent: The agent playing the other seats of all games.
+    :param max_turns: The turn limit of an episode.
+    :param seed: The seed of the environments.
+    """
+
+    def __init__(self, n_envs: int, n_players: int = 2,
+                 opponent: Optional[Agent] = None,
+                 max_turns: Optional[int] = None,
+                 seed: Optional[T_Seed] = None) -> None:
+        """
+        Creates the environments. Call `reset()` before stepping.
+        :param n_envs: The number of environments.
+        :param n_players: The number of players per game.
+        :param opponent: The agent playing the other seats of all games.
+        :param max_turns: The turn limit of an episode.
+        :param seed: The seed of the environments.
+        :raise ValueError: If `n_envs` is less than 1.
+        """
+        self.seed_sequence: SeedSequence = ...
+        self.opponent: Agent = ...
+        self.envs: List[UnoEnv] = ...
+        self.n_envs: int = ...
+        self.encoder: ObservationEncoder = ...
+        self.observation_space: Box = ...
+        self.action_space: Discrete = ...
+
+    def _observe(self) -> memoryview:
+        """
+        Encodes the observations of all environments.
+        :return: A 2D buffer with one row per environment.
+        """
+
+    def action_masks(self) -> memoryview:
+        """
+        Returns the legal actions of all environments.
+        :return: A 2D buffer of booleans with one row per environment.
+        """
+
+    def reset(self) -> Tuple[memoryview, List[Dict[str, Any]]]:
+        """
+        Starts a new episode in every environment.
+        :return: The stacked observations and one info dictionary per
+            environment.
+        """
+
+    def step(self, actions: Sequence[int]
+             ) -> Tuple[memoryview, memoryview, memoryview,
+                        List[Dict[str, Any]]]:
+        """
+        Steps every environment. For an environment whose episode ended, the
+        returned observation is the first one of its next episode, and its
+        info dictionary holds the last observation as `terminal_observation`
+        and whether the episode was truncated.
+        :param actions: One action per environment.
+        :return: The stacked observations, rewards, done flags, and one info
+            dictionary per environment.
+        :raise ValueError: If the number of actions does not match, or an
+            action is invalid or illegal.
+        """
+
+    def __repr__(self) -> str: ...
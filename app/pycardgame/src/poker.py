@@ -0,0 +1,178 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from itertools import combinations_with_replacement
+from typing import Literal
+
+from .base import CardMeta, DeckMeta, GenericCard, GenericDeck
+
+T_PokerRanks = Literal["2", "3", "4", "5", "6", "7", "8", "9", "10", "Jack",
+                       "Queen", "King", "Ace"]
+T_PokerSuits = Literal["Clubs", "Diamonds", "Hearts", "Spades"]
+
+_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_RANKS = tuple(range(12, -1, -1))
+
+
+class PokerCard(
+    GenericCard[T_PokerRanks, T_PokerSuits],
+    metaclass=CardMeta,
+    rank_type=T_PokerRanks,
+    suit_type=T_PokerSuits
+):
+    def effect(self, game, player, *args):  # pragma: no cover
+        pass
+
+    def __str__(self):
+        return f"{self.get_rank()} of {self.get_suit()}"
+
+
+class PokerDeck(
+    GenericDeck[PokerCard],
+    metaclass=DeckMeta,
+    card_type=PokerCard
+):
+    pass
+
+
+def _straight_high(mask):
+    for top in range(12, 3, -1):
+        window = 0x1F << (top - 4)
+        if mask & window == window:
+            return top
+    if mask & 0x100F == 0x100F:
+        return 3  # The wheel, A-2-3-4-5, is a five-high straight
+    return -1
+
+
+def _pack(category, ranks):
+    value = category
+    for i in range(5):
+        value = value << 4 | (ranks[i] if i < len(ranks) else 0)
+    return value
+
+
+def _flush_value(mask, straights):
+    high = straights[mask]
+    if high >= 0:
+        return _pack(8, [high])
+    ranks = [rank for rank in range(12, -1, -1) if mask >> rank & 1]
+    return _pack(5, ranks[:5])
+
+
+def _rank_value(ranks, straights):
+    # The ranks are sorted in descending order
+    groups = sorted(((ranks.count(rank), rank) for rank in set(ranks)),
+                    reverse=True)
+    (n_first, first), (n_second, second) = groups[0], groups[1]
+    rest = sorted(set(ranks), reverse=True)
+    high = straights[sum(1 << rank for rank in rest)]
+    if n_first == 4:
+        return _pack(7, [first, max(r for r in rest if r != first)])
+    if n_first == 3 and n_second >= 2:
+        return _pack(6, [first, second])
+    if high >= 0:
+        return _pack(4, [high])
+    if n_first == 3:
+        return _pack(3, [first] + [r for r in rest if r != first][:2])
+    if n_first == 2 and n_second == 2:
+        kicker = max(r for r in rest if r != first and r != second)
+        return _pack(2, [first, second, kicker])
+    if n_first == 2:
+        return _pack(1, [first] + [r for r in rest if r != first][:3])
+    return _pack(0, rest[:5])
+
+
+class HandEvaluator:
+    CATEGORIES = ("High Card", "Pair", "Two Pair", "Three of a Kind",
+                  "Straight", "Flush", "Full House", "Four of a Kind",
+                  "Straight Flush")
+
+    _flush_table = None
+    _rank_table = None
+    _primes = tuple(_PRIMES[code >> 2] for code in range(52))
+    _bits = tuple(1 << (code >> 2) for code in range(52))
+
+    @classmethod
+    def _get_tables(cls):
+        if cls._rank_table is None:
+            # In up to seven cards, a flush rules out quads and full houses,
+            # so flushes only depend on the ranks of the flush suit
+            straights = [_straight_high(mask) for mask in range(1 << 13)]
+            cls._flush_table = [
+                _flush_value(mask, straights) if bin(mask).count("1") >= 5
+                else 0 for mask in range(1 << 13)]
+            table = {}
+            primes = _PRIMES
+            for n_cards in range(5, 8):
+                for ranks in combinations_with_replacement(_RANKS, n_cards):
+                    # No rank has more than four cards
+                    if any(ranks[i] == ranks[i + 4]
+                           for i in range(n_cards - 4)):
+                        continue
+                    key = 1
+                    for rank in ranks:
+                        key *= primes[rank]
+                    table[key] = _rank_value(ranks, straights)
+            cls._rank_table = table
+        return cls._flush_table, cls._rank_table
+
+    @staticmethod
+    def encode(card):
+        return card.rank << 2 | card.suit
+
+    @classmethod
+    def evaluate(cls, cards):
+        return cls.evaluate_codes([card.rank << 2 | card.suit
+                                   for card in cards])
+
+    @classmethod
+    def evaluate_codes(cls, codes):
+        if not 5 <= len(codes) <= 7:
+            raise ValueError(f"Cannot evaluate {len(codes)} cards: a hand "
+                             f"must have between 5 and 7 cards")
+        return cls.evaluate_batch([codes])[0]
+
+    @classmethod
+    def evaluate_batch(cls, hands, board=()):
+        flush_table, rank_table = cls._get_tables()
+        primes = cls._primes
+        bits = cls._bits
+        # The board is shared by every hand, so its part of the key is
+        # computed once
+        base_key = 1
+        base_masks = [0, 0, 0, 0]
+        for code in board:
+            base_key *= primes[code]
+            base_masks[code & 3] |= bits[code]
+        values = []
+        append = values.append
+        for hand in hands:
+            key = base_key
+            masks = base_masks.copy()
+            for code in hand:
+                key *= primes[code]
+                masks[code & 3] |= bits[code]
+            value = (flush_table[masks[0]] or flush_table[masks[1]] or
+                     flush_table[masks[2]] or flush_table[masks[3]])
+            append(value or rank_table[key])
+        return values
+
+    @classmethod
+    def category(cls, value):
+        return cls.CATEGORIES[value >> 20]
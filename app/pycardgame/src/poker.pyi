@@ -0,0 +1,186 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from typing import (Dict, Iterable, List, Literal, Optional, Sequence, Tuple,
+                    Union)
+
+from .base import CardMeta, DeckMeta, GenericCard, GenericDeck
+
+T_PokerRanks = Literal["2", "3", "4", "5", "6", "7", "8", "9", "10", "Jack",
+                       "Queen", "King", "Ace"]
+T_PokerSuits = Literal["Clubs", "Diamonds", "Hearts", "Spades"]
+
+_PRIMES: Tuple[int, ...]
+_RANKS: Tuple[int, ...]
+
+
+class PokerCard(
+    GenericCard[T_PokerRanks, T_PokerSuits],
+    metaclass=CardMeta,
+    rank_type=T_PokerRanks,
+    suit_type=T_PokerSuits
+):
+    """
+    A French-suited playing card.
+    :param rank: The rank of the card, from "2" to "Ace".
+    :param suit: The suit of the card.
+    :param trump: Whether the card is a trump card.
+    """
+
+    def __init__(self, rank: Optional[Union[T_PokerRanks, int]],
+                 suit: Optional[Union[T_PokerSuits, int]],
+                 trump: bool = False) -> None:
+        """
+        Creates a new playing card.
+        :param rank: The rank of the card, from "2" to "Ace".
+        :param suit: The suit of the card.
+        :param trump: Whether the card is a trump card.
+        """
+
+    def effect(self, game, player, *args) -> None:
+        """
+        Playing cards have no effect of their own.
+        """
+
+    def __str__(self) -> str: ...
+
+
+class PokerDeck(
+    GenericDeck[PokerCard],
+    metaclass=DeckMeta,
+    card_type=PokerCard
+):
+    """
+    A standard deck of 52 playing cards.
+    :param cards: A custom list of `PokerCard` objects. If omitted, a full
+        deck is created.
+    """
+
+
+def _straight_high(mask: int) -> int:
+    """
+    Finds the highest straight in a set of ranks.
+    :param mask: The ranks as a bit mask, with bit 0 for "2".
+    :return: The rank index of the straight's highest card, or -1 if the
+        ranks hold no straight.
+    """
+
+
+def _pack(category: int, ranks: Sequence[int]) -> int:
+    """
+    Packs a hand value into an integer.
+    :param category: The index of the hand category.
+    :param ranks: Up to five rank indices that break ties within the
+        category, most significant first.
+    :return: The category in the top bits, followed by four bits per rank.
+    """
+
+
+def _flush_value(mask: int, straights: Sequence[int]) -> int:
+    """
+    Computes the value of the best flush or straight flush in one suit.
+    :param mask: The ranks of the suit as a bit mask.
+    :param straights: The highest straight for every bit mask.
+    :return: The hand value.
+    """
+
+
+def _rank_value(ranks: Tuple[int, ...], straights: Sequence[int]) -> int:
+    """
+    Computes the value of the best five-card hand without a flush.
+    :param ranks: The rank indices of 5 to 7 cards in descending order.
+    :param straights: The highest straight for every bit mask.
+    :return: The hand value.
+    """
+
+
+class HandEvaluator:
+    """
+    A poker hand evaluator for 5 to 7 cards based on lookup tables. A card is
+    encoded as the integer `rank << 2 | suit`, from 0 for the "2" of Clubs to
+    51 for the "Ace" of Spades. Every rank is mapped to a prime, so the
+    product of a hand's primes identifies its ranks regardless of their order
+    and is the key of a table holding the best hand for every multiset of
+    ranks. A hand with five or more cards of one suit cannot also hold a full
+    house or four of a kind, so flushes are looked up in a second table by the
+    bit mask of the flush suit's ranks. The tables are built once per process,
+    on first use.
+
+    Hand values are integers, where a higher value is a better hand and equal
+    values are equal hands. The category of the hand is stored in the top
+    bits, see `category()`.
+    """
+    CATEGORIES: Tuple[str, ...]
+
+    _flush_table: Optional[List[int]]
+    _rank_table: Optional[Dict[int, int]]
+    _primes: Tuple[int, ...]
+    _bits: Tuple[int, ...]
+
+    @classmethod
+    def _get_tables(cls) -> Tuple[List[int], Dict[int, int]]:
+        """
+        Returns the lookup tables, building them on first use.
+        :return: The flush table and the rank table.
+        """
+
+    @staticmethod
+    def encode(card: GenericCard) -> int:
+        """
+        Encodes a card as an integer.
+        :param card: The card to encode.
+        :return: The card's code, between 0 and 51.
+        """
+
+    @classmethod
+    def evaluate(cls, cards: Iterable[GenericCard]) -> int:
+        """
+        Evaluates a hand of cards.
+        :param cards: The 5 to 7 cards of the hand.
+        :return: The value of the best five-card hand.
+        :raise ValueError: If the hand does not have between 5 and 7 cards.
+        """
+
+    @classmethod
+    def evaluate_codes(cls, codes: Sequence[int]) -> int:
+        """
+        Evaluates a hand of encoded cards.
+        :param codes: The codes of the 5 to 7 cards of the hand.
+        :return: The value of the best five-card hand.
+        :raise ValueError: If the hand does not have between 5 and 7 cards.
+        """
+
+    @classmethod
+    def evaluate_batch(cls, hands: Iterable[Sequence[int]],
+                       board: Iterable[int] = ()) -> List[int]:
+        """
+        Evaluates many hands of encoded cards at once, e.g., every pair of
+        hole cards against a board. The hands are not validated: together with
+        the board, every hand must have between 5 and 7 distinct cards.
+        :param hands: The codes of the cards of every hand.
+        :param board: The codes of the cards shared by every hand.
+        :return: The value of every hand, in order.
+        """
+
+    @classmethod
+    def category(cls, value: int) -> str:
+        """
+        Returns the category of a hand value.
+        :param value: A hand value returned by the evaluator.
+        :return: The name of the category, e.g., "Full House".
+        """
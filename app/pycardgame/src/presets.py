@@ -26,6 +26,7 @@ from .. import (
     GenericGame,
     GenericPlayer,
 )
+from .agents import Agent, Table
 
 T_UnoRanks = Literal["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "Skip",
                      "Reverse", "Draw Two", "Wild", "Wild Draw Four"]
@@ -40,6 +41,8 @@ class UnoCard(
 ):
     __slots__ = ("wild",)
 
+    _kind_flag = "wild"
+
     def __init__(self, rank, suit):
         super().__init__(rank, suit, False)  # type: ignore
 
@@ -48,6 +51,32 @@ class UnoCard(
     def is_wild(self):
         return self.wild
 
+    def kind_key(self):
+        # A wild card keeps its kind after a suit was called for it
+        if self.rank in _WILD_RANKS:
+            return self.rank, _WILD_SUIT
+        return self.rank, self.suit
+
+    def _call_suit(self, game, suit):
+        old_suit = self.suit
+        card = self._evolve(
+            suit=self._set_value(suit, self.__class__.SUITS, "suit"),
+            wild=False)
+        pile = game.discard_pile
+        if card is not self:
+            # Frozen cards are replaced on the discard pile instead of changed
+            pile.remove(self).add(card, to_top=True)
+        elif pile._composition is not None and any(
+                c is self for c in pile._cards):
+            # The suit counts of an indexed pile follow the suit called in
+            # place; the card's kind does not change
+            _, _, by_suit, by_equal = pile._composition
+            by_suit[old_suit] -= 1
+            by_suit[self.suit] += 1
+            by_equal[self.rank, old_suit, self.trump][self.__class__] -= 1
+            by_equal[self.rank, self.suit, self.trump][self.__class__] += 1
+        return card
+
     def effect(self, game, player, *args):  # pragma: no cover
         pass
 
@@ -106,11 +135,9 @@ class WildCard(UnoCard, metaclass=CardMeta, rank_type=T_UnoRanks,
 
     def effect(self, game, player, *args):
         if args and args[0] is not None:
-            self.change_suit(args[0])
-            self.wild = False
+            self._call_suit(game, args[0])
         else:
             raise ValueError("A new suit must be provided for Wild card.")
-        game.discard_cards(self)
 
 
 class WildDrawFourCard(UnoCard, metaclass=CardMeta, rank_type=T_UnoRanks,
@@ -121,12 +148,11 @@ class WildDrawFourCard(UnoCard, metaclass=CardMeta, rank_type=T_UnoRanks,
 
     def effect(self, game, player, *args):
         if args and args[0] is not None:
-            self.change_suit(args[0])
-            self.wild = False
+            self._call_suit(game, args[0])
         else:
             raise ValueError(
                 "A new suit must be provided for Wild Draw Four card.")
-        game.draw_cards(game.get_next_player(), 4)
+        game.draw_cards(game.get_next_player(), 4, partial=True)
         game.next_player()
 
 
@@ -135,16 +161,15 @@ class UnoDeck(
     metaclass=DeckMeta,
     card_type=UnoCard
 ):
-    def __init__(self, cards=None):
-        super().__init__()
-
+    @classmethod
+    def _build_cards(cls):
         colors: List[T_UnoSuits] = ["Red", "Green", "Blue",  # type: ignore
                                     "Yellow"]
         numbers: List[T_UnoRanks] = (["0"]  # type: ignore
                                      + [str(i) for i in range(1, 10)] * 2)
 
         # Create the deck with the specialized card types
-        card_list = [
+        return [
             # Create Number Cards (0-9)
             NumberCard(rank, suit) for suit in colors for rank in numbers
         ] + [
@@ -164,8 +189,6 @@ class UnoDeck(
             WildDrawFourCard() for _ in range(4)
         ]
 
-        self.cards = cards if cards is not None else card_list
-
     def __str__(self):
         return f"UNO Deck with {len(self.cards)} cards."
 
@@ -194,12 +217,60 @@ class UnoPlayer(GenericPlayer[UnoCard]):
                 f"hand={self.hand!r}, uno={self.uno!r})")
 
 
+_DRAW_TWO = UnoCard.RANKS.index("Draw Two")
+_WILD_RANKS = (UnoCard.RANKS.index("Wild"), UnoCard.RANKS.index(
+    "Wild Draw Four"))
+_WILD_SUIT = UnoCard.SUITS.index("Wild")
+_EFFECTS = {
+    UnoCard.RANKS.index("Skip"): ("skip",),
+    UnoCard.RANKS.index("Reverse"): ("reverse",),
+    UnoCard.RANKS.index("Draw Two"): ("draw_two",),
+    UnoCard.RANKS.index("Wild"): ("call_suit",),
+    UnoCard.RANKS.index("Wild Draw Four"): ("call_suit", "draw_four"),
+}
+
+
+def _uno_rule(card, top_card, stacking):
+    # Only Draw Two cards can be stacked on top of each other
+    if stacking and card.rank != _DRAW_TWO:
+        return False
+
+    if card.wild:
+        return True
+    return card.rank == top_card.rank or card.suit == top_card.suit
+
+
+class TurnEvent:
+    __slots__ = ("player", "card", "suit", "drawn", "penalty", "effects",
+                 "winner")
+
+    def __init__(self, player, card=None, suit=None, drawn=(), effects=(),
+                 winner=None, penalty=()):
+        self.player = player
+        self.card = card
+        self.suit = suit
+        self.drawn = drawn
+        self.penalty = penalty
+        self.effects = effects
+        self.winner = winner
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}("
+                f"player={self.player.name!r}, "
+                f"card={self.card!r}, "
+                f"suit={self.suit!r}, "
+                f"drawn={self.drawn!r}, "
+                f"penalty={self.penalty!r}, "
+                f"effects={self.effects!r}, "
+                f"winner={getattr(self.winner, 'name', None)!r})")
+
+
 class UnoGame(GenericGame[UnoCard]):
     def __init__(self, *players, draw_pile=None, discard_pile=None,
-                 hand_size=7):
-        super().__init__(UnoCard, UnoDeck, draw_pile, discard_pile, None,
-                         hand_size, 0, True, *players)
-        self.draw_pile = draw_pile if draw_pile else UnoDeck().shuffle()
+                 hand_size=7, seed=None):
+        super().__init__(UnoCard, UnoDeck, draw_pile or None, discard_pile,
+                         None, hand_size, 0, bool(draw_pile), *players,
+                         seed=seed)
         self.draw_count = 0  # Track accumulated draw count
         self.game_ended = False
 
@@ -210,36 +281,108 @@ class UnoGame(GenericGame[UnoCard]):
         if card1 is None or card2 is None:
             return False
 
-        # Only Draw Two cards can be stacked on top of each other
-        if self.draw_count > 0 and card1.get_rank() != "Draw Two":
-            return False
+        return _uno_rule(card1, card2, self.draw_count > 0)
 
-        if card1.is_wild():
-            return True
-        return card1.rank == card2.rank or card1.suit == card2.suit
+    def rule_state(self):
+        return 1 if self.draw_count > 0 else 0
+
+    def _hash_state(self):
+        return super()._hash_state() + (("draw_count", self.draw_count),)
 
     def get_next_player(self):
+        if self.turn_order is not None:
+            return self.turn_order.peek()
         return self.players[
             (self.current_player_index + self.direction) % len(self.players)]
 
     def start_game(self):
         self.deal_initial_cards()
         self.discard_pile.add(self.draw_pile.draw())
+        if self._listeners:
+            self._emit("game_started")
+        return self.rehash()
+
+    def reshuffle_discard_pile(self):
+        if len(self.draw_pile) == 0 and len(self.discard_pile) > 1:
+            # The top card stays, and called suits are taken back from wilds
+            top_card, *cards = self.discard_pile.get_cards()
+            self.discard_pile.clear()
+            self.discard_pile.add(top_card)
+            self.draw_pile.add(*[
+                card._evolve(suit=_WILD_SUIT, wild=True)
+                if card.rank in _WILD_RANKS else card for card in cards])
+            self.draw_pile.shuffle()
+            self._card_hash = None
+            if self._listeners:
+                self._emit("pile_reshuffled")
         return self
 
+    def draw_cards(self, player=None, n=1, *, partial=False):
+        drawable = len(self.draw_pile) + max(len(self.discard_pile) - 1, 0)
+        if n > drawable:
+            if not partial:
+                raise ValueError("Not enough cards to draw.")
+            n = drawable
+        if n == 0:
+            return []
+        if player is None:
+            player = self.get_current_player()
+
+        drawn = []
+        if 0 < len(self.draw_pile) < n:
+            drawn = super().draw_cards(player, len(self.draw_pile))
+        return drawn + super().draw_cards(player, n - len(drawn))
+
     def draw_instead_of_play(self, player=None):
         player = player or self.get_current_player()
 
         if self.draw_count > 0:
-            drawn_cards = self.draw_cards(player, self.draw_count)
+            drawn_cards = self.draw_cards(player, self.draw_count,
+                                          partial=True)
             self.draw_count = 0
         else:
-            drawn_cards = self.draw_cards(player, 1)
+            drawn_cards = self.draw_cards(player, 1, partial=True)
 
         return drawn_cards
 
+    def play_turn(self, card=None, suit=None):
+        player = self.get_current_player()
+        event = TurnEvent(player, card, suit)
+        if card is None:
+            event.drawn = tuple(self.draw_instead_of_play(player))
+        elif card.wild and suit is None:
+            raise ValueError(f"A suit must be called for {card}")
+        else:
+            # The next player's forced draw ends up at the end of their hand
+            victim = self.get_next_player()
+            size = len(victim.hand)
+            if not self.play_card(card, player, suit):
+                raise ValueError(f"Invalid play: {card}")
+            event.effects = _EFFECTS.get(card.rank, ())
+            if card.rank == _WILD_RANKS[1]:
+                event.penalty = tuple(victim.hand[size:])
+
+        event.winner = self.determine_winner()
+        if event.winner is None:
+            self.next_player()
+        return event
+
+    def iter_turns(self, agents, max_turns=None):
+        if isinstance(agents, Agent):
+            agents = [agents] * len(self.players)
+        table = Table(self, max_turns)
+        while not table.done:
+            decision = table.decision
+            turns = table.turns
+            agent = agents[self.players.index(decision.player)]
+            table.resolve(agent.decide([decision])[0])
+            if table.turns != turns:
+                yield table.event
+
     def determine_winner(self):
-        for player in self.players:
+        # The ring keeps the seating order, which the list does not
+        seating = self.players if self.turn_order is None else self.turn_order
+        for player in seating:
             if len(player) == 0:
                 return player
         return None
@@ -252,6 +395,8 @@ class UnoGame(GenericGame[UnoCard]):
             print("Game ended without a winner.")
 
         self.game_ended = True
+        if self._listeners:
+            self._emit("game_ended", winner)
 
         self.draw_pile.clear()
         self.discard_pile.clear()
@@ -17,7 +17,8 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Literal, Optional, Sequence, Union
+from typing import (Any, Dict, Iterator, List, Literal, Optional, Sequence,
+                    Tuple, Union)
 
 from .base import (
     CardMeta,
@@ -27,6 +28,8 @@ from .base import (
     GenericGame,
     GenericPlayer,
 )
+from .agents import Agent
+from .seeding import SeedSequence
 
 T_UnoRanks = Literal["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "Skip",
                      "Reverse", "Draw Two", "Wild", "Wild Draw Four"]
@@ -47,6 +50,8 @@ class UnoCard(
     """
     __slots__ = ("wild",)
 
+    _kind_flag: str = ...
+
     def __init__(self, rank: Union[T_UnoRanks, int], suit: Union[T_UnoSuits, int
     ]) -> None:
         """
@@ -62,6 +67,25 @@ class UnoCard(
         :return: True if the card is a Wild card, False otherwise.
         """
 
+    def kind_key(self) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Get the key of the card's kind. Wild cards keep the "Wild" suit in
+        their key after a suit was called for them.
+        :return: The rank and suit indices of the card.
+        """
+
+    def _call_suit(self, game: UnoGame, suit: Union[T_UnoSuits, int]
+                   ) -> UnoCard:
+        """
+        Set the suit chosen for a Wild card that has been played. A frozen card
+        is replaced on top of the discard pile by a copy with the new suit.
+        If the discard pile keeps a composition index, its suit count follows
+        the new suit.
+        :param game: The game instance.
+        :param suit: The chosen suit.
+        :return: The card with the chosen suit.
+        """
+
     def effect(self,
                game: UnoGame,
                player: GenericPlayer[UnoCard],
@@ -140,10 +164,11 @@ class UnoDeck(
     :param cards: Optional list of cards to initialise the deck with.
     """
 
-    def __init__(self, cards: Optional[Sequence[UnoCard]] = None) -> None:
+    @classmethod
+    def _build_cards(cls) -> List[UnoCard]:
         """
-        Initialise the UNO deck with a standard set of cards.
-        :param cards: Optional list of cards to initialise the deck with.
+        Build the standard set of 108 UNO cards.
+        :return: The list of cards of a full UNO deck.
         """
 
 
@@ -173,6 +198,67 @@ class UnoPlayer(GenericPlayer[UnoCard]):
         """
 
 
+_DRAW_TWO: int = ...
+_WILD_RANKS: Tuple[int, int] = ...
+_WILD_SUIT: int = ...
+_EFFECTS: Dict[int, Tuple[str, ...]] = ...
+
+
+def _uno_rule(card: UnoCard, top_card: UnoCard, stacking: bool) -> bool:
+    """
+    The UNO play rule as a pure function of both cards and the stacking state.
+    :param card: The card being played.
+    :param top_card: The card on top of the discard pile.
+    :param stacking: Whether a draw penalty is being stacked.
+    :return: True if the card can be played, False otherwise.
+    """
+
+
+class TurnEvent:
+    """
+    A compact record of one turn of a UNO game.
+    :param player: The player whose turn it was.
+    :param card: The card played, or None if the player drew instead.
+    :param suit: The suit called for a wild card.
+    :param drawn: The cards the player drew instead of playing.
+    :param effects: The effects of the played card, out of "skip",
+        "reverse", "draw_two", "call_suit" and "draw_four".
+    :param winner: The winner, if the turn ended the game.
+    :param penalty: The cards the next player was forced to draw by a Wild
+        Draw Four.
+    """
+    __slots__ = ("player", "card", "suit", "drawn", "penalty", "effects",
+                 "winner")
+
+    def __init__(self, player: GenericPlayer[UnoCard],
+                 card: Optional[UnoCard] = None,
+                 suit: Optional[Union[T_UnoSuits, int]] = None,
+                 drawn: Tuple[UnoCard, ...] = (),
+                 effects: Tuple[str, ...] = (),
+                 winner: Optional[GenericPlayer[UnoCard]] = None,
+                 penalty: Tuple[UnoCard, ...] = ()) -> None:
+        """
+        Creates a new turn event.
+        :param player: The player whose turn it was.
+        :param card: The card played, or None if the player drew instead.
+        :param suit: The suit called for a wild card.
+        :param drawn: The cards the player drew instead of playing.
+        :param effects: The effects of the played card.
+        :param winner: The winner, if the turn ended the game.
+        :param penalty: The cards the next player was forced to draw by a
+            Wild Draw Four.
+        """
+        self.player: GenericPlayer[UnoCard] = ...
+        self.card: Optional[UnoCard] = ...
+        self.suit: Optional[Union[T_UnoSuits, int]] = ...
+        self.drawn: Tuple[UnoCard, ...] = ...
+        self.penalty: Tuple[UnoCard, ...] = ...
+        self.effects: Tuple[str, ...] = ...
+        self.winner: Optional[GenericPlayer[UnoCard]] = ...
+
+    def __repr__(self) -> str: ...
+
+
 class UnoGame(GenericGame[UnoCard]):
     """A class representing a UNO game."""
 
@@ -180,7 +266,8 @@ class UnoGame(GenericGame[UnoCard]):
                  *players: GenericPlayer[UnoCard],
                  draw_pile: Optional[GenericDeck[UnoCard]] = None,
                  discard_pile: Optional[GenericDeck[UnoCard]] = None,
-                 hand_size: int = 7) -> None:
+                 hand_size: int = 7,
+                 seed: Optional[Union[int, SeedSequence]] = None) -> None:
         """
         Initialise the UNO game with a deck, discard pile, hand size, and
         players.
@@ -188,6 +275,7 @@ class UnoGame(GenericGame[UnoCard]):
         :param draw_pile: The draw pile for the game.
         :param discard_pile: The discard pile for the game.
         :param hand_size: The number of cards each player starts with.
+        :param seed: The root seed of the game's random number generators.
         """
         self.draw_count: int = 0
         self.game_ended: bool = False
@@ -201,6 +289,18 @@ class UnoGame(GenericGame[UnoCard]):
         :return: True if the card can be played, False otherwise.
         """
 
+    def rule_state(self) -> int:
+        """
+        Returns the stacking state, 1 while a draw penalty is pending.
+        :return: The state bitmask.
+        """
+
+    def _hash_state(self) -> Tuple[Tuple[Any, ...], ...]:
+        """
+        Adds the pending draw count to the hashed state.
+        :return: The features, each a tuple of a name and values.
+        """
+
     def get_next_player(self) -> UnoPlayer:
         """
         Get the next player in the game based on the current direction.
@@ -213,6 +313,30 @@ class UnoGame(GenericGame[UnoCard]):
         :return: The game instance.
         """
 
+    def reshuffle_discard_pile(self) -> UnoGame:
+        """
+        Shuffle the discard pile back into the empty draw pile. The top card
+        stays on the discard pile, and wild cards lose their called suit.
+        :return: The game instance.
+        """
+
+    def draw_cards(self,
+                   player: Optional[GenericPlayer[UnoCard]] = None,
+                   n: int = 1,
+                   *,
+                   partial: bool = False) -> List[UnoCard]:
+        """
+        Draw cards for a player, reshuffling the discard pile if the draw pile
+        runs out in the middle of the draw.
+        :param player: The player drawing cards. Defaults to the current player.
+        :param n: The number of cards to draw.
+        :param partial: If True, draw as many cards as are left if there are
+            fewer than `n`, instead of raising an error.
+        :return: The drawn cards.
+        :raise ValueError: If fewer than `n` cards are left and `partial` is
+            False.
+        """
+
     def draw_instead_of_play(self,
                              player: Optional[GenericPlayer[UnoCard]] = None
                              ) -> Sequence[UnoCard]:
@@ -225,6 +349,31 @@ class UnoGame(GenericGame[UnoCard]):
             empty.
         """
 
+    def play_turn(self, card: Optional[UnoCard] = None,
+                  suit: Optional[Union[T_UnoSuits, int]] = None) -> TurnEvent:
+        """
+        Play a full turn for the current player: play a card, or draw if no
+        card is given, then move on to the next player unless the game is won.
+        :param card: The card to play, or None to draw instead.
+        :param suit: The suit to call if the card is a wild card.
+        :return: The event describing the turn.
+        :raise ValueError: If the card cannot be played, or no suit is called
+            for a wild card.
+        """
+
+    def iter_turns(self, agents: Union[Agent, Sequence[Agent]],
+                   max_turns: Optional[int] = None) -> Iterator[TurnEvent]:
+        """
+        Play the game lazily, one turn per step of the iterator. The game is
+        started first if no card has been played yet. Nothing is recorded, so
+        a consumer can stop at any time and keep only what it needs.
+        :param agents: One agent per seat, or a single agent for all seats.
+        :param max_turns: The number of turns after which the iterator stops
+            even without a winner.
+        :return: An iterator over the turn events. The last event holds the
+            winner, unless the turn limit was reached.
+        """
+
     def determine_winner(self) -> Optional[GenericPlayer[UnoCard]]:
         """
         Determine the winner of the game based on the players' scores.
@@ -0,0 +1,94 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+
+class RuleTable:
+    __slots__ = ("card_type", "rule", "n_flags", "_flag", "_suits", "_kinds",
+                 "_states", "_table")
+
+    def __init__(self, card_type, rule, n_flags=0):
+        if n_flags < 0:
+            raise ValueError(f"Invalid number of state flags: {n_flags}")
+        self.card_type = card_type
+        self.rule = rule
+        self.n_flags = n_flags
+        self._flag = card_type._kind_flag
+        self._suits = len(card_type.SUITS)
+        self._kinds = card_type._kind_count()
+        self._states = 1 << n_flags
+        self._table = None
+
+    def _flags(self, state):
+        return tuple(bool(state >> bit & 1) for bit in range(self.n_flags))
+
+    def compile(self):
+        card_type = self.card_type
+        kinds = [card_type._from_kind(kind) for kind in range(self._kinds)]
+        flags = [self._flags(state) for state in range(self._states)]
+        rule = self.rule
+        self._table = bytes(bool(rule(card, top_card, *state))
+                            for card in kinds for top_card in kinds
+                            for state in flags)
+        return self
+
+    def kind(self, card):
+        return ((card.rank * self._suits + card.suit) * 2
+                + getattr(card, self._flag))
+
+    def allows(self, card, top_card, state=0):
+        table = self._table or self.compile()._table
+        suits = self._suits
+        flag = self._flag
+        try:
+            index = ((((card.rank * suits + card.suit) * 2
+                       + getattr(card, flag)) * self._kinds
+                      + (top_card.rank * suits + top_card.suit) * 2
+                      + getattr(top_card, flag)) * self._states + state)
+        except TypeError:
+            # Cards without a rank or suit have no kind
+            return bool(self.rule(card, top_card, *self._flags(state)))
+        return table[index] == 1  # type: ignore
+
+    def playable(self, cards, top_card, state=0):
+        try:
+            offset = self.kind(top_card) * self._states + state
+        except TypeError:
+            return [card for card in cards
+                    if self.allows(card, top_card, state)]
+        table = self._table or self.compile()._table
+        suits = self._suits
+        flag = self._flag
+        stride = self._kinds * self._states
+        result = []
+        for card in cards:
+            try:
+                index = ((card.rank * suits + card.suit) * 2
+                         + getattr(card, flag)) * stride + offset
+            except TypeError:
+                if self.allows(card, top_card, state):
+                    result.append(card)
+                continue
+            if table[index]:  # type: ignore
+                result.append(card)
+        return result
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}("
+                f"card_type={self.card_type!r}, "
+                f"rule={self.rule!r}, "
+                f"n_flags={self.n_flags!r})")
@@ -0,0 +1,105 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from typing import (Callable, Generic, Iterable, List, Optional, Tuple, Type,
+                    TypeVar)
+
+from .base import GenericCard
+
+_CardT = TypeVar("_CardT", bound=GenericCard)
+
+
+class RuleTable(Generic[_CardT]):
+    """
+    A play rule compiled into a lookup table. The rule must be a pure function
+    of the card to play, the top card, and a number of boolean state flags,
+    and it may only depend on the attributes that make up a card's kind: its
+    rank, its suit and the flag named by `card_type._kind_flag`. The table
+    holds the result of the rule for every pair of card kinds and every
+    combination of flags, so checking a play is a single indexed lookup that
+    costs the same however expensive the rule is.
+    :param card_type: The card class whose kinds the table covers.
+    :param rule: The rule, called as `rule(card, top_card, *flags)`.
+    :param n_flags: The number of boolean state flags the rule takes.
+    """
+    __slots__ = ("card_type", "rule", "n_flags", "_flag", "_suits", "_kinds",
+                 "_states", "_table")
+
+    def __init__(self, card_type: Type[_CardT],
+                 rule: Callable[..., bool],
+                 n_flags: int = 0) -> None:
+        """
+        Creates a new rule table. The table is compiled on first use.
+        :param card_type: The card class whose kinds the table covers.
+        :param rule: The rule, called as `rule(card, top_card, *flags)`.
+        :param n_flags: The number of boolean state flags the rule takes.
+        :raise ValueError: If `n_flags` is negative.
+        """
+        self.card_type: Type[_CardT] = ...
+        self.rule: Callable[..., bool] = ...
+        self.n_flags: int = ...
+        self._flag: str = ...
+        self._suits: int = ...
+        self._kinds: int = ...
+        self._states: int = ...
+        self._table: Optional[bytes] = ...
+
+    def _flags(self, state: int) -> Tuple[bool, ...]:
+        """
+        Decodes a state bitmask into the flags passed to the rule.
+        :param state: The state bitmask.
+        :return: The flags, starting with the lowest bit.
+        """
+
+    def compile(self) -> RuleTable[_CardT]:
+        """
+        Evaluates the rule for every pair of card kinds and every state.
+        :return: The rule table.
+        """
+
+    def kind(self, card: _CardT) -> int:
+        """
+        Computes the index of a card's kind in the table.
+        :param card: The card.
+        :return: The kind index.
+        :raise TypeError: If the card has no rank or suit.
+        """
+
+    def allows(self, card: _CardT, top_card: _CardT, state: int = 0) -> bool:
+        """
+        Checks whether a card can be played on top of another card. Cards
+        without a rank or suit are checked by calling the rule directly.
+        :param card: The card to be played.
+        :param top_card: The card on top of the pile.
+        :param state: The state flags as a bitmask, where bit `i` is the
+            `i`-th flag passed to the rule.
+        :return: `True` if the play is valid; otherwise, `False`.
+        """
+
+    def playable(self, cards: Iterable[_CardT], top_card: _CardT,
+                 state: int = 0) -> List[_CardT]:
+        """
+        Filters the cards that can be played on top of another card. The top
+        card's part of the index is only computed once.
+        :param cards: The cards to check, e.g. a player's hand.
+        :param top_card: The card on top of the pile.
+        :param state: The state flags as a bitmask.
+        :return: The playable cards, in their original order.
+        """
+
+    def __repr__(self) -> str: ...
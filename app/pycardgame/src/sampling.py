@@ -0,0 +1,142 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from collections import Counter
+
+from .presets import _WILD_RANKS, UnoDeck, UnoGame
+from .seeding import make_rng
+
+
+def _own(card):
+    # Only wild cards change during a game, so all other cards are shared
+    # between the game and its samples
+    return card.__copy__() if card.rank in _WILD_RANKS else card
+
+
+class Determinizer:
+    __slots__ = ("game", "player", "seat", "_prototypes", "_pool", "_known",
+                 "_sizes", "_n_draw", "_rng")
+
+    def __init__(self, game, player=None, tracker=None, known=None,
+                 seed=None):
+        if player is None:
+            player = game.get_current_player()
+        self.game = game
+        self.player = player
+        self.seat = next(i for i, p in enumerate(game.players)
+                         if p is player)
+        self._rng = make_rng(seed)
+        # The sampled cards are private copies, the deck's prototype cards
+        # are shared by every new deck and must never leave it
+        self._prototypes = {}
+        composition = Counter()
+        for card in game._deck_type._get_prototype():
+            key = card.kind_key()
+            if key not in composition:
+                self._prototypes[key] = card.__copy__()
+            composition[key] += 1
+
+        if tracker is not None:
+            unseen = tracker.unseen(player)
+        else:
+            unseen = (composition
+                      - Counter(c.kind_key() for c in game.discard_pile.cards)
+                      - Counter(c.kind_key() for c in player.hand))
+
+        # Cards known to be in an opponent's hand are not dealt at random
+        self._known = {}
+        for seat, cards in (known or {}).items():
+            if seat == self.seat:
+                raise ValueError("The observer's hand is already known")
+            keys = [card.kind_key() for card in cards]
+            for key in keys:
+                if unseen[key] <= 0:
+                    raise ValueError(f"Known card is not unseen: {key}")
+                unseen[key] -= 1
+            self._known[seat] = keys
+
+        self._pool = list(unseen.elements())
+        self._sizes = []
+        for seat, opponent in enumerate(game.players):
+            if seat == self.seat:
+                continue
+            size = len(opponent.hand) - len(self._known.get(seat, ()))
+            if size < 0:
+                raise ValueError(f"More known cards than cards in hand: "
+                                 f"{opponent.name}")
+            self._sizes.append((seat, size))
+        self._n_draw = len(game.draw_pile)
+        if sum(size for _, size in self._sizes) + self._n_draw != len(
+                self._pool):
+            raise ValueError("The unseen cards do not match the hidden "
+                             "cards of the game")
+
+    def sample_keys(self, n=1):
+        pool = self._pool
+        known = self._known
+        shuffle = self._rng.shuffle
+        samples = []
+        for _ in range(n):
+            shuffle(pool)
+            hands = {}
+            start = 0
+            for seat, size in self._sizes:
+                hands[seat] = known.get(seat, []) + pool[start:start + size]
+                start += size
+            samples.append((hands, pool[start:]))
+        return samples
+
+    def sample_hands(self, n=1):
+        prototypes = self._prototypes
+        return [({seat: [prototypes[key] for key in keys]
+                  for seat, keys in hands.items()},
+                 [prototypes[key] for key in draw_pile])
+                for hands, draw_pile in self.sample_keys(n)]
+
+    def _build(self, hands, draw_pile):
+        game = self.game
+        prototypes = self._prototypes
+        players = []
+        for seat, player in enumerate(game.players):
+            if seat == self.seat:
+                hand = [_own(card) for card in player.hand]
+            else:
+                hand = [_own(prototypes[key]) for key in hands[seat]]
+            copy = player.__class__(player.name, hand)
+            copy.score = player.score
+            copy.uno = getattr(player, "uno", False)
+            players.append(copy)
+        draw = UnoDeck(cards=[_own(prototypes[key]) for key in draw_pile])
+        state = UnoGame(*players, draw_pile=draw, discard_pile=UnoDeck(
+            cards=[_own(card) for card in game.discard_pile.cards]),
+            hand_size=game.hand_size)
+        # An empty draw pile would have been replaced by a new deck
+        state.draw_pile = draw
+        state.current_player_index = game.current_player_index
+        state.direction = game.direction
+        state.draw_count = game.draw_count
+        state.game_ended = game.game_ended
+        return state
+
+    def sample(self, n=1):
+        return [self._build(hands, draw_pile)
+                for hands, draw_pile in self.sample_keys(n)]
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(player={self.player.name!r}, "
+                f"unseen={len(self._pool)})")
@@ -0,0 +1,120 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .presets import UnoCard, UnoGame, UnoPlayer
+from .seeding import T_Seed
+from .tracking import CardTracker
+
+T_Key = Tuple[Optional[int], Optional[int]]
+
+
+def _own(card: UnoCard) -> UnoCard:
+    """
+    Returns a card for a sampled state: a copy of a wild card, whose suit
+    changes when it is played, or the card itself otherwise.
+    :param card: The card.
+    :return: The card to put into the sampled state.
+    """
+
+
+class Determinizer:
+    """
+    Samples full states of an `UnoGame` that are consistent with what one
+    player knows: the player's own hand, the discard pile, the number of
+    cards in every opponent's hand and in the draw pile, and cards known to
+    be in an opponent's hand. Every sample deals the unseen cards at random:
+    the pool of unseen cards is shuffled once and cut into the opponents'
+    hands and the draw pile, so every sample is accepted and costs a single
+    shuffle.
+    :param game: The game to sample states of.
+    :param player: The observing player. Default is the current player.
+    :param tracker: A `CardTracker` of the game to take the unseen cards
+        from. If omitted, they are computed from the game's deck.
+    :param known: Cards known to be in opponents' hands, by seat index.
+    :param seed: The seed of the sampler's random number generator.
+    """
+    __slots__ = ("game", "player", "seat", "_prototypes", "_pool", "_known",
+                 "_sizes", "_n_draw", "_rng")
+
+    def __init__(self, game: UnoGame, player: Optional[UnoPlayer] = None,
+                 tracker: Optional[CardTracker] = None,
+                 known: Optional[Mapping[int, Iterable[UnoCard]]] = None,
+                 seed: Optional[T_Seed] = None) -> None:
+        """
+        Creates a sampler for the current state of a game. The sampler does
+        not follow later changes to the game.
+        :param game: The game to sample states of.
+        :param player: The observing player. Default is the current player.
+        :param tracker: A `CardTracker` of the game to take the unseen cards
+            from. If omitted, they are computed from the game's deck.
+        :param known: Cards known to be in opponents' hands, by seat index.
+        :param seed: The seed of the sampler's random number generator.
+        :raise ValueError: If the known cards include the observer's seat,
+            are not unseen, or exceed an opponent's hand, or if the unseen
+            cards do not add up to the hidden cards of the game.
+        """
+        self.game: UnoGame = ...
+        self.player: UnoPlayer = ...
+        self.seat: int = ...
+        self._prototypes: Dict[T_Key, UnoCard] = ...
+        self._pool: List[T_Key] = ...
+        self._known: Dict[int, List[T_Key]] = ...
+        self._sizes: List[Tuple[int, int]] = ...
+        self._n_draw: int = ...
+        self._rng: Any = ...
+
+    def sample_keys(self, n: int = 1
+                    ) -> List[Tuple[Dict[int, List[T_Key]], List[T_Key]]]:
+        """
+        Samples the hidden cards as kind keys, the cheapest representation.
+        :param n: The number of samples.
+        :return: For every sample, the opponents' hands by seat index and the
+            draw pile from top to bottom.
+        """
+
+    def sample_hands(self, n: int = 1
+                     ) -> List[Tuple[Dict[int, List[UnoCard]], List[UnoCard]]]:
+        """
+        Samples the hidden cards as cards. The cards are copies owned by the
+        sampler, shared between its samples, and must not be changed.
+        :param n: The number of samples.
+        :return: For every sample, the opponents' hands by seat index and the
+            draw pile from top to bottom.
+        """
+
+    def _build(self, hands: Dict[int, List[T_Key]],
+               draw_pile: List[T_Key]) -> UnoGame:
+        """
+        Builds a game from sampled hidden cards and the known state.
+        :param hands: The opponents' hands by seat index.
+        :param draw_pile: The draw pile from top to bottom.
+        :return: The new game.
+        """
+
+    def sample(self, n: int = 1) -> List[UnoGame]:
+        """
+        Samples full game states. Every state is an independent `UnoGame` with
+        new players, which can be played on without affecting the original
+        game.
+        :param n: The number of samples.
+        :return: The sampled games.
+        """
+
+    def __repr__(self) -> str: ...
@@ -0,0 +1,231 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+from __future__ import annotations
+
+import pickle
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from math import log, sqrt
+
+from .agents import Agent, CALLABLE_SUITS
+from .sampling import Determinizer
+from .seeding import make_rng, SeedSequence
+
+
+def _actions(game):
+    # One action for each kind of playable card and called suit, then drawing
+    cards = {}
+    actions = []
+    for card in game.get_playable_cards():
+        kind = card.kind_key()
+        if kind in cards:
+            continue
+        cards[kind] = card
+        if card.wild:
+            actions.extend((kind, suit) for suit in CALLABLE_SUITS)
+        else:
+            actions.append((kind, None))
+    actions.append(None)
+    return actions, cards
+
+
+def _values(game, winner):
+    if winner is not None:
+        return [float(player is winner) for player in game.players]
+    # Unfinished games are scored by hand size
+    weights = [1.0 / (1 + len(player.hand)) for player in game.players]
+    total = sum(weights)
+    return [weight / total for weight in weights]
+
+
+def _rollout(game, rng, max_turns):
+    winner = None
+    for _ in range(max_turns):
+        if winner is not None:
+            break
+        playable = game.get_playable_cards()
+        card = rng.choice(playable) if playable else None
+        suit = rng.choice(CALLABLE_SUITS) if card is not None and \
+            card.wild else None
+        winner = game.play_turn(card, suit).winner
+    return _values(game, winner)
+
+
+class _Node:
+    __slots__ = ("seat", "children", "visits", "reward", "available")
+
+    def __init__(self, seat):
+        self.seat = seat
+        self.children = {}
+        self.visits = 0
+        self.reward = 0.0
+        self.available = 0
+
+
+def _search(payload, seed, iterations, deadline, exploration, rollout_turns,
+            only=None):
+    root_state = pickle.loads(payload)
+    rng = make_rng(seed)
+    sampler = Determinizer(root_state, seed=rng)
+    root = _Node(None)
+    done = 0
+    while done < 1 or ((iterations is None or done < iterations) and
+                       (deadline is None or time.time() < deadline)):
+        state = sampler.sample()[0]
+        state.draw_pile.set_seed(rng)
+        state.discard_pile.set_seed(rng)
+        node = root
+        path = []
+        winner = None
+        while winner is None:
+            actions, cards = _actions(state)
+            if node is root and only is not None:
+                actions = [a for a in actions if a is not None and
+                           a[0] == only]
+            untried = [a for a in actions if a not in node.children]
+            for action in actions:
+                if action in node.children:
+                    node.children[action].available += 1
+            if untried:
+                action = rng.choice(untried)
+                child = node.children[action] = _Node(
+                    state.current_player_index)
+                child.available += 1
+            else:
+                # UCB over the actions that are legal in this determinization
+                children = node.children
+                action = max(actions, key=lambda a: (
+                    children[a].reward / children[a].visits +
+                    exploration * sqrt(log(children[a].available) /
+                                       children[a].visits)))
+                child = children[action]
+            card, suit = (None, None) if action is None else \
+                (cards[action[0]], action[1])
+            winner = state.play_turn(card, suit).winner
+            path.append(child)
+            node = child
+            if untried:
+                break
+
+        values = _values(state, winner) if winner is not None else \
+            _rollout(state, rng, rollout_turns)
+        for node in path:
+            node.visits += 1
+            node.reward += values[node.seat]
+        done += 1
+    return {action: child.visits for action, child in root.children.items()}
+
+
+class MCTSAgent(Agent):
+    def __init__(self, iterations=1000, time_limit=None, trees=1, workers=0,
+                 exploration=0.7, rollout_turns=50, seed=None):
+        if iterations is None and time_limit is None:
+            raise ValueError("Either iterations or time_limit must be given")
+        if trees < 1:
+            raise ValueError(f"Invalid number of trees: {trees}")
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.trees = trees
+        self.workers = workers
+        self.exploration = exploration
+        self.rollout_turns = rollout_turns
+        self.visits = Counter()
+        self.seed_sequence = None
+        self._searches = 0
+        self._suits = {}
+        self._executor = None
+        self.set_seed(seed)
+
+    def set_seed(self, seed):
+        self.seed_sequence = seed if isinstance(seed, SeedSequence) \
+            else SeedSequence(seed)
+        self._searches = 0
+        return self
+
+    def _root(self, game):
+        # The search only sees what the current player sees, and the sampled
+        # root is sent to the workers without its unpicklable generators
+        state = Determinizer(game, seed=0).sample()[0]
+        state.rng = state.draw_pile._rng = state.discard_pile._rng = None
+        return pickle.dumps(state)
+
+    def search(self, game, only=None):
+        deadline = time.time() + self.time_limit \
+            if self.time_limit is not None else None
+        payload = self._root(game)
+        tasks = [(payload, self.seed_sequence.child(self._searches, tree),
+                  self.iterations, deadline, self.exploration,
+                  self.rollout_turns, only) for tree in range(self.trees)]
+        self._searches += 1
+        if self.workers == 0:
+            results = [_search(*task) for task in tasks]
+        else:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(self.workers)
+            futures = [self._executor.submit(_search, *task)
+                       for task in tasks]
+            results = [future.result() for future in futures]
+
+        # Root parallelization: the trees are merged by their visit counts
+        visits = Counter()
+        for result in results:
+            visits.update(result)
+        self.visits = visits
+        actions = [action for action in _actions(game)[0]
+                   if only is None or action is not None and
+                   action[0] == only]
+        return max(actions, key=lambda action: visits[action])
+
+    def _decide(self, decision):
+        table = decision.table
+        if decision.kind == "suit":
+            suit = self._suits.pop(id(table), None)
+            if suit is None:
+                suit = self.search(table.game, table._card.kind_key())[1]
+            return suit
+        action = self.search(table.game)
+        if action is None:
+            return None
+        card = next(card for card in decision.options
+                    if card is not None and card.kind_key() == action[0])
+        if action[1] is not None:
+            self._suits[id(table)] = action[1]
+        return card
+
+    def decide(self, decisions):
+        return [self._decide(decision) for decision in decisions]
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        return self
+
+    def __getstate__(self):
+        # Worker processes stay with the agent that started them
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}("
+                f"iterations={self.iterations!r}, "
+                f"time_limit={self.time_limit!r}, "
+                f"trees={self.trees!r}, "
+                f"workers={self.workers!r})")
@@ -0,0 +1,218 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+from __future__ import annotations
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Counter, Dict, List, Optional, Sequence, Tuple
+
+from .agents import Agent, Decision, T_Choice
+from .base import GenericPlayer
+from .presets import T_UnoSuitsWild, UnoCard, UnoGame
+from .seeding import SeedSequence, T_Seed
+from .tracking import T_Key
+
+T_Action = Optional[Tuple[T_Key, Optional[T_UnoSuitsWild]]]
+
+
+def _actions(game: UnoGame) -> Tuple[List[T_Action], Dict[T_Key, UnoCard]]:
+    """
+    Lists the actions of the current player: one for each kind of playable
+    card, one for each callable suit of a playable wild card, and None for
+    drawing.
+    :param game: The game.
+    :return: The actions, and a playable card of each kind.
+    """
+
+
+def _values(game: UnoGame,
+            winner: Optional[GenericPlayer[UnoCard]]) -> List[float]:
+    """
+    Scores a game for every seat. A winner scores 1 and everyone else 0. An
+    unfinished game splits 1 between the seats in inverse proportion to one
+    more than their hand sizes.
+    :param game: The game.
+    :param winner: The winner, if the game is over.
+    :return: The values for every seat.
+    """
+
+
+def _rollout(game: UnoGame, rng: random.Random,
+             max_turns: int) -> List[float]:
+    """
+    Plays random playable cards, drawing only if none can be played, until
+    the game ends or `max_turns` turns have passed.
+    :param game: The game, which is changed.
+    :param rng: The random number generator.
+    :param max_turns: The maximum number of turns.
+    :return: The values for every seat.
+    """
+
+
+class _Node:
+    """
+    A node of a search tree, reached by an action of the player in `seat`.
+    `available` counts the iterations in which the action was legal.
+    """
+    __slots__ = ("seat", "children", "visits", "reward", "available")
+
+    def __init__(self, seat: Optional[int]) -> None:
+        self.seat: Optional[int] = ...
+        self.children: Dict[T_Action, _Node] = ...
+        self.visits: int = ...
+        self.reward: float = ...
+        self.available: int = ...
+
+
+def _search(payload: bytes, seed: T_Seed, iterations: Optional[int],
+            deadline: Optional[float], exploration: float,
+            rollout_turns: int,
+            only: Optional[T_Key] = None) -> Dict[T_Action, int]:
+    """
+    Builds one search tree for the current player of a pickled game. Each
+    iteration samples the hidden cards with a `Determinizer`, descends the
+    tree by UCB over the actions legal in that sample, adds one node and
+    finishes the game with a random rollout (single-observer information set
+    MCTS). Runs in worker processes, so it only takes picklable arguments.
+    :param payload: The pickled game.
+    :param seed: The seed of the tree.
+    :param iterations: The maximum number of iterations, or None.
+    :param deadline: The `time.time()` at which to stop, or None.
+    :param exploration: The UCB exploration constant.
+    :param rollout_turns: The maximum number of turns of a rollout.
+    :param only: Restricts the root to actions with this card kind, e.g.
+        to call a suit for a wild card that was already chosen.
+    :return: The visit counts of the root's actions.
+    """
+
+
+class MCTSAgent(Agent):
+    """
+    A UNO agent that searches with Monte Carlo tree search. The agent only
+    uses what its player can see: hidden hands and the draw pile are sampled
+    again in every iteration.
+
+    With more than one tree, the search is root-parallel: the trees are built
+    independently from the same pickled root state and merged by summing the
+    visit counts of the root's actions. With `workers` > 0, the trees are
+    built in a pool of worker processes that the agent keeps between
+    decisions; with `workers` = 0, they are built one after the other in the
+    calling process. Tree `i` of the agent's `n`th search is seeded with
+    `seed_sequence.child(n, i)`, so a search with an iteration budget gives
+    the same result in and out of process. A time budget is shared by all
+    trees as an absolute deadline, and every tree completes at least one
+    iteration.
+    :param iterations: The number of iterations per tree, or None for no
+        limit.
+    :param time_limit: The time budget of a search in seconds, or None for no
+        limit.
+    :param trees: The number of trees.
+    :param workers: The number of worker processes, or 0 to search in the
+        calling process. None uses the number of CPUs.
+    :param exploration: The UCB exploration constant.
+    :param rollout_turns: The maximum number of turns of a rollout, after
+        which the game is scored by hand size.
+    :param seed: The seed of the search.
+    :raise ValueError: If neither `iterations` nor `time_limit` is given, or
+        `trees` is less than 1.
+    """
+
+    def __init__(self, iterations: Optional[int] = 1000,
+                 time_limit: Optional[float] = None, trees: int = 1,
+                 workers: Optional[int] = 0, exploration: float = 0.7,
+                 rollout_turns: int = 50,
+                 seed: Optional[T_Seed] = None) -> None:
+        """
+        Creates a new search agent.
+        :param iterations: The number of iterations per tree, or None for no
+            limit.
+        :param time_limit: The time budget of a search in seconds, or None
+            for no limit.
+        :param trees: The number of trees.
+        :param workers: The number of worker processes, or 0 to search in the
+            calling process. None uses the number of CPUs.
+        :param exploration: The UCB exploration constant.
+        :param rollout_turns: The maximum number of turns of a rollout.
+        :param seed: The seed of the search.
+        :raise ValueError: If neither `iterations` nor `time_limit` is given,
+            or `trees` is less than 1.
+        """
+        self.iterations: Optional[int] = ...
+        self.time_limit: Optional[float] = ...
+        self.trees: int = ...
+        self.workers: Optional[int] = ...
+        self.exploration: float = ...
+        self.rollout_turns: int = ...
+        self.visits: Counter[T_Action] = ...
+        self.seed_sequence: SeedSequence = ...
+        self._searches: int = ...
+        self._suits: Dict[int, T_UnoSuitsWild] = ...
+        self._executor: Optional[ProcessPoolExecutor] = ...
+
+    def set_seed(self, seed: T_Seed) -> MCTSAgent:
+        """
+        Reseeds the search and restarts the count of searches.
+        :param seed: The new seed. A random one is used if omitted.
+        :return: The agent instance.
+        """
+
+    def _root(self, game: UnoGame) -> bytes:
+        """
+        Pickles the root state of a search: a sample of the game as the
+        current player sees it, without random number generators.
+        :param game: The game.
+        :return: The pickled state.
+        """
+
+    def search(self, game: UnoGame, only: Optional[T_Key] = None) -> T_Action:
+        """
+        Searches the best action of the current player and stores the merged
+        visit counts in `visits`.
+        :param game: The game, which is not changed.
+        :param only: Restricts the search to actions with this card kind.
+        :return: The action with the most visits.
+        """
+
+    def _decide(self, decision: Decision) -> T_Choice:
+        """
+        Makes one decision. The suit for a wild card is remembered from the
+        search that chose the card, and searched for otherwise.
+        :param decision: The decision.
+        :return: The chosen option.
+        """
+
+    def decide(self, decisions: Sequence[Decision]) -> List[T_Choice]:
+        """
+        Searches every decision in turn.
+        :param decisions: The pending decisions.
+        :return: The chosen options, in the same order.
+        """
+
+    def close(self) -> MCTSAgent:
+        """
+        Shuts the worker processes down. They are started again when needed.
+        :return: The agent instance.
+        """
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Returns the state for pickling, without the worker processes.
+        :return: The state.
+        """
+
+    def __repr__(self) -> str: ...
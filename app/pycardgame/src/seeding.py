@@ -0,0 +1,79 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import hashlib
+import random
+import secrets
+
+
+def _check_key(value, name):
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ValueError(f"Invalid {name}: must be a non-negative integer")
+    return value
+
+
+class SeedSequence:
+    __slots__ = ("entropy", "spawn_key", "n_children_spawned")
+
+    def __init__(self, entropy=None, spawn_key=()):
+        if entropy is None:
+            entropy = secrets.randbits(128)
+        self.entropy = _check_key(entropy, "entropy")
+        self.spawn_key = tuple(_check_key(key, "spawn key")
+                               for key in spawn_key)
+        self.n_children_spawned = 0
+
+    def child(self, *key):
+        return self.__class__(self.entropy, self.spawn_key + key)
+
+    def spawn(self, n):
+        start = self.n_children_spawned
+        self.n_children_spawned += n
+        return [self.child(i) for i in range(start, start + n)]
+
+    def generate_state(self):
+        digest = hashlib.blake2b(
+            repr((self.entropy, self.spawn_key)).encode("ascii"),
+            digest_size=32, person=b"pycardgame").digest()
+        return int.from_bytes(digest, "big")
+
+    def random(self):
+        return random.Random(self.generate_state())
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(entropy={self.entropy!r}, "
+                f"spawn_key={self.spawn_key!r})")
+
+    def __eq__(self, other):
+        if not isinstance(other, SeedSequence):
+            return NotImplemented
+        return (self.entropy == other.entropy and
+                self.spawn_key == other.spawn_key)
+
+    def __hash__(self):
+        return hash((self.entropy, self.spawn_key))
+
+
+def make_rng(seed=None):
+    if seed is None:
+        return random
+    if isinstance(seed, random.Random):
+        return seed
+    if isinstance(seed, SeedSequence):
+        return seed.random()
+    return random.Random(seed)
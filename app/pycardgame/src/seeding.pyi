@@ -0,0 +1,103 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import random
+from types import ModuleType
+from typing import Iterable, List, Optional, overload, Tuple, Union
+
+T_Seed = Union[int, float, str, bytes, bytearray, "SeedSequence",
+               random.Random]
+
+
+def _check_key(value: int, name: str) -> int: ...
+
+
+class SeedSequence:
+    """
+    A hierarchy of seeds derived from a single root seed. Every node of the
+    hierarchy is identified by the root entropy and its spawn key, the path of
+    child indices that leads to it. The seed of a node is a hash of both, so
+    the random number generators of different nodes are independent, and the
+    seed of a node does not depend on the order in which nodes are created.
+    :param entropy: The root seed. If omitted, fresh entropy is drawn from the
+        operating system.
+    :param spawn_key: The path of child indices from the root to this node.
+    """
+    __slots__ = ("entropy", "spawn_key", "n_children_spawned")
+
+    def __init__(self, entropy: Optional[int] = None,
+                 spawn_key: Iterable[int] = ()) -> None:
+        """
+        Creates a new seed sequence.
+        :param entropy: The root seed. If omitted, fresh entropy is drawn from
+            the operating system.
+        :param spawn_key: The path of child indices from the root to this node.
+        :raise ValueError: If the entropy or a spawn key is not a non-negative
+            integer.
+        """
+        self.entropy: int = ...
+        self.spawn_key: Tuple[int, ...] = ...
+        self.n_children_spawned: int = ...
+
+    def child(self, *key: int) -> SeedSequence:
+        """
+        Returns the descendant with the given relative spawn key, e.g.,
+        `root.child(worker, table)`. Unlike `spawn()`, this does not depend on
+        how many children were created before.
+        :param key: The child indices below this node.
+        :return: The descendant seed sequence.
+        :raise ValueError: If a key is not a non-negative integer.
+        """
+
+    def spawn(self, n: int) -> List[SeedSequence]:
+        """
+        Creates the next `n` children of this node.
+        :param n: The number of children to create.
+        :return: The new child seed sequences.
+        """
+
+    def generate_state(self) -> int:
+        """
+        Returns the 256-bit seed of this node.
+        :return: The seed as an integer.
+        """
+
+    def random(self) -> random.Random:
+        """
+        Creates a new random number generator seeded with this node's state.
+        :return: The random number generator.
+        """
+
+    def __eq__(self, other: object) -> bool: ...
+
+    def __hash__(self) -> int: ...
+
+
+@overload
+def make_rng(seed: None = None) -> ModuleType:
+    """
+    Creates a random number generator for the given seed.
+    :param seed: The seed. If `None`, the global generator of the `random`
+        module is returned. A `random.Random` instance is returned unchanged,
+        and a `SeedSequence` creates a generator for its node.
+    :return: The random number generator.
+    """
+
+
+@overload
+def make_rng(seed: T_Seed) -> random.Random: ...
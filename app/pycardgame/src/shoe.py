@@ -0,0 +1,210 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from collections import Counter
+
+from .base import _hypergeometric_tail
+from .seeding import make_rng
+
+
+class Shoe:
+    __slots__ = ("deck_type", "decks", "_flag", "_kinds", "_index", "_per_deck",
+                 "_counts", "_tree", "_size", "_rng")
+
+    def __init__(self, deck_type, decks=1, seed=None):
+        if decks < 1:
+            raise ValueError(f"Invalid number of decks: {decks}")
+        self.deck_type = deck_type
+        self.decks = decks
+        self._flag = deck_type._card_type._kind_flag
+        self._index = {}
+        kinds = []
+        per_deck = []
+        for card in deck_type._get_prototype():
+            key = self._key(card)
+            if key not in self._index:
+                self._index[key] = len(kinds)
+                kinds.append(card)
+                per_deck.append(0)
+            per_deck[self._index[key]] += 1
+        self._kinds = tuple(kinds)
+        self._per_deck = tuple(per_deck)
+        self._rng = make_rng(seed)
+        self.reset()
+
+    def _key(self, card):
+        # Cards are mutable and thus unhashable, so kinds are keyed by the
+        # attributes that card equality compares
+        return card.rank, card.suit, card.trump, getattr(card, self._flag)
+
+    def _build_tree(self):
+        # Fenwick tree over the remaining counts, so that a weighted draw and
+        # an update both take O(log k) steps for k card kinds
+        counts = self._counts
+        tree = [0] + counts
+        size = len(tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _update(self, kind, delta):
+        self._counts[kind] += delta
+        self._size += delta
+        tree = self._tree
+        size = len(tree)
+        i = kind + 1
+        while i < size:
+            tree[i] += delta
+            i += i & -i
+
+    def _find(self, target):
+        # Returns the kind that holds the card at the given position
+        tree = self._tree
+        position = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = position + step
+            if nxt < len(tree) and tree[nxt] <= target:
+                position = nxt
+                target -= tree[nxt]
+            step >>= 1
+        return position
+
+    def reset(self):
+        decks = self.decks
+        self._counts = [n * decks for n in self._per_deck]
+        self._size = sum(self._counts)
+        self._build_tree()
+        return self
+
+    def set_seed(self, seed):
+        self._rng = make_rng(seed)
+        return self
+
+    def shuffle(self, seed=None):
+        if seed is not None:
+            self._rng.seed(seed)
+        return self
+
+    def draw(self, n=1):
+        if n < 1 or n > self._size:
+            raise ValueError(f"Cannot draw {n} cards: number of cards to draw "
+                             f"must be between 1 and {self._size}")
+        randrange = self._rng.randrange
+        kinds = self._kinds
+        drawn = []
+        for _ in range(n):
+            kind = self._find(randrange(self._size))
+            self._update(kind, -1)
+            drawn.append(kinds[kind].__copy__())
+        return drawn[0] if n == 1 else drawn
+
+    def _kind(self, card):
+        if not isinstance(card, self.deck_type._card_type):
+            raise TypeError("Invalid card type: must be a Card object")
+        try:
+            return self._index[self._key(card)]
+        except KeyError:
+            raise ValueError(f"Card not in shoe: {card!r}") from None
+
+    def add(self, *cards):
+        kinds = [self._kind(card) for card in cards]
+        for kind in kinds:
+            self._update(kind, 1)
+        return self
+
+    def remove(self, *cards):
+        kinds = Counter(self._kind(card) for card in cards)
+        for kind, n in kinds.items():
+            if self._counts[kind] < n:
+                raise ValueError(f"Card not in shoe: {self._kinds[kind]!r}")
+        for kind, n in kinds.items():
+            self._update(kind, -n)
+        return self
+
+    def clear(self):
+        self._counts = [0] * len(self._kinds)
+        self._size = 0
+        self._build_tree()
+        return self
+
+    def count(self, card):
+        card_type = self.deck_type._card_type
+        if isinstance(card, card_type):
+            index = self._index.get(self._key(card))
+            return 0 if index is None else self._counts[index]
+        elif isinstance(card, str):
+            if card in card_type.RANKS:
+                attribute, value = "rank", card_type.RANKS.index(card)
+            elif card in card_type.SUITS:
+                attribute, value = "suit", card_type.SUITS.index(card)
+            else:
+                raise ValueError(
+                    "Invalid card name: must be a rank or suit name")
+            return sum(n for kind, n in zip(self._kinds, self._counts)
+                       if getattr(kind, attribute) == value)
+        else:
+            raise TypeError(
+                "Invalid card type: must be a Card object, a suit, or a rank")
+
+    def draw_probability(self, card, n=1, k=1):
+        if n < 0 or n > self._size:
+            raise ValueError(f"Invalid number of draws: {n} (must be between "
+                             f"0 and {self._size})")
+        if k < 0:
+            raise ValueError(f"Invalid number of cards: {k}")
+        return _hypergeometric_tail(self._size, self.count(card), n, k)
+
+    def get_counts(self):
+        return [(card.__copy__(), n)
+                for card, n in zip(self._kinds, self._counts) if n]
+
+    def _kind_counts(self):
+        return [(card.kind_key(), n)
+                for card, n in zip(self._kinds, self._counts) if n]
+
+    def get_cards(self):
+        return [card.__copy__() for card, n in zip(self._kinds, self._counts)
+                for _ in range(n)]
+
+    def to_deck(self):
+        cards = self.get_cards()
+        self._rng.shuffle(cards)
+        return self.deck_type(cards=cards)
+
+    def __str__(self):
+        return f"Shoe of {self.decks} decks with {self._size} cards."
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}("
+                f"deck_type={self.deck_type.__name__}, decks={self.decks}, "
+                f"cards={self._size})")
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __contains__(self, item):
+        if not isinstance(item, self.deck_type._card_type):
+            return False
+        index = self._index.get(self._key(item))
+        return index is not None and self._counts[index] > 0
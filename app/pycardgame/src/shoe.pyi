@@ -0,0 +1,231 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from typing import (Any, Dict, Generic, List, Literal, Optional, overload,
+                    Tuple, Type, TypeVar, Union)
+
+from .base import GenericDeck
+from .seeding import T_Seed
+
+_DeckT = TypeVar("_DeckT", bound=GenericDeck)
+
+
+class Shoe(Generic[_DeckT]):
+    """
+    A shoe of several copies of a deck, as used in casino games. Instead of
+    card objects, the shoe stores how many cards of each kind remain, so
+    building and resetting a shoe costs the same however many decks it
+    combines. A draw picks a card with probability proportional to the
+    remaining count of its kind, which gives the same distribution as drawing
+    from the top of a shuffled deck, and creates the card object only then.
+    :param deck_type: The deck class to combine copies of.
+    :param decks: The number of decks in the shoe.
+    :param seed: The seed of the shoe's random number generator.
+    """
+    __slots__ = ("deck_type", "decks", "_flag", "_kinds", "_index", "_per_deck",
+                 "_counts", "_tree", "_size", "_rng")
+
+    def __init__(self, deck_type: Type[_DeckT], decks: int = 1,
+                 seed: Optional[T_Seed] = None) -> None:
+        """
+        Creates a new shoe holding `decks` full copies of the deck.
+        :param deck_type: The deck class to combine copies of.
+        :param decks: The number of decks in the shoe.
+        :param seed: The seed of the shoe's random number generator, e.g., an
+            integer or a `SeedSequence`. If omitted, the shoe uses the global
+            generator of the `random` module.
+        :raise ValueError: If `decks` is less than 1.
+        """
+        self.deck_type: Type[_DeckT] = ...
+        self.decks: int = ...
+        self._flag: str = ...
+        self._kinds: Tuple[Any, ...] = ...
+        self._index: Dict[Tuple[Any, ...], int] = ...
+        self._per_deck: Tuple[int, ...] = ...
+        self._counts: List[int] = ...
+        self._tree: List[int] = ...
+        self._size: int = ...
+        self._rng: Any = ...
+
+    def _key(self, card: Any) -> Tuple[Any, ...]:
+        """
+        Returns the key of a card's kind.
+        :param card: The card.
+        :return: The card's rank, suit, trump status and kind flag.
+        """
+
+    def _build_tree(self) -> None:
+        """
+        Rebuilds the Fenwick tree of prefix sums over the remaining counts.
+        """
+
+    def _update(self, kind: int, delta: int) -> None:
+        """
+        Changes the remaining count of a kind.
+        :param kind: The index of the kind.
+        :param delta: The change in the count.
+        """
+
+    def _find(self, target: int) -> int:
+        """
+        Finds the kind of the card at a position of the shoe, with the cards
+        of each kind stored next to each other.
+        :param target: The position, between 0 and the number of cards.
+        :return: The index of the kind.
+        """
+
+    def reset(self) -> Shoe[_DeckT]:
+        """
+        Refills the shoe with `decks` full copies of the deck.
+        :return: The shoe instance (for method chaining).
+        """
+
+    def set_seed(self, seed: Optional[T_Seed]) -> Shoe[_DeckT]:
+        """
+        Replaces the shoe's random number generator.
+        :param seed: The new seed, e.g., an integer or a `SeedSequence`.
+        :return: The shoe instance (for method chaining).
+        """
+
+    def shuffle(self, seed: Optional[int] = None) -> Shoe[_DeckT]:
+        """
+        Shuffles the shoe. As every draw is random, this only reseeds the
+        random number generator if a seed is given.
+        :param seed: The seed to use for the random number generator.
+        :return: The shoe instance (for method chaining).
+        """
+
+    @overload
+    def draw(self, n: Literal[1] = 1) -> Any:
+        """
+        Draws one or more random cards from the shoe.
+        :param n: The number of cards to draw. Default is 1.
+        :return: The drawn card(s), as new card objects.
+        :raise ValueError: If `n` is not between 1 and the number of cards in
+            the shoe.
+        """
+
+    @overload
+    def draw(self, n: int = 1) -> List[Any]:
+        """
+        Draws one or more random cards from the shoe.
+        :param n: The number of cards to draw. Default is 1.
+        :return: The drawn card(s), as new card objects.
+        :raise ValueError: If `n` is not between 1 and the number of cards in
+            the shoe.
+        """
+
+    def _kind(self, card: Any) -> int:
+        """
+        Returns the index of a card's kind.
+        :param card: The card.
+        :return: The index of the kind.
+        :raise TypeError: If the card is not an instance of the deck's card
+            type.
+        :raise ValueError: If no card of the deck is of the card's kind.
+        """
+
+    def add(self, *cards: Any) -> Shoe[_DeckT]:
+        """
+        Returns cards to the shoe.
+        :param cards: The cards to return.
+        :return: The shoe instance (for method chaining).
+        :raise TypeError: If a card is not an instance of the deck's card
+            type.
+        :raise ValueError: If no card of the deck is of a card's kind.
+        """
+
+    def remove(self, *cards: Any) -> Shoe[_DeckT]:
+        """
+        Removes specific cards from the shoe, e.g., cards dealt face up.
+        Either all cards are removed or none.
+        :param cards: The cards to remove.
+        :return: The shoe instance (for method chaining).
+        :raise TypeError: If a card is not an instance of the deck's card
+            type.
+        :raise ValueError: If the shoe holds fewer cards of a kind than given.
+        """
+
+    def clear(self) -> Shoe[_DeckT]:
+        """
+        Removes all cards from the shoe.
+        :return: The shoe instance (for method chaining).
+        """
+
+    def count(self, card: Union[Any, str]) -> int:
+        """
+        Counts the remaining cards of a specific kind, rank, or suit.
+        :param card: Either a card instance, a rank (as a `string`), or a suit
+            (as a `string`).
+        :return: The number of remaining cards.
+        :raise ValueError: If the given card is not a valid rank or suit.
+        :raise TypeError: If the given input is not a valid type.
+        """
+
+    def draw_probability(self, card: Union[Any, str], n: int = 1,
+                         k: int = 1) -> float:
+        """
+        Computes the exact probability of drawing at least `k` cards matching
+        the given card, rank, or suit in the next `n` draws.
+        :param card: Either a card instance, a rank (as a `string`), or a suit
+            (as a `string`), matched as in `count()`.
+        :param n: The number of cards drawn.
+        :param k: The minimum number of matching cards.
+        :return: The probability as a float between 0 and 1.
+        :raise ValueError: If `n` is not between 0 and the number of cards in
+            the shoe, `k` is negative, or the card is not a valid rank or suit.
+        :raise TypeError: If the given card is not a valid type.
+        """
+
+    def get_counts(self) -> List[Tuple[Any, int]]:
+        """
+        Returns the composition of the shoe.
+        :return: A list of `(card, count)` pairs, one for every kind with
+            cards left.
+        """
+
+    def _kind_counts(self) -> List[Tuple[Tuple[Optional[int], Optional[int]],
+                                         int]]:
+        """
+        Returns the composition of the shoe by kind key, without copying any
+        cards.
+        :return: A list of `(kind key, count)` pairs, one for every kind with
+            cards left.
+        """
+
+    def get_cards(self) -> List[Any]:
+        """
+        Materializes the remaining cards, grouped by kind.
+        :return: A new card object for every remaining card.
+        """
+
+    def to_deck(self) -> _DeckT:
+        """
+        Materializes the remaining cards as a shuffled deck.
+        :return: A new deck holding a card object for every remaining card.
+        """
+
+    def __str__(self) -> str: ...
+
+    def __repr__(self) -> str: ...
+
+    def __len__(self) -> int: ...
+
+    def __bool__(self) -> bool: ...
+
+    def __contains__(self, item: object) -> bool: ...
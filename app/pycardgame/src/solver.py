@@ -0,0 +1,157 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+from __future__ import annotations
+
+import random
+from collections import Counter, OrderedDict
+from copy import deepcopy
+
+
+class Solver:
+    def __init__(self, max_entries=2 ** 20):
+        if max_entries < 0:
+            raise ValueError(f"Invalid table size: {max_entries}")
+        self.max_entries = max_entries
+        self.table = OrderedDict()
+        self.nodes = 0
+        self.hits = 0
+        self._rng = random.Random(0)
+
+    def key(self, game):
+        return game.zobrist_hash()
+
+    def moves(self, game):
+        # Cards of the same kind lead to the same positions
+        moves = {}
+        for card in game.get_playable_cards():
+            moves.setdefault(card.kind_key(), card)
+        return list(moves.values()) + [None]
+
+    def play(self, game, move):
+        if move is None:
+            if len(game.draw_pile) > 0:
+                game.draw_cards()
+        else:
+            game.play_card(move)
+        game.next_player()
+
+    def payoff(self, game):
+        for seat, player in enumerate(game.players):
+            if not player.hand:
+                return tuple(float(i == seat)
+                             for i in range(len(game.players)))
+        return None
+
+    def copy(self, game):
+        # Chance nodes are enumerated rather than sampled, so searched copies
+        # share a scratch generator instead of copying the game's. They do
+        # not notify the listeners of the game either
+        memo = {id(generator): self._rng for generator in (
+            random, game.rng, game.draw_pile._rng, game.discard_pile._rng)}
+        memo[id(game._listeners)] = {}
+        return deepcopy(game, memo), memo
+
+    def outcomes(self, game, move):
+        if move is None and len(game.draw_pile) > 0:
+            # Drawing is a chance node over the kinds left in the draw pile
+            kinds = Counter(card.kind_key()
+                            for card in game.draw_pile.get_cards())
+            total = len(game.draw_pile)
+            children = []
+            for kind, count in kinds.items():
+                child = self.copy(game)[0]
+                cards = child.draw_pile.cards
+                index = next(i for i, card in enumerate(cards)
+                             if card.kind_key() == kind)
+                cards.insert(0, cards.pop(index))
+                self.play(child, None)
+                children.append((count / total, child))
+            return children
+        child, memo = self.copy(game)
+        self.play(child, None if move is None else memo[id(move)])
+        return [(1.0, child)]
+
+    def _expect(self, game, move, path):
+        values = [0.0] * len(game.players)
+        for probability, child in self.outcomes(game, move):
+            for seat, value in enumerate(self._value(child, path)):
+                values[seat] += probability * value
+        return tuple(values)
+
+    def _value(self, game, path):
+        key = self.key(game)
+        table = self.table
+        values = table.get(key)
+        if values is not None:
+            table.move_to_end(key)
+            self.hits += 1
+            return values
+
+        payoff = self.payoff(game)
+        if payoff is not None:
+            return payoff
+        if key in path:
+            # A position repeated on the current line is scored as a draw.
+            # Positions above it keep that value, as is usual for memoized
+            # search in games with cycles
+            return (0.0,) * len(game.players)
+
+        self.nodes += 1
+        path.add(key)
+        seat = game.current_player_index
+        best = None
+        for move in self.moves(game):
+            values = self._expect(game, move, path)
+            if best is None or values[seat] > best[seat]:
+                best = values
+        path.discard(key)
+
+        table[key] = best
+        if len(table) > self.max_entries:
+            table.popitem(last=False)
+        return best
+
+    def solve(self, game):
+        return self._value(game, set())
+
+    def best_move(self, game):
+        payoff = self.payoff(game)
+        if payoff is not None:
+            raise ValueError("The game is already over")
+        seat = game.current_player_index
+        path = {self.key(game)}
+        best = best_values = None
+        for move in self.moves(game):
+            values = self._expect(game, move, path)
+            if best_values is None or values[seat] > best_values[seat]:
+                best, best_values = move, values
+        return best, best_values
+
+    def clear(self):
+        self.table.clear()
+        self.nodes = 0
+        self.hits = 0
+        return self
+
+    def __len__(self):
+        return len(self.table)
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}("
+                f"max_entries={self.max_entries!r}, "
+                f"entries={len(self.table)!r})")
@@ -0,0 +1,166 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+from __future__ import annotations
+
+import random
+from typing import (Any, Dict, List, Optional, OrderedDict, Set, Tuple,
+                    TypeVar)
+
+from .base import GenericCard, GenericGame
+
+_GameT = TypeVar("_GameT", bound=GenericGame)
+
+T_Move = Optional[GenericCard]
+T_Values = Tuple[float, ...]
+
+
+class Solver:
+    """
+    Computes the exact value of small games with perfect information, i.e.,
+    with every hand known. Each player maximizes their own value (max^n,
+    which is minimax for two players with opposite payoffs), and drawing is a
+    chance node that averages over the kinds of cards left in the draw pile
+    (expectimax). Values are memoized in a transposition table keyed by
+    `GenericGame.zobrist_hash()`, which ignores the order of the piles. The
+    table holds at most `max_entries` positions and evicts the least
+    recently used one first.
+
+    The default rules suit shedding games like the custom games of
+    `examples.py`: the current player plays a playable card, or draws a card
+    (passes if the draw pile is empty), and the turn passes on. The first
+    player with an empty hand wins and scores 1. Subclasses adapt the solver
+    to other games by overriding `moves`, `play`, `payoff` and `key`.
+    Searching copies the game with `copy.deepcopy`, so it is meant for games
+    of a few dozen cards.
+    :param max_entries: The maximum number of positions in the table.
+    :raise ValueError: If `max_entries` is negative.
+    """
+
+    def __init__(self, max_entries: int = 2 ** 20) -> None:
+        """
+        Creates a solver with an empty transposition table.
+        :param max_entries: The maximum number of positions in the table.
+        :raise ValueError: If `max_entries` is negative.
+        """
+        self.max_entries: int = ...
+        self.table: OrderedDict[Any, T_Values] = ...
+        self.nodes: int = ...
+        self.hits: int = ...
+        self._rng: random.Random = ...
+
+    def key(self, game: GenericGame[Any]) -> Any:
+        """
+        Returns the key of a position in the transposition table. Override
+        this if the value of a position depends on state that the Zobrist hash
+        does not cover.
+        :param game: The position.
+        :return: The key.
+        """
+
+    def moves(self, game: GenericGame[Any]) -> List[T_Move]:
+        """
+        Returns the moves of the current player: one playable card of each
+        kind, then None to draw a card. Must not be empty unless the position
+        has a payoff.
+        :param game: The position.
+        :return: The moves.
+        """
+
+    def play(self, game: GenericGame[Any], move: T_Move) -> None:
+        """
+        Makes a move and passes the turn on. A draw takes the top card of the
+        draw pile, which `outcomes` arranges.
+        :param game: The position, which is changed.
+        :param move: A card of the current player, or None to draw.
+        """
+
+    def payoff(self, game: GenericGame[Any]) -> Optional[T_Values]:
+        """
+        Returns the values of a finished game for every seat.
+        :param game: The position.
+        :return: The values, or None if the game is not over.
+        """
+
+    def copy(self, game: _GameT) -> Tuple[_GameT, Dict[int, Any]]:
+        """
+        Copies a position for the search. The copy shares a scratch random
+        generator instead of the game's and has no listeners.
+        :param game: The position.
+        :return: The copy and the `deepcopy` memo, which maps the ids of the
+            game's objects to their copies.
+        """
+
+    def outcomes(self, game: GenericGame[Any],
+                 move: T_Move) -> List[Tuple[float, GenericGame[Any]]]:
+        """
+        Returns the positions a move leads to, with their probabilities. A
+        draw leads to one position for each kind of card in the draw pile.
+        :param game: The position, which is not changed.
+        :param move: The move.
+        :return: The probabilities and positions.
+        """
+
+    def _expect(self, game: GenericGame[Any], move: T_Move,
+                path: Set[Any]) -> T_Values:
+        """
+        Returns the expected values of a move.
+        :param game: The position.
+        :param move: The move.
+        :param path: The keys of the positions on the current line.
+        :return: The values for every seat.
+        """
+
+    def _value(self, game: GenericGame[Any], path: Set[Any]) -> T_Values:
+        """
+        Returns the values of a position, looking it up in or adding it to the
+        transposition table. A position repeated on the current line scores 0
+        for every seat.
+        :param game: The position.
+        :param path: The keys of the positions on the current line.
+        :return: The values for every seat.
+        """
+
+    def solve(self, game: GenericGame[Any]) -> T_Values:
+        """
+        Computes the exact values of a position.
+        :param game: The position, which is not changed.
+        :return: The values for every seat.
+        """
+
+    def best_move(self, game: GenericGame[Any]) -> Tuple[T_Move, T_Values]:
+        """
+        Finds the move of the current player with the highest value for them.
+        Ties go to the first move.
+        :param game: The position, which is not changed.
+        :return: The move and its values for every seat.
+        :raise ValueError: If the game is already over.
+        """
+
+    def clear(self) -> Solver:
+        """
+        Empties the transposition table and resets the counters.
+        :return: The solver instance (for method chaining).
+        """
+
+    def __len__(self) -> int:
+        """
+        Returns the number of positions in the transposition table.
+        :return: The number of positions.
+        """
+
+    def __repr__(self) -> str: ...
@@ -0,0 +1,189 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import as_completed, ProcessPoolExecutor
+from itertools import combinations
+
+from .presets import UnoGame, UnoPlayer
+from .seeding import SeedSequence
+
+
+class Elo:
+    def __init__(self, k=32.0, initial=1500.0):
+        self.k = k
+        self.initial = initial
+        self.ratings = {}
+
+    def get(self, name):
+        return self.ratings.get(name, self.initial)
+
+    def expected(self, a, b):
+        return 1.0 / (1.0 + 10.0 ** ((self.get(b) - self.get(a)) / 400.0))
+
+    def update(self, players, winner=None):
+        # The winner beats every other player; without one, all players draw
+        deltas = dict.fromkeys(players, 0.0)
+        for a, b in combinations(players, 2):
+            if winner is None:
+                score = 0.5
+            elif a == winner or b == winner:
+                score = 1.0 if a == winner else 0.0
+            else:
+                continue
+            delta = self.k * (score - self.expected(a, b))
+            deltas[a] += delta
+            deltas[b] -= delta
+        for name, delta in deltas.items():
+            self.ratings[name] = self.get(name) + delta
+        return self
+
+    def standings(self):
+        return sorted(self.ratings.items(), key=lambda item: -item[1])
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}("
+                f"k={self.k!r}, "
+                f"initial={self.initial!r}, "
+                f"ratings={self.ratings!r})")
+
+
+def play_match(index, seats, agents, seed, max_turns=None):
+    game = UnoGame(*[UnoPlayer(name) for name in seats], seed=seed.child(0))
+    for seat, agent in enumerate(agents):
+        agent.set_seed(seed.child(1, seat))
+    turns = 0
+    winner = None
+    for event in game.iter_turns(agents, max_turns):
+        turns += 1
+        winner = event.winner
+    return {"match": index,
+            "seats": list(seats),
+            "winner": winner.name if winner is not None else None,
+            "turns": turns}
+
+
+class Tournament:
+    def __init__(self, agents, n_players=2, rounds=1, max_turns=1000,
+                 seed=None, results_path=None, workers=None, elo=None):
+        if len(agents) < n_players or n_players < 2:
+            raise ValueError(f"Invalid number of players: {n_players} for "
+                             f"{len(agents)} agents")
+        self.agents = dict(agents)
+        self.n_players = n_players
+        self.rounds = rounds
+        self.max_turns = max_turns
+        self.seed_sequence = seed if isinstance(seed, SeedSequence) \
+            else SeedSequence(seed)
+        self.results_path = results_path
+        self.workers = workers
+        self.elo = elo if elo is not None else Elo()
+        self.results = {}
+        self._next = 0
+
+    def schedule(self):
+        # Every group of agents plays once in each seat rotation per round
+        matches = []
+        for _ in range(self.rounds):
+            for group in combinations(self.agents, self.n_players):
+                for shift in range(self.n_players):
+                    matches.append(group[shift:] + group[:shift])
+        return matches
+
+    def _load(self):
+        if self.results_path is None or not os.path.exists(
+                self.results_path):
+            return
+        schedule = self.schedule()
+        with open(self.results_path, "rb") as file:
+            lines = file.read().split(b"\n")
+        valid = 0
+        # Only lines ending in a newline were written completely, so the
+        # part after the last newline is played again
+        for line in lines[:-1]:
+            try:
+                result = json.loads(line)
+                index = result["match"]
+                matches = schedule[index] == tuple(result["seats"])
+            except (ValueError, KeyError, IndexError, TypeError):
+                # Everything from an unreadable line on is played again
+                break
+            if not matches:
+                raise ValueError(f"Result does not match the schedule: "
+                                 f"{result!r}")
+            self.results[index] = result
+            valid += len(line) + 1
+        with open(self.results_path, "rb+") as file:
+            file.truncate(valid)
+
+    def _record(self, result, file):
+        self.results[result["match"]] = result
+        if file is not None:
+            file.write(json.dumps(result) + "\n")
+            file.flush()
+        self._rate()
+
+    def _rate(self):
+        # Ratings follow the schedule, whatever order results arrive in
+        while self._next in self.results:
+            result = self.results[self._next]
+            self.elo.update(result["seats"], result["winner"])
+            self._next += 1
+
+    def _task(self, index, seats):
+        return (index, seats, [self.agents[name] for name in seats],
+                self.seed_sequence.child(index), self.max_turns)
+
+    def run(self):
+        self._load()
+        self._rate()
+        todo = [self._task(index, seats)
+                for index, seats in enumerate(self.schedule())
+                if index not in self.results]
+        file = open(self.results_path, "a") \
+            if self.results_path is not None else None
+        try:
+            if self.workers == 0:
+                for task in todo:
+                    result = play_match(*task)
+                    self._record(result, file)
+                    yield result
+            else:
+                with ProcessPoolExecutor(self.workers) as executor:
+                    futures = [executor.submit(play_match, *task)
+                               for task in todo]
+                    for future in as_completed(futures):
+                        result = future.result()
+                        self._record(result, file)
+                        yield result
+        finally:
+            if file is not None:
+                file.close()
+
+    def play(self):
+        for _ in self.run():
+            pass
+        return self.elo.standings()
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}("
+                f"agents={list(self.agents)!r}, "
+                f"n_players={self.n_players!r}, "
+                f"rounds={self.rounds!r}, "
+                f"max_turns={self.max_turns!r})")
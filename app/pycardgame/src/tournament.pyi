@@ -0,0 +1,197 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import os
+from typing import (Any, Dict, IO, Iterator, List, Mapping, Optional,
+                    Sequence, Tuple, Union)
+
+from .agents import Agent
+from .seeding import SeedSequence, T_Seed
+
+T_Result = Dict[str, Any]
+
+
+class Elo:
+    """
+    Elo ratings for games of two or more players. A multiplayer game counts
+    as a win of the winner against every other player, or as a draw between
+    all players if nobody won.
+    :param k: The maximum rating change per pairing.
+    :param initial: The rating of a new player.
+    """
+
+    def __init__(self, k: float = 32.0, initial: float = 1500.0) -> None:
+        """
+        Creates a new rating table.
+        :param k: The maximum rating change per pairing.
+        :param initial: The rating of a new player.
+        """
+        self.k: float = ...
+        self.initial: float = ...
+        self.ratings: Dict[str, float] = ...
+
+    def get(self, name: str) -> float:
+        """
+        Returns a player's rating.
+        :param name: The name of the player.
+        :return: The rating, or the initial rating for an unknown player.
+        """
+
+    def expected(self, a: str, b: str) -> float:
+        """
+        Returns the expected score of one player against another.
+        :param a: The name of the first player.
+        :param b: The name of the second player.
+        :return: The expected score of `a`, between 0 and 1.
+        """
+
+    def update(self, players: Sequence[str],
+               winner: Optional[str] = None) -> Elo:
+        """
+        Updates the ratings with the result of a game. All pairings are
+        evaluated against the ratings from before the game.
+        :param players: The names of the players of the game.
+        :param winner: The name of the winner, or None for a draw.
+        :return: The rating table.
+        """
+
+    def standings(self) -> List[Tuple[str, float]]:
+        """
+        Returns the players sorted by rating.
+        :return: The names and ratings, best first.
+        """
+
+    def __repr__(self) -> str: ...
+
+
+def play_match(index: int, seats: Sequence[str], agents: Sequence[Agent],
+               seed: SeedSequence,
+               max_turns: Optional[int] = None) -> T_Result:
+    """
+    Plays a single UNO match. The function is self-contained so that it can
+    run in a worker process. Each seat's agent is reseeded from the match
+    seed, which makes the result independent of the process it runs in.
+    :param index: The index of the match in the schedule.
+    :param seats: The names of the agents, in seat order.
+    :param agents: The agents, in seat order.
+    :param seed: The seed of the match.
+    :param max_turns: The turn limit of the match.
+    :return: The result, with the keys "match", "seats", "winner" (None if
+        the turn limit was reached) and "turns".
+    """
+
+
+class Tournament:
+    """
+    A round-robin UNO tournament between agents. Every group of
+    `n_players` agents plays one match in each seat rotation per round. The
+    matches run in a process pool, results are streamed as they complete
+    and appended to a JSON Lines file, and a crashed tournament resumes from
+    that file. Ratings are updated in schedule order, so they do not depend
+    on the order in which the matches finish.
+    :param agents: The agents by name. They must be picklable unless
+        `workers` is 0.
+    :param n_players: The number of players per match.
+    :param rounds: The number of times the schedule is repeated.
+    :param max_turns: The turn limit of a match.
+    :param seed: The seed of the tournament. Match `i` uses `seed.child(i)`.
+    :param results_path: The results file, or None to keep results in memory
+        only.
+    :param workers: The number of worker processes. Defaults to the number
+        of CPUs, and 0 runs all matches in the current process.
+    :param elo: The rating table to update. A new one is created if omitted.
+    """
+
+    def __init__(self, agents: Mapping[str, Agent], n_players: int = 2,
+                 rounds: int = 1, max_turns: Optional[int] = 1000,
+                 seed: Optional[T_Seed] = None,
+                 results_path: Optional[Union[str, os.PathLike]] = None,
+                 workers: Optional[int] = None,
+                 elo: Optional[Elo] = None) -> None:
+        """
+        Creates a new tournament.
+        :param agents: The agents by name.
+        :param n_players: The number of players per match.
+        :param rounds: The number of times the schedule is repeated.
+        :param max_turns: The turn limit of a match.
+        :param seed: The seed of the tournament.
+        :param results_path: The results file.
+        :param workers: The number of worker processes.
+        :param elo: The rating table to update.
+        :raise ValueError: If there are fewer than two players per match, or
+            fewer agents than players.
+        """
+        self.agents: Dict[str, Agent] = ...
+        self.n_players: int = ...
+        self.rounds: int = ...
+        self.max_turns: Optional[int] = ...
+        self.seed_sequence: SeedSequence = ...
+        self.results_path: Optional[Union[str, os.PathLike]] = ...
+        self.workers: Optional[int] = ...
+        self.elo: Elo = ...
+        self.results: Dict[int, T_Result] = ...
+        self._next: int = ...
+
+    def schedule(self) -> List[Tuple[str, ...]]:
+        """
+        Returns the matches of the tournament.
+        :return: The names of the agents of each match, in seat order.
+        """
+
+    def _load(self) -> None:
+        """
+        Loads the results of an earlier run from the results file. A last
+        line without a newline counts as partly written and is removed from
+        the file, so its match is played again.
+        :raise ValueError: If a result does not match the schedule.
+        """
+
+    def _record(self, result: T_Result, file: Optional[IO[str]]) -> None:
+        """
+        Stores a result, appends it to the results file, and updates the
+        ratings.
+        :param result: The result.
+        :param file: The results file, if any.
+        """
+
+    def _rate(self) -> None:
+        """Applies all results that are next in the schedule to the ratings."""
+
+    def _task(self, index: int, seats: Tuple[str, ...]) -> Tuple[Any, ...]:
+        """
+        Returns the arguments of `play_match()` for a match.
+        :param index: The index of the match.
+        :param seats: The names of the agents, in seat order.
+        :return: The arguments.
+        """
+
+    def run(self) -> Iterator[T_Result]:
+        """
+        Plays all matches that have no result yet.
+        :return: An iterator over the new results, in the order in which the
+            matches finish.
+        :raise ValueError: If the results file does not match the schedule.
+        """
+
+    def play(self) -> List[Tuple[str, float]]:
+        """
+        Plays all remaining matches.
+        :return: The final standings, best first.
+        """
+
+    def __repr__(self) -> str: ...
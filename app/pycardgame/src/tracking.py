@@ -0,0 +1,114 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from collections import Counter
+
+
+class CardTracker:
+    __slots__ = ("game", "composition", "_discarded", "_unseen", "_totals",
+                 "_listeners")
+
+    def __init__(self, game, composition=None):
+        self.game = game
+        if composition is None:
+            composition = Counter(card.kind_key() for card in
+                                  game._deck_type._get_prototype())
+        self.composition = Counter(composition)
+        self._listeners = (("card_played", self._on_card_played),
+                           ("cards_drawn", self._on_cards_drawn),
+                           ("pile_reshuffled", self._on_pile_reshuffled),
+                           ("game_started", self._on_game_started))
+        for event, listener in self._listeners:
+            game.subscribe(event, listener)
+        self.sync()
+
+    def sync(self):
+        game = self.game
+        self._discarded = Counter(card.kind_key()
+                                  for card in game.discard_pile.get_cards())
+        base = self.composition - self._discarded
+        self._unseen = {}
+        self._totals = {}
+        for player in game.players:
+            unseen = base - Counter(card.kind_key() for card in player.hand)
+            self._unseen[id(player)] = unseen
+            self._totals[id(player)] = sum(unseen.values())
+        return self
+
+    def detach(self):
+        for event, listener in self._listeners:
+            self.game.unsubscribe(event, listener)
+        return self
+
+    def _on_card_played(self, game, player, card):
+        # The card leaves the player's hand face up, so it is no longer
+        # unseen for anyone else
+        key = card.kind_key()
+        self._discarded[key] += 1
+        totals = self._totals
+        for owner, unseen in self._unseen.items():
+            if owner != id(player):
+                unseen[key] -= 1
+                totals[owner] -= 1
+
+    def _on_cards_drawn(self, game, player, cards):
+        unseen = self._unseen.get(id(player))
+        if unseen is None:
+            return
+        for card in cards:
+            unseen[card.kind_key()] -= 1
+        self._totals[id(player)] -= len(cards)
+
+    def _on_pile_reshuffled(self, game):
+        discarded = Counter(card.kind_key()
+                            for card in game.discard_pile.get_cards())
+        returned = self._discarded - discarded
+        self._discarded = discarded
+        n_returned = sum(returned.values())
+        for owner, unseen in self._unseen.items():
+            unseen.update(returned)
+            self._totals[owner] += n_returned
+
+    def _on_game_started(self, game):
+        # The starter card is turned up without an event of its own
+        self.sync()
+
+    def _get(self, player):
+        try:
+            return self._unseen[id(player)]
+        except KeyError:
+            raise ValueError(f"Player not tracked: {player.name}") from None
+
+    def count(self, player, card):
+        key = card if isinstance(card, tuple) else card.kind_key()
+        return self._get(player)[key]
+
+    def total(self, player):
+        self._get(player)
+        return self._totals[id(player)]
+
+    def unseen(self, player):
+        return +self._get(player)
+
+    def probability(self, player, card):
+        total = self.total(player)
+        return self.count(player, card) / total if total else 0.0
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(game={self.game!r}, "
+                f"players={len(self._unseen)})")
@@ -0,0 +1,144 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from typing import (Any, Callable, Counter, Dict, Mapping, Optional, Tuple,
+                    Union)
+
+from .base import GenericCard, GenericGame, GenericPlayer
+
+T_Key = Tuple[Optional[int], Optional[int]]
+
+
+class CardTracker:
+    """
+    Tracks the cards each player of a game has not seen. For a player, these
+    are the cards of the deck minus the player's own hand and the face-up
+    discard pile. The tracker subscribes to the game's `card_played`,
+    `cards_drawn` and `pile_reshuffled` events and updates the counts of
+    every player as cards move, so queries do not have to rebuild them from
+    the discard pile. Cards are identified by `GenericCard.kind_key()`.
+
+    The tracker reads the full state when it is created, on `sync()` and
+    when the game starts, which turns up the first card of the discard pile
+    without playing it. Other changes to the piles or hands made without
+    events require a call to `sync()`.
+    :param game: The game to track.
+    :param composition: The number of cards of each kind in the game. Default
+        is the composition of the game's deck type.
+    """
+    __slots__ = ("game", "composition", "_discarded", "_unseen", "_totals",
+                 "_listeners")
+
+    def __init__(self, game: GenericGame[Any],
+                 composition: Optional[Mapping[T_Key, int]] = None) -> None:
+        """
+        Creates a tracker and subscribes it to the game's events.
+        :param game: The game to track.
+        :param composition: The number of cards of each kind in the game.
+            Default is the composition of the game's deck type.
+        """
+        self.game: GenericGame[Any] = ...
+        self.composition: Counter[T_Key] = ...
+        self._discarded: Counter[T_Key] = ...
+        self._unseen: Dict[int, Counter[T_Key]] = ...
+        self._totals: Dict[int, int] = ...
+        self._listeners: Tuple[Tuple[str, Callable[..., None]], ...] = ...
+
+    def sync(self) -> CardTracker:
+        """
+        Recomputes the unseen cards of every player from the game's state.
+        Players added to the game since the last sync are tracked from now on.
+        :return: The tracker instance (for method chaining).
+        """
+
+    def detach(self) -> CardTracker:
+        """
+        Unsubscribes the tracker from the game's events.
+        :return: The tracker instance (for method chaining).
+        """
+
+    def _on_card_played(self, game: GenericGame[Any],
+                        player: GenericPlayer[Any], card: GenericCard) -> None:
+        """
+        Marks a played card as seen by every other player.
+        """
+
+    def _on_cards_drawn(self, game: GenericGame[Any],
+                        player: GenericPlayer[Any],
+                        cards: Any) -> None:
+        """
+        Marks drawn cards as seen by the player who drew them.
+        """
+
+    def _on_pile_reshuffled(self, game: GenericGame[Any]) -> None:
+        """
+        Marks the cards that left the discard pile as unseen for every player.
+        """
+
+    def _on_game_started(self, game: GenericGame[Any]) -> None:
+        """
+        Reads the full state again once the cards are dealt and the starter
+        card is turned up.
+        """
+
+    def _get(self, player: GenericPlayer[Any]) -> Counter[T_Key]:
+        """
+        Returns the live counts of a player's unseen cards.
+        :param player: The player.
+        :return: The counts.
+        :raise ValueError: If the player is not tracked.
+        """
+
+    def count(self, player: GenericPlayer[Any],
+              card: Union[GenericCard, T_Key]) -> int:
+        """
+        Counts the cards of a kind that a player has not seen.
+        :param player: The player.
+        :param card: A card, or the key of a kind.
+        :return: The number of unseen cards of the kind.
+        :raise ValueError: If the player is not tracked.
+        """
+
+    def total(self, player: GenericPlayer[Any]) -> int:
+        """
+        Counts all cards that a player has not seen.
+        :param player: The player.
+        :return: The number of unseen cards.
+        :raise ValueError: If the player is not tracked.
+        """
+
+    def unseen(self, player: GenericPlayer[Any]) -> Counter[T_Key]:
+        """
+        Returns the cards that a player has not seen.
+        :param player: The player.
+        :return: A copy of the counts of the unseen cards, by kind key.
+        :raise ValueError: If the player is not tracked.
+        """
+
+    def probability(self, player: GenericPlayer[Any],
+                    card: Union[GenericCard, T_Key]) -> float:
+        """
+        Computes the probability that a random unseen card is of a kind, from
+        the player's point of view.
+        :param player: The player.
+        :param card: A card, or the key of a kind.
+        :return: The probability, or 0 if the player has seen every card.
+        :raise ValueError: If the player is not tracked.
+        """
+
+    def __repr__(self) -> str: ...
@@ -0,0 +1,149 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+from __future__ import annotations
+
+from copy import deepcopy
+
+
+class _Seat:
+    __slots__ = ("player", "prev", "next")
+
+    def __init__(self, player):
+        self.player = player
+        self.prev = self
+        self.next = self
+
+
+class TurnOrder:
+    __slots__ = ("direction", "_seats", "_head", "_current")
+
+    def __init__(self, players=(), current=None, direction=1):
+        if direction not in (1, -1):
+            raise ValueError(f"Invalid direction: {direction}")
+        self.direction = direction
+        self._seats = {}
+        self._head = None
+        self._current = None
+        self.add(*players)
+        if current is not None:
+            self.set_current(current)
+
+    def _seat(self, player):
+        seat = self._seats.get(id(player))
+        if seat is None:
+            raise ValueError(f"Player not in turn order: {player!r}")
+        return seat
+
+    def add(self, *players):
+        for player in players:
+            if id(player) in self._seats:
+                raise ValueError(f"Player already in turn order: {player!r}")
+            seat = self._seats[id(player)] = _Seat(player)
+            head = self._head
+            if head is None:
+                self._head = self._current = seat
+            else:
+                # New seats are appended after the last seat, before the head
+                seat.prev = head.prev
+                seat.next = head
+                head.prev.next = seat
+                head.prev = seat
+        return self
+
+    def remove(self, *players):
+        for player in players:
+            seat = self._seat(player)
+            del self._seats[id(player)]
+            if not self._seats:
+                self._head = self._current = None
+                continue
+            seat.prev.next = seat.next
+            seat.next.prev = seat.prev
+            if seat is self._head:
+                self._head = seat.next
+            if seat is self._current:
+                # The turn passes to whoever would have played next
+                self._current = seat.next if self.direction == 1 \
+                    else seat.prev
+        return self
+
+    def get_current(self):
+        return self._current.player if self._current is not None else None
+
+    def set_current(self, player):
+        self._current = self._seat(player)
+        return self
+
+    def _step(self, seat, n):
+        if n * self.direction >= 0:
+            for _ in range(abs(n)):
+                seat = seat.next
+        else:
+            for _ in range(abs(n)):
+                seat = seat.prev
+        return seat
+
+    def peek(self, n=1):
+        if self._current is None:
+            return None
+        return self._step(self._current, n).player
+
+    def advance(self, n=1):
+        if self._current is not None:
+            self._current = self._step(self._current, n)
+        return self.get_current()
+
+    def skip(self):
+        return self.advance(2)
+
+    def reverse(self):
+        self.direction *= -1
+        return self
+
+    def next_of(self, player):
+        return self._step(self._seat(player), 1).player
+
+    def previous_of(self, player):
+        return self._step(self._seat(player), -1).player
+
+    def __deepcopy__(self, memo):
+        # Seats are keyed by identity, so a copy seats the copied players anew
+        order = self.__class__(deepcopy(list(self), memo),
+                               deepcopy(self.get_current(), memo),
+                               self.direction)
+        memo[id(self)] = order
+        return order
+
+    def __contains__(self, player):
+        return id(player) in self._seats
+
+    def __len__(self):
+        return len(self._seats)
+
+    def __iter__(self):
+        seat = self._head
+        for _ in range(len(self._seats)):
+            yield seat.player
+            seat = seat.next
+
+    def __repr__(self):
+        current = self.get_current()
+        return (f"{self.__class__.__name__}("
+                f"players={len(self)!r}, "
+                f"current={getattr(current, 'name', None)!r}, "
+                f"direction={self.direction!r})")
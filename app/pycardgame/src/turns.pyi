@@ -0,0 +1,185 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+from __future__ import annotations
+
+from typing import (Any, Dict, Generic, Iterable, Iterator, Literal, Optional,
+                    TypeVar)
+
+from .base import GenericPlayer
+
+_PlayerT = TypeVar("_PlayerT", bound=GenericPlayer)
+
+
+class _Seat(Generic[_PlayerT]):
+    """
+    A seat in the ring of a turn order, linked to its neighbours in seat
+    order.
+    """
+    __slots__ = ("player", "prev", "next")
+
+    def __init__(self, player: _PlayerT) -> None:
+        self.player: _PlayerT = ...
+        self.prev: _Seat[_PlayerT] = ...
+        self.next: _Seat[_PlayerT] = ...
+
+
+class TurnOrder(Generic[_PlayerT]):
+    """
+    The order in which players take turns, for games with many players and
+    frequent eliminations. The players sit in a circular doubly linked ring
+    with a map from player to seat, so moving to the next or previous player,
+    reversing the direction, skipping and removing a player are O(1),
+    independent of the number of players. Unlike `GenericGame.players`,
+    there are no seat indices to shift when a player is removed. A game
+    hands its turn handling to a turn order with
+    `GenericGame.use_turn_order`.
+
+    Iteration yields the players in seat order, starting with the first seat.
+    Players are identified by identity.
+    :param players: The players, in seat order.
+    :param current: The player whose turn it is. Default is the first player.
+    :param direction: 1 to play in seat order, -1 to play in reverse.
+    :raise ValueError: If a player is given twice, the current player is not
+        one of the players, or the direction is invalid.
+    """
+    __slots__ = ("direction", "_seats", "_head", "_current")
+
+    def __init__(self, players: Iterable[_PlayerT] = (),
+                 current: Optional[_PlayerT] = None,
+                 direction: Literal[1, -1] = 1) -> None:
+        """
+        Creates a turn order.
+        :param players: The players, in seat order.
+        :param current: The player whose turn it is. Default is the first
+            player.
+        :param direction: 1 to play in seat order, -1 to play in reverse.
+        :raise ValueError: If a player is given twice, the current player is
+            not one of the players, or the direction is invalid.
+        """
+        self.direction: Literal[1, -1] = ...
+        self._seats: Dict[int, _Seat[_PlayerT]] = ...
+        self._head: Optional[_Seat[_PlayerT]] = ...
+        self._current: Optional[_Seat[_PlayerT]] = ...
+
+    def _seat(self, player: _PlayerT) -> _Seat[_PlayerT]:
+        """
+        Looks up the seat of a player.
+        :param player: The player.
+        :return: The seat.
+        :raise ValueError: If the player is not in the turn order.
+        """
+
+    def add(self, *players: _PlayerT) -> TurnOrder[_PlayerT]:
+        """
+        Seats players after the last seat. The first player added to an empty
+        turn order gets the turn.
+        :param players: The players to add.
+        :return: The turn order (for method chaining).
+        :raise ValueError: If a player is already in the turn order.
+        """
+
+    def remove(self, *players: _PlayerT) -> TurnOrder[_PlayerT]:
+        """
+        Removes players, e.g. when they are eliminated. If the current player
+        is removed, the turn passes to the player who would have played next.
+        :param players: The players to remove.
+        :return: The turn order (for method chaining).
+        :raise ValueError: If a player is not in the turn order.
+        """
+
+    def get_current(self) -> Optional[_PlayerT]:
+        """
+        Returns the player whose turn it is.
+        :return: The current player, or None if the turn order is empty.
+        """
+
+    def set_current(self, player: _PlayerT) -> TurnOrder[_PlayerT]:
+        """
+        Gives the turn to a player.
+        :param player: The player.
+        :return: The turn order (for method chaining).
+        :raise ValueError: If the player is not in the turn order.
+        """
+
+    def _step(self, seat: _Seat[_PlayerT], n: int) -> _Seat[_PlayerT]:
+        """
+        Moves `n` seats in the current direction, or back for negative `n`.
+        :param seat: The seat to start from.
+        :param n: The number of seats.
+        :return: The seat reached.
+        """
+
+    def peek(self, n: int = 1) -> Optional[_PlayerT]:
+        """
+        Returns the player `n` turns after the current one without changing
+        the turn. Negative `n` looks back.
+        :param n: The number of turns.
+        :return: The player, or None if the turn order is empty.
+        """
+
+    def advance(self, n: int = 1) -> Optional[_PlayerT]:
+        """
+        Passes the turn on by `n` players.
+        :param n: The number of turns.
+        :return: The new current player, or None if the turn order is empty.
+        """
+
+    def skip(self) -> Optional[_PlayerT]:
+        """
+        Passes the turn on, skipping the next player.
+        :return: The new current player, or None if the turn order is empty.
+        """
+
+    def reverse(self) -> TurnOrder[_PlayerT]:
+        """
+        Reverses the direction of play.
+        :return: The turn order (for method chaining).
+        """
+
+    def next_of(self, player: _PlayerT) -> _PlayerT:
+        """
+        Returns the player who plays after a player in the current direction.
+        :param player: The player.
+        :return: The next player.
+        :raise ValueError: If the player is not in the turn order.
+        """
+
+    def previous_of(self, player: _PlayerT) -> _PlayerT:
+        """
+        Returns the player who plays before a player in the current
+        direction.
+        :param player: The player.
+        :return: The previous player.
+        :raise ValueError: If the player is not in the turn order.
+        """
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> TurnOrder[_PlayerT]:
+        """
+        Copies the turn order with copies of its players. The seats are keyed
+        by identity, so the copied players are seated anew.
+        :param memo: The memo of the copy.
+        :return: The copy.
+        """
+
+    def __contains__(self, player: object) -> bool: ...
+
+    def __len__(self) -> int: ...
+
+    def __iter__(self) -> Iterator[_PlayerT]: ...
+
+    def __repr__(self) -> str: ...
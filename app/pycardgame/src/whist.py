@@ -0,0 +1,177 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from .base import GenericGame, GenericPlayer
+from .poker import PokerCard, PokerDeck
+
+_N_SUITS = len(PokerCard.SUITS)
+_N_CODES = len(PokerCard.RANKS) * _N_SUITS
+_NO_TRUMP = _N_SUITS
+
+
+def _build_trick_tables():
+    # The strength of every card for each trump suit (or none) and led suit:
+    # trumps beat cards of the led suit, which beat all other cards
+    tables = []
+    for trump in range(_N_SUITS + 1):
+        by_led = []
+        for led in range(_N_SUITS):
+            strengths = []
+            for code in range(_N_CODES):
+                rank, suit = code >> 2, code & 3
+                if suit == trump:
+                    strengths.append(2 * _N_CODES + rank)
+                elif suit == led:
+                    strengths.append(_N_CODES + rank)
+                else:
+                    strengths.append(0)
+            by_led.append(tuple(strengths))
+        tables.append(tuple(by_led))
+    return tuple(tables)
+
+
+_TRICK_TABLES = _build_trick_tables()
+
+
+def trick_winner(codes, trump=None):
+    table = _TRICK_TABLES[_NO_TRUMP if trump is None else trump][codes[0] & 3]
+    strengths = [table[code] for code in codes]
+    return strengths.index(max(strengths))
+
+
+def resolve_tricks(tricks, trump=None):
+    by_led = _TRICK_TABLES[_NO_TRUMP if trump is None else trump]
+    winners = []
+    append = winners.append
+    for codes in tricks:
+        table = by_led[codes[0] & 3]
+        strengths = [table[code] for code in codes]
+        append(strengths.index(max(strengths)))
+    return winners
+
+
+class WhistPlayer(GenericPlayer[PokerCard]):
+    __slots__ = ("tricks",)
+
+    def __init__(self, name, hand=None, score=0):
+        super().__init__(name, hand, score)
+        self.tricks = 0
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}({self.name!r}, "
+                f"hand={self.hand!r}, tricks={self.tricks!r})")
+
+
+class WhistGame(GenericGame[PokerCard]):
+    def __init__(self, *players, trump=None, hand_size=None, seed=None):
+        if players and hand_size is None:
+            hand_size = _N_CODES // len(players)
+        super().__init__(PokerCard, PokerDeck, None, None, trump,
+                         hand_size or 0, 0, False, *players, seed=seed)
+        self.trick = []
+        self.leader_index = 0
+        self.game_ended = False
+
+    def _trump_index(self):
+        if self._trump_suit is None:
+            return _NO_TRUMP
+        return self._trump_suit
+
+    def check_valid_play(self, card1, card2=None):
+        # Any card may lead, and later cards must follow the led suit
+        return card2 is None or card1.suit == card2.suit
+
+    def get_playable_cards(self, player=None):
+        if player is None:
+            player = self.get_current_player()
+        if not self.trick:
+            return list(player.hand)
+        led = self.trick[0]
+        following = [card for card in player.hand
+                     if self.check_valid_play(card, led)]
+        return following or list(player.hand)
+
+    def _hash_state(self):
+        return super()._hash_state() + (
+            ("leader", self.leader_index),
+            ("trick",) + tuple(card.kind_key() for card in self.trick))
+
+    def reshuffle_discard_pile(self):
+        # Won tricks stay out of play until the end of the hand
+        return self
+
+    def start_game(self):
+        self.deal_initial_cards()
+        self.trick = []
+        self.leader_index = self.current_player_index
+        if self._listeners:
+            self._emit("game_started")
+        return self
+
+    def play_card(self, card, player=None, *args):
+        if player is None:
+            player = self.get_current_player()
+        elif player is not self.get_current_player():
+            raise ValueError(f"It is not {player.name}'s turn")
+        if not any(c is card for c in player.hand):
+            raise ValueError(f"Card not in hand: {card!r}")
+        if not any(c is card for c in self.get_playable_cards(player)):
+            raise ValueError(f"Must follow the led suit: {card!r}")
+        player.play_cards(card)
+        self._hash_hand(player, (card,), -1)
+        self.trick.append(card)
+        if self._listeners:
+            self._emit("card_played", player, card)
+        if len(self.trick) < len(self.players):
+            self.next_player()
+            return None
+        return self._resolve_trick()
+
+    def _resolve_trick(self):
+        table = _TRICK_TABLES[self._trump_index()][self.trick[0].suit]
+        strengths = [table[card.rank << 2 | card.suit] for card in self.trick]
+        offset = strengths.index(max(strengths))
+        index = (self.leader_index + offset * self.direction) % len(
+            self.players)
+        winner = self.players[index]
+        winner.tricks += 1
+        self.discard_cards(*self.trick)
+        self.trick = []
+        self.leader_index = index
+        self.current_player_index = index
+        if not any(player.hand for player in self.players):
+            self.game_ended = True
+        return winner
+
+    def determine_winner(self):
+        if not self.players:
+            return None
+        most = max(player.tricks for player in self.players)
+        leaders = [player for player in self.players if player.tricks == most]
+        return leaders[0] if len(leaders) == 1 else None
+
+    def end_game(self):
+        winner = self.determine_winner()
+        self.game_ended = True
+        if self._listeners:
+            self._emit("game_ended", winner)
+        return winner
+
+    def __str__(self):
+        trump = self.trump if self.trump is not None else "no trump"
+        return f"Whist game of {len(self.players)} players ({trump})"
@@ -0,0 +1,192 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .base import GenericGame, GenericPlayer
+from .poker import PokerCard, T_PokerSuits
+from .seeding import SeedSequence
+
+_N_SUITS: int
+_N_CODES: int
+_NO_TRUMP: int
+
+_TRICK_TABLES: Tuple[Tuple[Tuple[int, ...], ...], ...]
+
+
+def _build_trick_tables() -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """
+    Builds the trick tables: for every trump suit (with index 4 for no trump)
+    and every led suit, the strength of every card code. The card with the
+    highest strength wins the trick.
+    :return: The tables, indexed by trump suit, led suit and card code.
+    """
+
+
+def trick_winner(codes: Sequence[int], trump: Optional[int] = None) -> int:
+    """
+    Finds the winner of a trick. Cards are encoded as in `HandEvaluator`,
+    i.e., as `rank << 2 | suit`.
+    :param codes: The codes of the cards of the trick, in the order they
+        were played.
+    :param trump: The index of the trump suit, or None for no trump.
+    :return: The position of the winning card in the trick.
+    """
+
+
+def resolve_tricks(tricks: Iterable[Sequence[int]],
+                   trump: Optional[int] = None) -> List[int]:
+    """
+    Finds the winners of many tricks with the same trump suit at once.
+    :param tricks: The codes of the cards of every trick, in the order they
+        were played.
+    :param trump: The index of the trump suit, or None for no trump.
+    :return: The position of the winning card in every trick.
+    """
+
+
+class WhistPlayer(GenericPlayer[PokerCard]):
+    """
+    A player in a game of whist.
+    :param name: The name of the player.
+    :param hand: The cards in the player's hand.
+    :param score: The initial score of the player.
+    """
+    __slots__ = ("tricks",)
+
+    def __init__(self, name: str, hand: Optional[List[PokerCard]] = None,
+                 score: int = 0) -> None:
+        """
+        Creates a new whist player.
+        :param name: The name of the player.
+        :param hand: The cards in the player's hand.
+        :param score: The initial score of the player.
+        """
+        self.tricks: int = ...
+
+    def __repr__(self) -> str: ...
+
+
+class WhistGame(GenericGame[PokerCard]):
+    """
+    A trick-taking game of whist with a 52-card deck. The leader plays any
+    card, and every other player must follow the led suit if they can. The
+    highest trump wins the trick, or the highest card of the led suit if no
+    trump was played, and the winner leads the next trick. Tricks are
+    resolved through precomputed tables that rank every card for each trump
+    suit and led suit, so resolving a trick takes one lookup per card
+    instead of comparing the cards pairwise.
+    """
+
+    def __init__(self, *players: WhistPlayer,
+                 trump: Optional[T_PokerSuits] = None,
+                 hand_size: Optional[int] = None,
+                 seed: Optional[Union[int, SeedSequence]] = None) -> None:
+        """
+        Creates a new whist game.
+        :param players: The players, in the order they play.
+        :param trump: The trump suit, or None to play without trump.
+        :param hand_size: The number of cards dealt to each player. Default is
+            the whole deck, split evenly between the players.
+        :param seed: The root seed of the game's random number generators.
+        :raise ValueError: If the trump suit is invalid.
+        """
+        self.trick: List[PokerCard] = ...
+        self.leader_index: int = ...
+        self.game_ended: bool = ...
+
+    def _trump_index(self) -> int:
+        """
+        Returns the index of the trump suit in the trick tables.
+        :return: The index of the trump suit, or 4 if there is no trump.
+        """
+
+    def check_valid_play(self, card1: PokerCard,
+                         card2: Optional[PokerCard] = None) -> bool:
+        """
+        Checks if a card follows the led card.
+        :param card1: The card being played.
+        :param card2: The card that led the trick, or None when leading.
+        :return: True if the card follows suit or leads, False otherwise.
+        """
+
+    def get_playable_cards(
+            self, player: Optional[GenericPlayer[PokerCard]] = None
+    ) -> List[PokerCard]:
+        """
+        Returns the cards a player may play to the current trick: the cards
+        of the led suit, or the whole hand if the player has none of them.
+        :param player: The player. Default is the current player.
+        :return: The playable cards.
+        """
+
+    def _hash_state(self) -> Tuple[Tuple[Any, ...], ...]:
+        """
+        Adds the leader and the cards of the current trick, in order, to the
+        hashed state.
+        :return: The features, each a tuple of a name and values.
+        """
+
+    def reshuffle_discard_pile(self) -> WhistGame:
+        """
+        Does nothing: the discard pile holds the won tricks, which are never
+        reshuffled during a game.
+        :return: The game instance (for method chaining).
+        """
+
+    def start_game(self) -> WhistGame:
+        """
+        Deals the cards and lets the current player lead the first trick.
+        :return: The game instance (for method chaining).
+        """
+
+    def play_card(self, card: PokerCard,  # type: ignore
+                  player: Optional[WhistPlayer] = None,
+                  *args) -> Optional[WhistPlayer]:
+        """
+        Plays a card to the current trick. Once every player has played, the
+        trick is resolved, and its winner leads the next trick.
+        :param card: The card to play.
+        :param player: The current player. Default is the current player.
+        :return: The winner of the trick if the card completed it, otherwise
+            None.
+        :raise ValueError: If it is not the player's turn, the card is not in
+            the player's hand, or the card does not follow suit although the
+            player could.
+        """
+
+    def _resolve_trick(self) -> WhistPlayer:
+        """
+        Resolves the complete current trick and moves its cards to the
+        discard pile. Ends the game once all hands are empty.
+        :return: The winner of the trick.
+        """
+
+    def determine_winner(self) -> Optional[WhistPlayer]:
+        """
+        Determines the player with the most tricks.
+        :return: The winner, or None if several players share the most tricks.
+        """
+
+    def end_game(self) -> Optional[WhistPlayer]:
+        """
+        Ends the game.
+        :return: The winner of the game, see `determine_winner()`.
+        """
+
+    def __str__(self) -> str: ...
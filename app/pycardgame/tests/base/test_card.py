@@ -117,6 +117,11 @@ def test_card_set_trump():
         card.set_trump(1)  # type: ignore
 
 
+def test_card_kind_key():
+    assert DummyCard("2", "Green").kind_key() == (1, 1)
+    assert DummyCard(0, 0, True).kind_key() == DummyCard(0, 0).kind_key()
+
+
 def test_card_copy():
     card1 = DummyCard(0, 0)
     card2 = card1.__copy__()
@@ -177,3 +182,102 @@ def test_card_comparison():
 
     assert not card1 == "InvalidType"  # type: ignore
     assert card1 != "InvalidType"  # type: ignore
+
+
+def test_card_copy_without_init():
+    class FixedCard(DummyCard, metaclass=CardMeta, rank_type=T_Ranks,
+                    suit_type=T_Suits):
+        __slots__ = ("marked",)
+
+        def __init__(self):
+            super().__init__("3", "Blue")
+            self.marked = True
+
+    card1 = FixedCard()
+    card2 = card1.__copy__()
+    assert type(card2) is FixedCard
+    assert card2 == card1
+    assert card2.marked is True
+    assert FixedCard._card_slots == ("rank", "suit", "trump", "marked")
+
+
+class FrozenCard(DummyCard, metaclass=CardMeta, rank_type=T_Ranks,
+                 suit_type=T_Suits, frozen=True):
+    pass
+
+
+def test_card_frozen():
+    card1 = FrozenCard("1", "Red")
+    card2 = FrozenCard(0, 0)
+    assert card1 == card2
+    assert hash(card1) == hash(card2)
+    assert len({card1, card2, FrozenCard(1, 0)}) == 2
+    assert {card1: "a"}[card2] == "a"
+
+    with pytest.raises(AttributeError):
+        card1.rank = 1
+    with pytest.raises(AttributeError):
+        del card1.rank
+
+    card3 = card1.change_suit("Blue")
+    assert card1.suit == 0
+    assert card3.suit == 2
+    card4 = card3.change_rank(2).set_trump(True)
+    assert (card3.rank, card3.trump) == (0, False)
+    assert (card4.rank, card4.suit, card4.trump) == (2, 2, True)
+    assert isinstance(card4, FrozenCard)
+
+    copied = card4.__copy__()
+    assert copied == card4
+    with pytest.raises(AttributeError):
+        copied.suit = 0
+
+    with pytest.raises(TypeError):
+        hash(DummyCard(0, 0))
+
+
+def test_card_frozen_subclass():
+    class FrozenSubCard(FrozenCard, metaclass=CardMeta, rank_type=T_Ranks,
+                        suit_type=T_Suits):
+        __slots__ = ("marked",)
+
+        def __init__(self, rank, suit):
+            super().__init__(rank, suit)
+            self.marked = True
+
+    card = FrozenSubCard(0, 0)
+    assert card.marked is True
+    assert card == FrozenCard(0, 0)
+    assert hash(card) == hash(FrozenCard(0, 0))
+    with pytest.raises(AttributeError):
+        card.marked = False
+
+    with pytest.raises(TypeError):
+        class UnfrozenCard(FrozenCard, metaclass=CardMeta,  # noqa: F841
+                           rank_type=T_Ranks, suit_type=T_Suits,
+                           frozen=False):
+            pass
+
+
+def test_card_slots():
+    class PlainCard(DummyCard, metaclass=CardMeta, rank_type=T_Ranks,
+                    suit_type=T_Suits):
+        pass
+
+    card = PlainCard(0, 0)
+    assert PlainCard.__slots__ == ()
+    assert not hasattr(card, "__dict__")
+    with pytest.raises(AttributeError):
+        card.extra = True  # type: ignore
+
+    # A card class can still opt into a __dict__, which copies keep
+    class OpenCard(DummyCard, metaclass=CardMeta, rank_type=T_Ranks,
+                   suit_type=T_Suits):
+        __slots__ = ("__dict__",)
+
+    open_card = OpenCard(1, 2)
+    open_card.extra = True  # type: ignore
+    copy = open_card.__copy__()
+    assert copy == open_card
+    assert copy.extra is True  # type: ignore
+    assert copy.__dict__ is not open_card.__dict__
@@ -14,6 +14,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import random
+from collections import Counter
+from itertools import permutations
 from typing import Literal
 
 import pytest
@@ -75,8 +78,17 @@ def test_deck_sort():
     deck.sort(by="suit")
     assert deck.cards == sorted(deck.cards)
 
+    # A trump suit sorts like trump cards without changing them
+    deck.sort(trump="Green")
+    assert [card.get_suit() for card in deck.cards[-3:]] == ["Green"] * 3
+    assert not any(card.trump for card in deck.cards)
+    deck.sort(by="rank", trump=1)
+    assert [card.get_suit() for card in deck.cards[:3]] == ["Green"] * 3
+
     with pytest.raises(ValueError):
         deck.sort(by="invalid_key")  # type: ignore
+    with pytest.raises(ValueError):
+        deck.sort(trump="Purple")
 
 
 def test_deck_shuffle():
@@ -203,3 +215,237 @@ def test_deck_getitem():
     assert deck[0] == deck.cards[0]
     assert deck[1:-1:-1] == deck.cards[1:-1:-1]
     assert not deck == "InvalidType"  # type: ignore
+
+
+def test_deck_prototype():
+    deck1 = DummyDeck()
+    prototype = DummyDeck._get_prototype()
+    assert DummyDeck._get_prototype() is prototype
+    assert list(prototype) == deck1.cards
+    assert all(a is not b for a, b in zip(prototype, deck1.cards))
+
+    deck1.cards[0].change_rank(2)
+    assert prototype[0].rank == 0
+    assert DummyDeck().cards[0].rank == 0
+
+
+def test_deck_reset():
+    deck = DummyDeck([DummyCard(0, 0)])
+    deck.reset()
+    assert deck.cards == DummyDeck().cards
+    assert deck.cards == sorted(deck.cards)
+
+
+def _chi_square(observed, expected_keys, trials):
+    expected = trials / len(expected_keys)
+    return sum((observed[key] - expected) ** 2 / expected
+               for key in expected_keys)
+
+
+def test_deck_lazy_shuffle():
+    deck = DummyDeck(lazy=True)
+    original = deck.cards.copy()
+    deck.shuffle(seed=42)
+    assert deck._pending == len(deck)
+    assert len(deck) == 9
+    assert DummyCard(0, 0) in deck
+    assert deck.count("Red") == 3  # type: ignore
+
+    drawn = deck.draw(3)
+    assert len(drawn) == 3
+    assert len(deck) == 6
+    assert sorted(drawn + deck.get_cards()) == original
+    assert deck._pending == 0
+
+    deck2 = DummyDeck(lazy=True).shuffle(seed=42)
+    assert deck2.draw(3) == drawn
+    assert deck2.cards == deck.cards
+
+
+def test_deck_lazy_shuffle_operations():
+    deck = DummyDeck(lazy=True).shuffle()
+    deck.add(DummyCard(2, 2))
+    assert deck._pending == 9
+    deck.remove(DummyCard(0, 0))
+    assert deck._pending == 8
+    deck.remove(DummyCard(2, 2))
+    assert deck._pending == 7
+    deck.draw(8)
+    assert len(deck) == 0
+
+    deck = DummyDeck(lazy=True).shuffle()
+    deck.add(DummyCard(2, 2), to_top=True)
+    assert deck._pending == 0
+    assert deck.get_top_card() == DummyCard(2, 2)
+
+    deck.shuffle().sort()
+    assert deck._pending == 0
+    assert deck.cards == sorted(deck.cards)
+
+    deck.shuffle().clear()
+    assert deck._pending == 0
+    assert deck.__copy__()._lazy is True
+
+    # A copy of a seeded deck draws what the original draws, and copying
+    # neither realizes the lazy order nor uses the generator
+    deck = DummyDeck(lazy=True, seed=7).shuffle()
+    deck.draw(2)
+    state = deck._rng.getstate()
+    copied = deck.__copy__()
+    assert copied._pending == deck._pending == 7
+    assert deck._rng.getstate() == state
+    assert copied._rng is not deck._rng
+    assert copied.draw(7) == deck.draw(7)
+    assert DummyDeck().__copy__()._rng is random
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_deck_lazy_shuffle_distribution(lazy):
+    cards = [DummyCard(0, 0), DummyCard(1, 0), DummyCard(2, 0),
+             DummyCard(0, 1)]
+    orders = list(permutations(range(len(cards))))
+    trials = 12000
+    drawn_orders: Counter = Counter()
+    partial_orders: Counter = Counter()
+
+    random.seed(1234)
+    for _ in range(trials):
+        deck = DummyDeck(cards, lazy=lazy).shuffle()
+        first = deck.draw()
+        rest = deck.draw(3)
+        drawn_orders[tuple(cards.index(c) for c in [first] + rest)] += 1
+
+        deck = DummyDeck(cards, lazy=lazy).shuffle()
+        first = deck.draw()
+        rest = deck.get_cards()
+        partial_orders[tuple(cards.index(c) for c in [first] + rest)] += 1
+
+    # Critical value of the chi-square distribution with 23 degrees of
+    # freedom at a significance level of 0.001
+    assert _chi_square(drawn_orders, orders, trials) < 49.73
+    assert _chi_square(partial_orders, orders, trials) < 49.73
+
+
+def test_deck_seed():
+    deck1 = DummyDeck(seed=42).shuffle()
+    deck2 = DummyDeck(seed=42).shuffle()
+    assert deck1 == deck2
+
+    deck3 = DummyDeck().set_seed(42).shuffle()
+    assert deck3 == deck1
+
+    state = random.getstate()
+    DummyDeck(lazy=True, seed=1).shuffle(seed=3).draw(4)
+    assert random.getstate() == state
+
+
+def test_deck_track_composition():
+    deck = DummyDeck().track_composition()
+    assert deck.count(DummyCard(0, 0)) == 1
+    assert deck.count("2") == 3  # type: ignore
+    assert deck.count("Blue") == 3  # type: ignore
+
+    deck.draw(4)
+    deck.remove(DummyCard(2, 2))
+    deck.add(DummyCard(0, 0), DummyCard(0, 0), to_top=True)
+    deck.add(DummyCard(1, 2))
+    expected = DummyDeck(deck.cards)
+    for name in DummyCard.RANKS + DummyCard.SUITS:  # type: ignore
+        assert deck.count(name) == expected.count(name)  # type: ignore
+    assert deck.count(DummyCard(0, 0)) == expected.count(DummyCard(0, 0))
+
+    copied = deck.__copy__()
+    assert copied.count("Blue") == expected.count("Blue")  # type: ignore
+
+    deck.clear()
+    assert deck.count("Red") == 0  # type: ignore
+    deck.reset()
+    assert deck.count("Red") == 3  # type: ignore
+    deck.cards = [DummyCard(1, 1)]
+    assert deck.count("Green") == 1  # type: ignore
+
+    deck.track_composition(False)
+    assert deck._composition is None
+    assert deck.count("Green") == 1  # type: ignore
+
+    with pytest.raises(ValueError):
+        DummyDeck().track_composition().count("InvalidName")  # type: ignore
+
+
+def test_deck_draw_probability():
+    deck = DummyDeck()
+    assert deck.draw_probability("Red") == pytest.approx(3 / 9)  # type: ignore
+    assert deck.draw_probability(DummyCard(0, 0), 9) == 1.0
+    assert deck.draw_probability("1", 2, 2) == pytest.approx(  # type: ignore
+        (3 / 9) * (2 / 8))
+    assert deck.draw_probability("1", 3, 0) == 1.0  # type: ignore
+    assert deck.draw_probability("1", 0) == 0.0  # type: ignore
+
+    # P(at least one Blue card in 4 draws) = 1 - C(6, 4) / C(9, 4)
+    assert deck.draw_probability("Blue", 4) == pytest.approx(  # type: ignore
+        1 - 15 / 126)
+
+    deck.remove(DummyCard(0, 0))
+    assert deck.draw_probability(DummyCard(0, 0)) == 0.0
+
+    with pytest.raises(ValueError):
+        deck.draw_probability("Red", 9)  # type: ignore
+    with pytest.raises(ValueError):
+        deck.draw_probability("Red", -1)  # type: ignore
+    with pytest.raises(ValueError):
+        deck.draw_probability("Red", 1, -1)  # type: ignore
+
+
+def test_deck_expected_draws():
+    deck = DummyDeck().track_composition()
+    assert deck.expected_draws("Red") == 10 / 4  # type: ignore
+    assert deck.expected_draws(DummyCard(0, 0)) == 10 / 2
+
+    deck.remove(DummyCard(0, 0))
+    assert deck.expected_draws(DummyCard(0, 0)) == float("inf")
+
+
+def test_deck_composition_lookups():
+    deck = DummyDeck().track_composition()
+    deck.remove(DummyCard(0, 0))
+    assert DummyCard(0, 0) not in deck
+    assert DummyCard(1, 0) in deck
+    assert deck.get_index(DummyCard(0, 0)) == []
+    assert deck.get_index(DummyCard(1, 0)) == [0]
+
+    with pytest.raises(ValueError):
+        deck.remove(DummyCard(0, 0))
+
+    # Cards are counted by equality, as without the index
+    trump = DummyCard(1, 0)
+    trump.set_trump(True)
+    assert deck.count(trump) == DummyDeck(deck.cards).count(trump) == 0
+    assert deck.count(DummyCard(1, 0)) == 1
+    assert deck.count(DummyCard(0, 0)) == 0
+
+    class MarkedCard(DummyCard, metaclass=CardMeta, rank_type=T_Ranks,
+                     suit_type=T_Suits):
+        pass
+
+    # Equality holds between related classes, in both directions
+    deck.add(MarkedCard(1, 0), MarkedCard(2, 1), trump)
+    expected = DummyDeck(deck.cards)
+    for card in (DummyCard(1, 0), MarkedCard(1, 0), DummyCard(2, 1),
+                 MarkedCard(2, 1), trump, MarkedCard(0, 0)):
+        assert deck.count(card) == expected.count(card)
+        assert (card in deck) == (card in expected)
+    assert deck.count(DummyCard(1, 0)) == 2
+    assert deck.count(MarkedCard(1, 0)) == 2
+
+    # The lookups are answered by the index without scanning the cards
+    class Unscanned(list):
+        def count(self, value):  # pragma: no cover
+            raise AssertionError("scanned")
+
+        def __contains__(self, value):  # pragma: no cover
+            raise AssertionError("scanned")
+
+    deck._cards = Unscanned(deck._cards)
+    assert deck.count(trump) == 1
+    assert DummyCard(2, 1) in deck
+    assert MarkedCard(0, 0) not in deck
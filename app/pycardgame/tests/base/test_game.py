@@ -14,6 +14,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import random
+from copy import deepcopy
 from typing import Literal
 
 import pytest
@@ -26,6 +28,7 @@ from ...src.base import (
     GenericGame,
     GenericPlayer,
 )
+from ...src.seeding import SeedSequence
 
 T_Ranks = Literal["1", "2", "3"]
 T_Suits = Literal["Red", "Green", "Blue"]
@@ -55,10 +58,11 @@ class DummyPlayer(GenericPlayer[DummyCard]):
 
 class DummyGame(GenericGame[DummyCard]):
     def __init__(self, *players, draw_pile=None, discard_pile=None, trump=None,
-                 hand_size=4, starting_player_index=0, do_not_shuffle=False):
+                 hand_size=4, starting_player_index=0, do_not_shuffle=False,
+                 seed=None):
         super().__init__(DummyCard, DummyDeck, draw_pile, discard_pile, trump,
                          hand_size, starting_player_index, do_not_shuffle,
-                         *players)
+                         *players, seed=seed)
 
     def check_valid_play(self, card1, card2):
         return card1.suit == card2.suit or card1.rank == card2.rank
@@ -90,6 +94,96 @@ def test_game_init():
         DummyGame(*players, starting_player_index=10)
 
 
+def test_game_seed():
+    game1 = DummyGame(seed=42)
+    game2 = DummyGame(seed=SeedSequence(42))
+    assert game1.seed_sequence == game2.seed_sequence
+    assert game1.draw_pile == game2.draw_pile
+    assert game1.rng.random() == game2.rng.random()
+    assert game1.shuffle().draw_pile == game2.shuffle().draw_pile
+
+    root = SeedSequence(7)
+    games = [DummyGame(seed=seq) for seq in root.spawn(4)]
+    reversed_games = [DummyGame(seed=root.child(i)) for i in reversed(
+        range(4))]
+    assert [game.draw_pile for game in games] == [
+        game.draw_pile for game in reversed(reversed_games)]
+
+    deck = DummyDeck()
+    DummyGame(draw_pile=deck, seed=42)
+    assert deck == DummyGame(seed=42).draw_pile
+
+    game3 = DummyGame()
+    assert game3.seed_sequence is None
+    assert game3.rng is random
+
+
+def test_game_get_playable_cards():
+    player = DummyPlayer("Alice")
+    game = DummyGame(player)
+    assert game.get_playable_cards() == []
+
+    player.add_cards(DummyCard("1", "Red"), DummyCard("2", "Blue"),
+                     DummyCard("3", "Green"))
+    game.discard_pile.add(DummyCard("2", "Red"))
+    assert game.rules is None
+    assert game.rule_state() == 0
+    assert game.get_playable_cards() == player.hand[:2]
+    assert game.get_playable_cards(player) == player.hand[:2]
+
+
+def test_game_subscribe():
+    player1, player2 = DummyPlayer("Alice"), DummyPlayer("Bob")
+    game = DummyGame(player1, player2, hand_size=2)
+    events = []
+
+    def listener(*args):
+        events.append(args)
+
+    assert game._listeners == {}
+    game.subscribe("cards_drawn", listener)
+    game.subscribe("card_played", listener)
+    game.subscribe("direction_reversed", listener)
+    game.subscribe("trump_changed", listener)
+    game.subscribe("pile_reshuffled", listener)
+    assert DummyGame._listeners == {}
+
+    game.deal_initial_cards()
+    assert events == [(game, player1, player1.hand),
+                      (game, player2, player2.hand)]
+    events.clear()
+
+    game.deal(1, player1)
+    game.draw_cards(player2)
+    assert [len(args[2]) for args in events] == [1, 1]
+    events.clear()
+
+    game.discard_cards(DummyCard("1", "Red"))
+    card = DummyCard("1", "Blue")
+    player1.add_cards(card)
+    game.play_card(card, player1)
+    game.reverse_direction()
+    game.change_trump("Green")
+    assert events == [(game, player1, card), (game, -1),
+                      (game, "Green")]
+    events.clear()
+
+    game.draw_pile.clear()
+    game.reshuffle_discard_pile()
+    assert events == [(game,)]
+
+    game.unsubscribe("card_played", listener)
+    assert "card_played" not in game._listeners
+    game.subscribe("cards_drawn", listener)
+    game.unsubscribe("cards_drawn", listener)
+    assert game._listeners["cards_drawn"] == (listener,)
+
+    with pytest.raises(ValueError):
+        game.unsubscribe("card_played", listener)
+    with pytest.raises(ValueError):
+        game.subscribe("unknown", listener)
+
+
 def test_game_check_valid_play():
     card1 = DummyCard(0, 0)
     card2 = DummyCard(0, 1)
@@ -150,6 +244,10 @@ def test_game_draw_cards():
     game.draw_cards(players[0])
     assert len(players[0].hand) == 3
 
+    game.discard_pile.add(DummyCard(1, 2))
+    with pytest.raises(ValueError):
+        game.draw_cards(players[1], 2)
+
 
 def test_game_deal_initial_cards():
     players = [DummyPlayer("Alice"), DummyPlayer("Bob")]
@@ -174,6 +272,69 @@ def test_game_remove_players():
     game.remove_players(players[0])
     assert game.players == players[1:]
 
+    # Removing a player does not change whose turn it is
+    players = [DummyPlayer(name) for name in "ABCDE"]
+    game = DummyGame(*players, starting_player_index=2)
+    game.remove_players(players[0])
+    assert game.get_current_player() is players[2]
+    game.remove_players(players[4])
+    assert game.get_current_player() is players[2]
+    # The turn passes on from a removed current player
+    game.remove_players(players[2])
+    assert game.get_current_player() is players[3]
+    game.reverse_direction().remove_players(players[3])
+    assert game.get_current_player() is players[1]
+    game.set_current_player(0).remove_players(players[1])
+    assert game.players == [] and game.current_player_index == 0
+    with pytest.raises(ValueError):
+        game.remove_players(players[0])
+
+
+def test_game_remove_players_turn_order():
+    class Unsearched(list):
+        def index(self, *args):  # pragma: no cover
+            raise AssertionError("searched")
+
+    def fresh(game):
+        value = game.zobrist_hash()
+        assert game.rehash().zobrist_hash() == value
+
+    a, b, c, d, e, f = players = [
+        DummyPlayer(name, [DummyCard(i % 3, i // 3)])
+        for i, name in enumerate("ABCDEF")]
+    game = DummyGame(*players, starting_player_index=1).use_turn_order()
+    order = game.turn_order
+    assert order is not None
+    game.zobrist_hash()
+    game.players = Unsearched(game.players)
+
+    # The last player takes the seat of a removed player, the ring keeps
+    # the order of the turns
+    game.remove_players(b)
+    assert game.players == [a, f, c, d, e]
+    assert game.get_current_player() is c
+    assert list(order) == [a, c, d, e, f]
+    fresh(game)
+    game.remove_players(f, a)
+    assert game.players == [d, e, c]
+    assert game.get_current_player() is c
+    fresh(game)
+
+    g = DummyPlayer("G")
+    game.set_current_player(e).add_players(g)
+    assert game.current_player_index == 1
+    game.remove_players(e)
+    assert game.players == [d, g, c]
+    assert game.get_current_player() is g
+    game.remove_players(c)
+    assert game.players == [d, g]
+    assert list(order) == [d, g]
+    fresh(game)
+    with pytest.raises(ValueError):
+        game.remove_players(a)
+    game.remove_players(d, g)
+    assert game.players == [] and game.current_player_index == 0
+
 
 def test_game_deal():
     players = [DummyPlayer("Alice"), DummyPlayer("Bob")]
@@ -208,6 +369,78 @@ def test_game_play():
     assert game.play_card(player2.hand[0], player2) is False
 
 
+def test_game_zobrist_hash():
+    def fresh(game):
+        value = game.zobrist_hash()
+        assert game.rehash().zobrist_hash() == value
+        return value
+
+    players = [DummyPlayer("Alice"), DummyPlayer("Bob")]
+    game = DummyGame(*players, seed=1)
+    start = fresh(game)
+    assert 0 <= start < 1 << 64
+    assert start == DummyGame(DummyPlayer("Alice"), DummyPlayer("Bob"),
+                              seed=2).zobrist_hash()
+
+    # Each change is kept up to date incrementally
+    game.deal(2)
+    dealt = fresh(game)
+    assert dealt != start
+    game.discard_cards(DummyCard(2, 2))
+    fresh(game)
+    card = DummyCard(2, 1)
+    players[0].add_cards(card)
+    game.rehash()
+    assert game.play_card(card, players[0])
+    fresh(game)
+    game.next_player()
+    assert fresh(game) != game.set_current_player(0).zobrist_hash()
+    game.reverse_direction()
+    fresh(game)
+    game.change_trump("Red")
+    fresh(game)
+    game.draw_pile.clear()
+    game.rehash().draw_cards(players[1])
+    fresh(game)
+
+    # The order of the piles is not hashed, but multiplicity is
+    value = game.zobrist_hash()
+    game.shuffle()
+    assert game.zobrist_hash() == value
+    game.discard_cards(DummyCard(0, 0))
+    once = game.zobrist_hash()
+    game.discard_cards(DummyCard(0, 0))
+    assert len({value, once, fresh(game)}) == 3
+
+    game.add_players(DummyPlayer("Charlie", [DummyCard(1, 1)]))
+    assert fresh(game) != once
+    game.remove_players(players[0])
+    fresh(game)
+    game.set_draw_pile(DummyDeck())
+    fresh(game)
+
+    # Seats are looked up by identity, also in a copy of the game
+    copied = deepcopy(game, {id(random): random})
+    copied.draw_cards(copied.players[1])
+    fresh(copied)
+    game.draw_cards(DummyPlayer("Dora"))
+    fresh(game)
+
+    # Hashing does not realize the lazy order of the piles, so it does not
+    # change which cards are dealt
+    def deal(hash_first, track=False):
+        deck = DummyDeck(lazy=True).track_composition(track)
+        game = DummyGame(DummyPlayer("Alice"), DummyPlayer("Bob"),
+                         draw_pile=deck, seed=3, hand_size=3)
+        if hash_first:
+            game.zobrist_hash()
+        game.deal_initial_cards()
+        return [player.hand for player in game.players], fresh(game)
+
+    assert deal(True) == deal(False)
+    assert deal(True, track=True) == deal(False)
+
+
 def test_game_get_trump():
     game1 = DummyGame()
     assert game1.get_trump() is None
@@ -263,25 +496,67 @@ def test_game_change_trump():
 
     game.change_trump("Green")
     assert game.trump == "Green"
+    assert game.get_trump() == "Green"
 
-    assert all(card.trump for card in game.draw_pile
-               if card.get_suit() == "Green")
-    assert not any(card.trump for card in game.draw_pile
-                   if card.get_suit() != "Green")
-
-    assert all(card.trump for card in game.discard_pile
-               if card.get_suit() == "Green")
-    assert not any(card.trump for card in game.discard_pile
-                   if card.get_suit() != "Green")
+    # Changing trump does not touch the cards
+    assert not any(card.trump for card in game.draw_pile)
+    assert not any(card.trump for card in game.discard_pile)
+    assert not any(card.trump for player in game.players
+                   for card in player.hand)
 
-    assert all(card.trump for player in game.players for card in player.hand
-               if card.get_suit() == "Green")
-    assert not any(card.trump for player in game.players for card in
-                   player.hand if card.get_suit() != "Green")
+    assert game.is_trump(DummyCard(0, 1))
+    assert not game.is_trump(DummyCard(0, 0))
+    assert game.is_trump(DummyCard(0, 0, True))
 
     with pytest.raises(ValueError):
         game.change_trump("InvalidSuit")
 
+    # Flags applied before follow the new trump suit
+    game.apply_trump()
+    game.change_trump("Blue")
+    assert not game.is_trump(DummyCard(0, 1))
+    assert not game.is_trump(player1.hand[0])
+    assert game.is_trump(game.discard_pile[-1])
+    assert [card.trump for card in game.draw_pile] == [False, False]
+
+
+def test_game_apply_trump_composition():
+    deck = DummyDeck([DummyCard(0, 0), DummyCard(1, 1)]).track_composition()
+    game = DummyGame(DummyPlayer("Alice"), trump="Red", draw_pile=deck)
+
+    # The flags are compared by equality, so the index is rebuilt
+    game.apply_trump()
+    trump = DummyCard(0, 0, True)
+    assert game.draw_pile.count(trump) == 1
+    assert DummyCard(0, 0) not in game.draw_pile
+
+    game.change_trump("Green")
+    assert game.draw_pile.count(trump) == 0
+    assert DummyCard(1, 1, True) in game.draw_pile
+
+
+def test_game_trump_ordering():
+    game = DummyGame()
+    red, green, blue = DummyCard("3", "Red"), DummyCard("1", "Green"), \
+        DummyCard("2", "Blue")
+    cards = [blue, green, red]
+    assert not game.is_trump(red)
+    assert not game.is_trump(DummyCard(None, None))
+    assert game.sort_cards(cards) == sorted(cards)
+    assert game.sort_cards(cards, by="rank") == [green, blue, red]
+
+    game.change_trump("Red")
+    # Trump cards sort last by suit and first by rank
+    assert game.sort_cards(cards) == [green, blue, red]
+    assert game.sort_cards(cards, by="rank") == [red, green, blue]
+    assert game.card_key(red) > game.card_key(blue)
+    assert game.card_key(red, by="rank") < game.card_key(green, by="rank")
+    assert cards == [blue, green, red]
+    assert not red.trump
+
+    with pytest.raises(ValueError):
+        game.sort_cards(cards, by="color")  # type: ignore
+
 
 def test_game_get_current_player():
     players = [DummyPlayer("Alice"), DummyPlayer("Bob")]
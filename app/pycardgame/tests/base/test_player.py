@@ -16,6 +16,8 @@
 
 from typing import Literal
 
+import pytest
+
 from ...src.base import GenericCard, GenericPlayer, CardMeta
 
 T_Ranks = Literal["1", "2", "3"]
@@ -61,13 +63,41 @@ def test_player_remove_card():
     player.remove_cards(card, card)
     assert player.hand == []
 
+    # Equal cards are removed by identity first
+    first, second = DummyCard("1", "Red"), DummyCard("1", "Red")
+    player = DummyPlayer("Alice", [first, second])
+    player.remove_cards(second)
+    assert player.hand[0] is first
+    player.remove_cards(DummyCard("1", "Red"))
+    assert player.hand == []
+
 
 def test_player_play_card():
     card1 = DummyCard("2", "Green")
     card2 = DummyCard("3", "Blue")
     hand = [card1, card2]
     player = DummyPlayer("Alice", hand)
-    assert player.play_cards() == hand
+    assert player.play_cards() == [card1, card2]
+    assert len(player) == 0
+
+
+def test_player_remove_frozen_cards():
+    class FrozenCard(DummyCard, metaclass=CardMeta, rank_type=T_Ranks,
+                     suit_type=T_Suits, frozen=True):
+        pass
+
+    cards = [FrozenCard("1", "Red"), FrozenCard("2", "Green"),
+             FrozenCard("1", "Red"), FrozenCard("3", "Blue")]
+    player = DummyPlayer("Alice", list(cards))
+    player.remove_cards(FrozenCard("1", "Red"), FrozenCard("3", "Blue"))
+    assert player.hand == [cards[1], cards[2]]
+
+    with pytest.raises(ValueError):
+        player.remove_cards(FrozenCard("2", "Green"), FrozenCard("3", "Blue"))
+    assert len(player) == 2
+
+    assert player.play_cards() == [cards[1], cards[2]]
+    assert len(player) == 0
 
 
 def test_player_get_hand():
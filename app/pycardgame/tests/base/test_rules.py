@@ -0,0 +1,84 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from ...src.presets import _uno_rule, UnoCard, UnoDeck
+from ...src.rules import RuleTable
+
+
+def test_rule_table_init():
+    table = RuleTable(UnoCard, _uno_rule, 1)
+    assert table.card_type is UnoCard
+    assert table.rule is _uno_rule
+    assert table.n_flags == 1
+    assert table._table is None
+    assert repr(table).startswith(
+        "RuleTable(card_type=<class 'app.pycardgame.src.presets.UnoCard'>, ")
+    assert repr(table).endswith("n_flags=1)")
+
+    with pytest.raises(ValueError):
+        RuleTable(UnoCard, _uno_rule, -1)
+
+
+def test_rule_table_matches_rule():
+    table = RuleTable(UnoCard, _uno_rule, 1)
+    cards = UnoDeck().cards
+    for card in cards:
+        for top_card in cards:
+            for state in (0, 1):
+                assert table.allows(card, top_card, state) == _uno_rule(
+                    card, top_card, bool(state))
+    assert table._table is not None
+    assert len(table._table) == UnoCard._kind_count() ** 2 * 2
+
+    for top_card in cards[::7]:
+        for state in (0, 1):
+            assert table.playable(cards, top_card, state) == [
+                card for card in cards
+                if _uno_rule(card, top_card, bool(state))]
+
+
+def test_rule_table_kind():
+    table = RuleTable(UnoCard, _uno_rule, 1).compile()
+    for card in UnoDeck().cards:
+        kind = table.kind(card)
+        assert 0 <= kind < UnoCard._kind_count()
+        clone = UnoCard._from_kind(kind)
+        assert isinstance(clone, UnoCard)
+        assert (clone.rank, clone.suit, clone.wild) == (
+            card.rank, card.suit, card.wild)
+
+
+def test_rule_table_incomplete_cards():
+    calls = []
+
+    def rule(card, top_card):
+        calls.append(card)
+        return card.rank == top_card.rank or card.suit == top_card.suit
+
+    table = RuleTable(UnoCard, rule)
+    blank = UnoCard(None, None)  # type: ignore
+    red_one = UnoCard("1", "Red")
+    assert table.allows(red_one, red_one)
+    assert not table.allows(blank, red_one)
+    assert table.allows(blank, UnoCard(None, None))  # type: ignore
+    assert calls[-2:] == [blank, blank]
+
+    red = UnoCard(None, "Red")  # type: ignore
+    assert table.playable([red_one, blank, red], red_one) == [red_one, red]
+    assert table.playable([red_one, blank],
+                          UnoCard(None, None)) == [blank]  # type: ignore
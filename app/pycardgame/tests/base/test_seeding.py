@@ -0,0 +1,78 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pickle
+import random
+
+import pytest
+
+from ...src.seeding import make_rng, SeedSequence
+
+
+def test_seed_sequence_init():
+    seq = SeedSequence(42)
+    assert seq.entropy == 42
+    assert seq.spawn_key == ()
+    assert repr(seq) == "SeedSequence(entropy=42, spawn_key=())"
+
+    assert SeedSequence().entropy != SeedSequence().entropy
+
+    with pytest.raises(ValueError):
+        SeedSequence(-1)
+    with pytest.raises(ValueError):
+        SeedSequence("42")  # type: ignore
+    with pytest.raises(ValueError):
+        SeedSequence(42, (True,))
+
+
+def test_seed_sequence_spawn():
+    root = SeedSequence(42)
+    children = root.spawn(3)
+    assert [child.spawn_key for child in children] == [(0,), (1,), (2,)]
+    assert root.spawn(1)[0].spawn_key == (3,)
+    assert root.n_children_spawned == 4
+
+    # Children are the same no matter how they are derived
+    assert children[2] == SeedSequence(42).child(2)
+    assert children[1].child(5) == SeedSequence(42, (1, 5))
+    assert root.child(1, 5) != root.child(5, 1)
+    assert hash(children[0]) == hash(SeedSequence(42).child(0))
+    assert not children[0] == "InvalidType"
+
+
+def test_seed_sequence_streams():
+    root = SeedSequence(42)
+    states = {root.child(worker, table).generate_state()
+              for worker in range(8) for table in range(8)}
+    assert len(states) == 64
+    assert all(0 <= state < 2 ** 256 for state in states)
+
+    rng1 = root.child(3).random()
+    rng2 = SeedSequence(42).child(3).random()
+    assert [rng1.random() for _ in range(5)] == [rng2.random()
+                                                 for _ in range(5)]
+
+    restored = pickle.loads(pickle.dumps(root.child(1)))
+    assert restored == root.child(1)
+
+
+def test_make_rng():
+    assert make_rng() is random
+    rng = random.Random(1)
+    assert make_rng(rng) is rng
+    assert make_rng(7).random() == random.Random(7).random()
+    seq = SeedSequence(7)
+    assert make_rng(seq).random() == seq.random().random()
@@ -0,0 +1,143 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from collections import Counter
+
+import pytest
+
+from ...src.presets import NumberCard, UnoDeck, WildCard
+from ...src.shoe import Shoe
+from .test_deck import DummyCard, DummyDeck
+
+
+def test_shoe_init():
+    shoe = Shoe(DummyDeck, 6, seed=1)
+    assert shoe.deck_type is DummyDeck
+    assert shoe.decks == 6
+    assert len(shoe) == 54
+    assert shoe
+    assert str(shoe) == "Shoe of 6 decks with 54 cards."
+    assert repr(shoe) == "Shoe(deck_type=DummyDeck, decks=6, cards=54)"
+    assert all(count == 6 for _, count in shoe.get_counts())
+
+    with pytest.raises(ValueError):
+        Shoe(DummyDeck, 0)
+
+
+def test_shoe_duplicate_kinds():
+    shoe = Shoe(UnoDeck, 2)
+    assert len(shoe) == 2 * len(UnoDeck())
+    assert len(shoe.get_counts()) == 54
+    assert shoe.count(NumberCard("5", "Red")) == 4
+    assert shoe.count(NumberCard("0", "Red")) == 2
+    assert shoe.count(WildCard()) == 8
+    assert shoe.count(WildCard().change_suit("Red")) == 0
+    assert shoe.count("Red") == 50
+    assert shoe.count("7") == 16
+
+
+def test_shoe_draw():
+    shoe = Shoe(DummyDeck, 4, seed=1)
+    card = shoe.draw()
+    assert isinstance(card, DummyCard)
+    assert shoe.count(card) == 3
+    assert len(shoe) == 35
+
+    cards = shoe.draw(35)
+    assert not shoe
+    assert len(cards) == 35
+    # Every kind is drawn as often as the shoe holds it
+    counts = Counter((c.rank, c.suit) for c in cards + [card])
+    assert sorted(counts.values()) == [4] * 9
+    # Every drawn card is a new object
+    assert len({id(c) for c in cards}) == 35
+
+    with pytest.raises(ValueError):
+        shoe.draw()
+    with pytest.raises(ValueError):
+        shoe.reset().draw(37)
+
+    assert Shoe(DummyDeck, seed=5).draw(9) == Shoe(DummyDeck, seed=5).draw(9)
+    assert (Shoe(DummyDeck).set_seed(3).shuffle().draw(9) ==
+            Shoe(DummyDeck).shuffle(3).draw(9))
+
+
+def test_shoe_add_remove():
+    shoe = Shoe(DummyDeck, 2)
+    card = DummyCard("2", "Blue")
+    shoe.remove(card, card)
+    assert card not in shoe
+    assert len(shoe) == 16
+    with pytest.raises(ValueError):
+        shoe.remove(card)
+    with pytest.raises(ValueError):
+        shoe.remove(DummyCard("1", "Red"), DummyCard("1", "Red"),
+                    DummyCard("1", "Red"))
+    assert shoe.count(DummyCard("1", "Red")) == 2
+
+    shoe.add(card)
+    assert card in shoe
+    assert "2" not in shoe
+    with pytest.raises(ValueError):
+        shoe.add(DummyCard("2", "Blue").set_trump(True))
+    with pytest.raises(TypeError):
+        shoe.add(NumberCard("5", "Red"))
+
+    shoe.clear()
+    assert len(shoe) == 0
+    assert shoe.get_counts() == []
+    assert card not in shoe
+    shoe.add(card)
+    assert shoe.draw() == card
+
+
+def test_shoe_count():
+    shoe = Shoe(DummyDeck, 3)
+    assert shoe.count(DummyCard("1", "Red")) == 3
+    assert shoe.count(DummyCard("1", "Red").set_trump(True)) == 0
+    assert shoe.count("1") == 9
+    assert shoe.count("Green") == 9
+
+    with pytest.raises(ValueError):
+        shoe.count("Purple")
+    with pytest.raises(TypeError):
+        shoe.count(1)
+
+
+def test_shoe_draw_probability():
+    shoe = Shoe(DummyDeck, 2)
+    deck = DummyDeck(cards=DummyDeck().cards * 2)
+    card = DummyCard("3", "Green")
+    assert shoe.draw_probability(card, 4) == pytest.approx(
+        deck.draw_probability(card, 4))
+    assert shoe.draw_probability("Red", 6, 3) == pytest.approx(
+        deck.draw_probability("Red", 6, 3))  # type: ignore
+
+    with pytest.raises(ValueError):
+        shoe.draw_probability(card, 19)
+    with pytest.raises(ValueError):
+        shoe.draw_probability(card, 1, -1)
+
+
+def test_shoe_to_deck():
+    shoe = Shoe(DummyDeck, 2, seed=2)
+    shoe.remove(DummyCard("1", "Red"))
+    deck = shoe.to_deck()
+    assert isinstance(deck, DummyDeck)
+    assert len(deck) == 17
+    assert deck.count(DummyCard("1", "Red")) == 1
+    assert sorted(deck.cards) == sorted(DummyDeck().cards * 2)[1:]
+    assert len(shoe) == 17
@@ -0,0 +1,160 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import random
+
+import pytest
+
+from ...src.poker import PokerCard
+from ...src.solver import Solver
+from ...src.whist import WhistGame, WhistPlayer
+from .test_game import DummyCard, DummyDeck, DummyGame, DummyPlayer
+
+
+class TinyGame(DummyGame):
+    def reshuffle_discard_pile(self):
+        # Played cards stay out of the draw pile, so every game ends
+        return self
+
+
+class WhistSolver(Solver):
+    def key(self, game):
+        return game.zobrist_hash(), tuple(p.tricks for p in game.players)
+
+    def moves(self, game):
+        return game.get_playable_cards()
+
+    def play(self, game, move):
+        game.play_card(move)
+
+    def payoff(self, game):
+        if game.game_ended:
+            return tuple(float(p.tricks) for p in game.players)
+        return None
+
+
+def tiny_game(hand_a, hand_b, top, draw=()):
+    game = TinyGame(DummyPlayer("Alice", [DummyCard(*c) for c in hand_a]),
+                    DummyPlayer("Bob", [DummyCard(*c) for c in hand_b]),
+                    draw_pile=DummyDeck(cards=[DummyCard(*c) for c in draw]),
+                    do_not_shuffle=True)
+    game.discard_cards(DummyCard(*top))
+    return game
+
+
+def random_game(seed):
+    cards = DummyDeck().cards
+    random.Random(seed).shuffle(cards)
+    game = TinyGame(DummyPlayer("Alice", cards[:2]),
+                    DummyPlayer("Bob", cards[2:4]),
+                    draw_pile=DummyDeck(cards=cards[5:7]),
+                    do_not_shuffle=True)
+    game.discard_cards(cards[4])
+    return game
+
+
+def test_solver_init():
+    solver = Solver(100)
+    assert solver.max_entries == 100
+    assert len(solver) == 0
+    assert repr(solver) == "Solver(max_entries=100, entries=0)"
+    assert Solver().max_entries == 2 ** 20
+
+    with pytest.raises(ValueError):
+        Solver(-1)
+
+
+def test_solver_exact():
+    # Alice wins at once by playing her last card
+    game = tiny_game([("2", "Red")], [("3", "Green")],
+                     ("1", "Red"), [("1", "Green")])
+    solver = Solver()
+    assert solver.solve(game) == (1.0, 0.0)
+    assert solver.best_move(game) == (DummyCard("2", "Red"), (1.0, 0.0))
+
+    # Whatever Alice draws, Bob plays his last card next
+    game = tiny_game([("3", "Blue")], [("2", "Red")], ("1", "Red"),
+                     [("1", "Green")])
+    assert solver.solve(game) == (0.0, 1.0)
+    assert solver.best_move(game) == (None, (0.0, 1.0))
+
+    with pytest.raises(ValueError):
+        solver.best_move(tiny_game([], [("2", "Red")], ("1", "Red")))
+
+
+def test_solver_outcomes():
+    game = tiny_game([("3", "Blue")], [("2", "Green")], ("1", "Red"),
+                     [("3", "Red"), ("2", "Blue"), ("3", "Red")])
+    solver = Solver()
+    outcomes = solver.outcomes(game, None)
+    assert [probability for probability, _ in outcomes] == [2 / 3, 1 / 3]
+    assert [child.players[0].hand[-1] for _, child in outcomes] == \
+        [DummyCard("3", "Red"), DummyCard("2", "Blue")]
+    assert all(child.current_player_index == 1 for _, child in outcomes)
+    # The position itself is not changed
+    assert len(game.players[0].hand) == 1 and len(game.draw_pile) == 3
+
+    # A draw is the average of what may be drawn
+    values = solver._expect(game, None, set())
+    assert values == pytest.approx(tuple(
+        sum(p * solver.solve(child)[seat] for p, child in outcomes)
+        for seat in range(2)))
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_solver_transposition_table(seed):
+    game = random_game(seed)
+    events = []
+    game.subscribe("cards_drawn", lambda *args: events.append(args))
+    hands = [list(player.hand) for player in game.players]
+    value = game.zobrist_hash()
+
+    solver = Solver()
+    values = solver.solve(game)
+    assert sum(values) <= 1.0
+    assert solver.hits > 0
+    assert len(solver) == solver.nodes
+
+    # The table changes how often positions are searched, not their values
+    plain = Solver(0)
+    assert plain.solve(game) == pytest.approx(values)
+    assert len(plain) == 0 and plain.nodes > solver.nodes
+    small = Solver(16)
+    assert small.solve(game) == pytest.approx(values)
+    assert len(small) == 16
+
+    # Searching does not change the game or notify its listeners
+    assert [player.hand for player in game.players] == hands
+    assert game.zobrist_hash() == value
+    assert events == []
+
+    solver.clear()
+    assert len(solver) == solver.nodes == solver.hits == 0
+
+
+def test_solver_subclass():
+    players = [WhistPlayer("A"), WhistPlayer("B")]
+    game = WhistGame(*players, trump="Hearts", hand_size=3,
+                     seed=4).start_game()
+    solver = WhistSolver()
+    values = solver.solve(game)
+    assert sum(values) == 3.0
+    assert WhistSolver(0).solve(game) == values
+
+    move, best = solver.best_move(game)
+    assert best == values and isinstance(move, PokerCard)
+    game.play_card(move)
+    assert solver.solve(game) == values
@@ -0,0 +1,117 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from ...src.turns import TurnOrder
+from .test_game import DummyPlayer
+
+
+def make_players(n):
+    return [DummyPlayer(f"P{i}") for i in range(n)]
+
+
+def test_turn_order_init():
+    players = make_players(3)
+    order = TurnOrder(players)
+    assert list(order) == players
+    assert len(order) == 3
+    assert order.get_current() is players[0]
+    assert players[1] in order and DummyPlayer("P1") not in order
+    assert repr(order) == "TurnOrder(players=3, current='P0', direction=1)"
+
+    order = TurnOrder(players, current=players[2], direction=-1)
+    assert order.get_current() is players[2]
+    assert order.peek() is players[1]
+
+    empty: TurnOrder[DummyPlayer] = TurnOrder()
+    assert empty.get_current() is None
+    assert empty.peek() is None and empty.advance() is None
+    assert list(empty) == []
+    assert repr(empty) == "TurnOrder(players=0, current=None, direction=1)"
+
+    with pytest.raises(ValueError):
+        TurnOrder(players, direction=0)  # type: ignore
+    with pytest.raises(ValueError):
+        TurnOrder(players + players[:1])
+    with pytest.raises(ValueError):
+        TurnOrder(players, current=DummyPlayer("P0"))
+
+
+def test_turn_order_moves():
+    players = make_players(4)
+    order = TurnOrder(players)
+    assert order.advance() is players[1]
+    assert order.skip() is players[3]
+    assert order.advance() is players[0]
+    assert order.peek(-1) is players[3]
+    assert order.advance(6) is players[2]
+
+    assert order.reverse() is order
+    assert order.direction == -1
+    assert order.peek() is players[1]
+    assert order.advance() is players[1]
+    assert order.skip() is players[3]
+    assert order.peek(-2) is players[1]
+    assert order.next_of(players[0]) is players[3]
+    assert order.previous_of(players[0]) is players[1]
+    # Reversing does not change the seat order
+    assert list(order) == players
+
+    assert order.set_current(players[1]).get_current() is players[1]
+    with pytest.raises(ValueError):
+        order.set_current(DummyPlayer("P1"))
+
+
+def test_turn_order_add_remove():
+    players = make_players(5)
+    order = TurnOrder(players[:3], current=players[1])
+    order.add(*players[3:])
+    assert list(order) == players
+    assert order.previous_of(players[0]) is players[4]
+
+    # Removing other players keeps the turn
+    order.remove(players[0])
+    assert order.get_current() is players[1]
+    assert list(order) == players[1:]
+    # The turn passes to whoever would have played next
+    order.remove(players[1])
+    assert order.get_current() is players[2]
+    order.reverse().remove(players[2])
+    assert order.get_current() is players[4]
+    assert list(order) == players[3:]
+
+    order.remove(players[3], players[4])
+    assert len(order) == 0 and order.get_current() is None
+    order.add(players[0])
+    assert order.get_current() is players[0]
+    assert order.next_of(players[0]) is players[0]
+
+    with pytest.raises(ValueError):
+        order.remove(players[1])
+    with pytest.raises(ValueError):
+        order.add(players[0])
+
+
+def test_turn_order_elimination():
+    # A battle royale: every turn, the current player eliminates the next one
+    players = make_players(250)
+    order = TurnOrder(players)
+    while len(order) > 1:
+        order.remove(order.peek())
+        order.advance()
+    # Josephus problem with every second player eliminated
+    assert order.get_current() is players[2 * (250 - 128)]
@@ -0,0 +1,257 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from ....src.blackjack import (
+    _compile_strategy,
+    BASIC_STRATEGY,
+    BlackjackGame,
+    BlackjackPlayer,
+    hand_total,
+    simulate_blackjack,
+)
+from ....src.poker import PokerCard, PokerDeck
+from ....src.shoe import Shoe
+
+
+def cards(*ranks):
+    return [PokerCard(rank, "Hearts") for rank in ranks]
+
+
+def rigged_game(*ranks, players=1, **kwargs):
+    game = BlackjackGame(*[BlackjackPlayer(f"Player {i + 1}")
+                           for i in range(players)], **kwargs)
+    game.set_draw_pile(PokerDeck(cards=cards(*ranks)))
+    game.cut_card = 0
+    return game
+
+
+def test_hand_total():
+    assert hand_total(cards("10", "King")) == (20, False)
+    assert hand_total(cards("Ace", "6")) == (17, True)
+    assert hand_total(cards("Ace", "6", "10")) == (17, False)
+    assert hand_total(cards("Ace", "Ace", "9")) == (21, True)
+    assert hand_total([]) == (0, False)
+
+    player = BlackjackPlayer("Alice", cards("Ace", "Queen"))
+    assert player.get_total() == 21
+    assert player.is_soft()
+    assert player.is_blackjack()
+    assert not player.is_bust()
+    player.add_cards(*cards("5", "7"))
+    assert not player.is_blackjack()
+    assert player.is_bust()
+
+
+def test_blackjack_game_init():
+    game = BlackjackGame(BlackjackPlayer("Alice"), decks=2, seed=1)
+    assert isinstance(game.draw_pile, Shoe)
+    assert len(game.draw_pile) == 104
+    assert game.cut_card == 26
+    assert game.round_over
+    assert game.get_dealer_upcard() is None
+    assert not game.check_valid_play(*cards("2", "2"))
+    assert str(game) == "Blackjack game with 1 players and 104 cards in " \
+                        "the shoe"
+
+    with pytest.raises(ValueError):
+        BlackjackGame(penetration=0)
+    with pytest.raises(ValueError):
+        BlackjackGame(penetration=1.5)
+
+
+def test_blackjack_game_round():
+    # Player 1 gets 10 and 6, player 2 gets 9 and 2, the dealer shows a 7
+    game = rigged_game("10", "9", "7", "6", "2", "King", "5", "8", "Ace",
+                       players=2)
+    player1, player2 = game.players
+    game.start_game()
+    assert not game.round_over
+    assert game.get_dealer_upcard() == PokerCard("7", "Hearts")
+    assert game.get_current_player() is player1
+
+    with pytest.raises(ValueError):
+        game.stand(player2)
+    with pytest.raises(RuntimeError):
+        game.start_game()
+
+    assert game.hit() == PokerCard("5", "Hearts")
+    assert player1.get_total() == 21
+    # Reaching 21 ends the turn
+    assert game.get_current_player() is player2
+    with pytest.raises(ValueError):
+        game.hit(player1)
+
+    game.hit(player2)
+    with pytest.raises(ValueError):
+        game.double(player2)
+    game.stand(player2)
+    # The dealer stands on 17
+    assert game.round_over
+    assert game.dealer.get_total() == 17
+    assert game.results == [1, 1]
+    assert [player1.score, player2.score] == [1, 1]
+
+    with pytest.raises(RuntimeError):
+        game.hit()
+
+    assert game.end_game() == [1, 1]
+    assert len(game.discard_pile) == 8
+    assert not player1.hand and not game.dealer.hand
+
+
+def test_blackjack_game_stale_hands():
+    game = BlackjackGame(BlackjackPlayer("Alice"), BlackjackPlayer("Bob"),
+                         decks=1, seed=2)
+    for _ in range(10):
+        # The round is never ended, the next one collects the hands
+        game.start_game()
+        while not game.round_over:
+            game.stand()
+        value = game.zobrist_hash()
+        assert game.rehash().zobrist_hash() == value
+        assert len(game.draw_pile) + len(game.discard_pile) + sum(
+            len(player.hand) for player in game.players + [game.dealer]
+        ) == 52
+    game.start_game()
+    assert all(len(player.hand) == 2 for player in game.players)
+
+
+def test_blackjack_game_double():
+    game = rigged_game("6", "10", "5", "6", "King", "Ace")
+    game.start_game()
+    assert game.double() == PokerCard("King", "Hearts")
+    # The dealer hits 16 and busts
+    assert game.round_over
+    assert game.results == [2]
+
+
+def test_blackjack_game_blackjacks():
+    game = rigged_game("Ace", "9", "8", "King", "7", "10", players=2)
+    player1, player2 = game.players
+    game.start_game()
+    # Player 1 has a blackjack and does not act
+    assert game.get_current_player() is player2
+    game.stand()
+    assert game.results == [1.5, -1]
+
+    game.end_game()
+    game.set_draw_pile(PokerDeck(cards=cards("Ace", "9", "Ace", "King",
+                                             "7", "Queen")))
+    game.start_game()
+    # The dealer checks for a blackjack before anyone acts
+    assert game.round_over
+    assert game.results == [0, -1]
+
+
+def test_blackjack_game_bust():
+    game = rigged_game("10", "10", "6", "5", "King", "2")
+    player = game.players[0]
+    game.start_game()
+    game.hit()
+    assert player.is_bust()
+    # The dealer does not draw against a bust player
+    assert game.round_over
+    assert len(game.dealer.hand) == 2
+    assert game.results == [-1]
+
+    game.end_game()
+    game.set_draw_pile(PokerDeck(cards=cards("10", "10", "7", "7")))
+    game.start_game().stand()
+    assert game.results == [0]
+    game.end_game()
+    game.set_draw_pile(PokerDeck(cards=cards("10", "10", "6", "9")))
+    game.start_game().stand()
+    assert game.results == [-1]
+
+
+def test_blackjack_game_soft_17():
+    game = rigged_game("10", "Ace", "9", "6", "3", hit_soft_17=True)
+    game.start_game().stand()
+    assert game.dealer.get_total() == 20
+    assert game.results == [-1]
+
+
+def test_blackjack_game_reshuffle():
+    game = BlackjackGame(BlackjackPlayer("Alice"), decks=1, seed=3)
+    events = []
+    game.subscribe("pile_reshuffled", lambda game: events.append(
+        len(game.draw_pile)))
+    game.zobrist_hash()
+    for _ in range(20):
+        game.start_game()
+        while not game.round_over:
+            player = game.get_current_player()
+            assert isinstance(player, BlackjackPlayer)
+            if player.get_total() < 17:
+                game.hit()
+            else:
+                game.stand()
+            value = game.zobrist_hash()
+            assert game.rehash().zobrist_hash() == value
+        game.end_game()
+        # Every card is either in the shoe or in the discard pile
+        assert len(game.draw_pile) + len(game.discard_pile) == 52
+    assert events
+    assert all(count == 52 for count in events)
+
+    # An empty shoe is refilled during a round
+    game = rigged_game("10", "10", "6", "7")
+    game.discard_pile.add(*cards("5"))
+    game.start_game()
+    assert game.hit() == PokerCard("5", "Hearts")
+    assert game.results == [1]
+
+
+def test_compile_strategy():
+    table = _compile_strategy(BASIC_STRATEGY)
+    assert len(table) == 2 * 22 * 12
+    # Hard 11 against a 6 doubles, soft 18 against a 9 hits
+    assert table[(0 * 22 + 11) * 12 + 6] == 2
+    assert table[(1 * 22 + 18) * 12 + 9] == 0
+    # Totals without a row hit below 21
+    assert table[(0 * 22 + 3) * 12 + 2] == 0
+
+    with pytest.raises(ValueError):
+        _compile_strategy({"hard": {12: "HHH"}, "soft": {}})
+    with pytest.raises(ValueError):
+        _compile_strategy({"hard": {}, "soft": {13: "XXXXXXXXXX"}})
+
+
+def test_simulate_blackjack():
+    mean, error = simulate_blackjack(20000, seed=1)
+    assert mean == simulate_blackjack(20000, seed=1)[0]
+    assert 0 < error < 0.02
+    # Basic strategy without splits loses around one percent
+    assert -0.06 < mean < 0.04
+
+    # Standing on everything loses far more than basic strategy
+    stand = {"hard": {total: "S" * 10 for total in range(4, 22)},
+             "soft": {total: "S" * 10 for total in range(12, 22)}}
+    assert simulate_blackjack(20000, stand, seed=1)[0] < mean - 0.05
+
+    # A single deck without a cut card refills the shoe during rounds
+    hit = {"hard": {total: "H" * 10 for total in range(4, 22)},
+           "soft": {total: "H" * 10 for total in range(12, 22)}}
+    assert simulate_blackjack(2000, hit, decks=1, penetration=1,
+                              hit_soft_17=True, seed=2)[0] < -0.5
+    assert simulate_blackjack(2000, decks=1, penetration=1, seed=2)[1] > 0
+
+    with pytest.raises(ValueError):
+        simulate_blackjack(0)
+    with pytest.raises(ValueError):
+        simulate_blackjack(10, penetration=0)
@@ -0,0 +1,32 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from ....src.poker import PokerCard, PokerDeck
+
+
+def test_poker_card():
+    card = PokerCard("Ace", "Spades")
+    assert card.rank == 12
+    assert card.suit == 3
+    assert str(card) == "Ace of Spades"
+    assert PokerCard("2", "Clubs") < card
+
+
+def test_poker_deck():
+    deck = PokerDeck()
+    assert len(deck) == 52
+    assert str(deck) == "Deck of 52 cards. Top card: 2 of Clubs"
+    assert len({(card.rank, card.suit) for card in deck}) == 52
@@ -0,0 +1,121 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import random
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+from ....src.poker import HandEvaluator, PokerCard
+
+
+def hand(*names):
+    return [PokerCard(*name.split(" of ")) for name in names]
+
+
+def test_evaluator_categories():
+    cases = [
+        (["Ace of Hearts", "King of Hearts", "Queen of Hearts",
+          "Jack of Hearts", "10 of Hearts"], "Straight Flush"),
+        (["5 of Clubs", "4 of Clubs", "3 of Clubs", "2 of Clubs",
+          "Ace of Clubs"], "Straight Flush"),
+        (["9 of Clubs", "9 of Spades", "9 of Hearts", "9 of Diamonds",
+          "2 of Clubs"], "Four of a Kind"),
+        (["9 of Clubs", "9 of Spades", "9 of Hearts", "2 of Diamonds",
+          "2 of Clubs"], "Full House"),
+        (["9 of Clubs", "7 of Clubs", "5 of Clubs", "3 of Clubs",
+          "2 of Clubs"], "Flush"),
+        (["5 of Clubs", "4 of Spades", "3 of Clubs", "2 of Clubs",
+          "Ace of Clubs"], "Straight"),
+        (["9 of Clubs", "9 of Spades", "9 of Hearts", "2 of Diamonds",
+          "3 of Clubs"], "Three of a Kind"),
+        (["9 of Clubs", "9 of Spades", "3 of Hearts", "2 of Diamonds",
+          "3 of Clubs"], "Two Pair"),
+        (["9 of Clubs", "9 of Spades", "4 of Hearts", "2 of Diamonds",
+          "3 of Clubs"], "Pair"),
+        (["9 of Clubs", "7 of Spades", "4 of Hearts", "2 of Diamonds",
+          "3 of Clubs"], "High Card"),
+    ]
+    values = [HandEvaluator.evaluate(hand(*names)) for names, _ in cases]
+    assert [HandEvaluator.category(value) for value in values] == \
+        [category for _, category in cases]
+    # The cases are listed from the best hand to the worst
+    assert values == sorted(values, reverse=True)
+
+
+def test_evaluator_seven_cards():
+    # A flush in seven cards beats the straight and the pair
+    flush = hand("2 of Hearts", "7 of Hearts", "9 of Hearts", "Jack of Hearts",
+                 "King of Hearts", "10 of Clubs", "8 of Spades")
+    assert HandEvaluator.category(HandEvaluator.evaluate(flush)) == "Flush"
+    assert HandEvaluator.evaluate(flush) == HandEvaluator.evaluate(flush[:5])
+
+    # Two trips make a full house, and three pairs keep the best kicker
+    trips = hand("4 of Hearts", "4 of Clubs", "4 of Spades", "8 of Hearts",
+                 "8 of Clubs", "8 of Spades", "2 of Hearts")
+    assert HandEvaluator.evaluate(trips) == HandEvaluator.evaluate(
+        hand("8 of Hearts", "8 of Clubs", "8 of Spades", "4 of Hearts",
+             "4 of Clubs"))
+    pairs = hand("4 of Hearts", "4 of Clubs", "8 of Spades", "8 of Hearts",
+                 "2 of Clubs", "2 of Spades", "Ace of Hearts")
+    assert HandEvaluator.evaluate(pairs) > HandEvaluator.evaluate(
+        hand("4 of Hearts", "4 of Clubs", "8 of Spades", "8 of Hearts",
+             "King of Clubs"))
+
+    # The wheel is the lowest straight
+    wheel = hand("Ace of Hearts", "2 of Clubs", "3 of Spades", "4 of Hearts",
+                 "5 of Clubs")
+    six_high = hand("6 of Hearts", "2 of Clubs", "3 of Spades", "4 of Hearts",
+                    "5 of Clubs")
+    assert HandEvaluator.evaluate(wheel) < HandEvaluator.evaluate(six_high)
+
+
+def test_evaluator_matches_best_five():
+    rng = random.Random(7)
+    for _ in range(200):
+        codes = rng.sample(range(52), 7)
+        best = max(HandEvaluator.evaluate_codes(list(five))
+                   for five in combinations(codes, 5))
+        assert HandEvaluator.evaluate_codes(codes) == best
+
+
+def test_evaluator_distribution():
+    # Every category occurs as often as it should over all five-card hands
+    counts = Counter(HandEvaluator.category(value) for value in
+                     HandEvaluator.evaluate_batch(combinations(range(52), 5)))
+    assert counts == {
+        "Straight Flush": 40, "Four of a Kind": 624, "Full House": 3744,
+        "Flush": 5108, "Straight": 10200, "Three of a Kind": 54912,
+        "Two Pair": 123552, "Pair": 1098240, "High Card": 1302540}
+
+
+def test_evaluator_batch():
+    board = [HandEvaluator.encode(card) for card in
+             hand("Ace of Spades", "King of Spades", "7 of Hearts",
+                  "7 of Clubs", "2 of Diamonds")]
+    hands = [[48, 49], [20, 21], [44, 0]]
+    assert HandEvaluator.evaluate_batch(hands, board) == [
+        HandEvaluator.evaluate_codes(board + cards) for cards in hands]
+    assert HandEvaluator.encode(PokerCard("Ace", "Spades")) == 51
+    assert HandEvaluator.evaluate_batch([]) == []
+
+
+def test_evaluator_invalid():
+    with pytest.raises(ValueError):
+        HandEvaluator.evaluate(hand("Ace of Spades", "King of Spades"))
+    with pytest.raises(ValueError):
+        HandEvaluator.evaluate_codes(list(range(8)))
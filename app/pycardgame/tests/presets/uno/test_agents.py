@@ -0,0 +1,141 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from ....src.agents import (
+    Agent,
+    BatchRunner,
+    CALLABLE_SUITS,
+    RandomAgent,
+    Table,
+)
+from ....src.presets import NumberCard, UnoGame, UnoPlayer, WildCard
+from ....src.seeding import SeedSequence
+
+
+class CountingAgent(RandomAgent):
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self.batches = []
+
+    def decide(self, decisions):
+        self.batches.append(len(decisions))
+        return super().decide(decisions)
+
+
+def make_games(n, seed=0):
+    return [UnoGame(UnoPlayer("Alice"), UnoPlayer("Bob"), UnoPlayer("Carol"),
+                    seed=seq) for seq in SeedSequence(seed).spawn(n)]
+
+
+def test_table_init():
+    game = UnoGame(UnoPlayer("Alice"), UnoPlayer("Bob"))
+    table = Table(game)
+    assert game.get_top_card() is not None
+    assert table.decision is not None
+    assert len(game.players[0]) == 7
+    assert table.decision.kind == "card"
+    assert table.decision.player is game.players[0]
+    assert table.decision.options[-1] is None
+    assert repr(table.decision).startswith(
+        "Decision(player='Alice', kind='card', options=(")
+    assert repr(table).startswith("Table(game=UnoGame(")
+    assert repr(table).endswith("turns=0, done=False)")
+
+
+def test_table_resolve():
+    player1 = UnoPlayer("Alice", [NumberCard("5", "Red"), WildCard()])
+    player2 = UnoPlayer("Bob", [NumberCard("7", "Blue")])
+    game = UnoGame(player1, player2)
+    game.discard_cards(NumberCard("1", "Blue"))
+    table = Table(game, max_turns=3)
+    assert table.decision is not None
+    assert table.decision.options == (player1.hand[1], None)
+
+    with pytest.raises(ValueError):
+        table.resolve(player1.hand[0])
+
+    # Wild cards ask for a suit before they are played
+    wild = player1.hand[1]
+    table.resolve(wild)
+    assert table.decision.kind == "suit"
+    assert table.decision.options == CALLABLE_SUITS
+    assert table.turns == 0
+    assert len(player1) == 2
+
+    table.resolve("Red")
+    assert game.get_top_card() is wild
+    assert wild.get_suit() == "Red"
+    assert table.turns == 1
+    assert table.decision.player is player2
+    assert table.decision.options == (None,)
+
+    table.resolve(None)
+    assert len(player2) == 2
+    assert table.decision.options == (player1.hand[0], None)
+
+    table.resolve(player1.hand[0])
+    assert table.winner is player1
+    assert table.done
+    assert table.decision is None
+    with pytest.raises(ValueError):
+        table.resolve(None)
+
+
+def test_table_max_turns():
+    table = Table(make_games(1)[0], max_turns=2)
+    table.resolve(None)
+    assert not table.done
+    table.resolve(None)
+    assert table.done
+    assert table.winner is None
+
+
+def test_batch_runner():
+    agent = CountingAgent(1)
+    runner = BatchRunner(make_games(8), agent, max_turns=500)
+    assert len(runner.pending()) == 8
+    winners = runner.run()
+
+    assert runner.pending() == []
+    assert runner.step() == 0
+    assert agent.batches[0] == 8
+    # Batches only shrink as tables finish
+    assert agent.batches == sorted(agent.batches, reverse=True)
+    for table, winner in zip(runner.tables, winners):
+        assert table.done
+        assert winner is table.winner
+        assert winner is not None or table.turns == 500
+        game = table.game
+        assert len(game.draw_pile) + len(game.discard_pile) + sum(
+            len(player) for player in game.players) == 108
+
+    # Runs are reproducible
+    again = BatchRunner(make_games(8), CountingAgent(1), max_turns=500)
+    assert [table.turns for table in again.tables] == [0] * 8
+    again.run()
+    assert [table.turns for table in again.tables] == [
+        table.turns for table in runner.tables]
+
+
+def test_batch_runner_invalid_agent():
+    class LazyAgent(Agent):
+        def decide(self, decisions):
+            return []
+
+    with pytest.raises(ValueError):
+        BatchRunner(make_games(2), LazyAgent()).step()
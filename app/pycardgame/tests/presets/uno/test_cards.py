@@ -14,8 +14,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import sys
+
 import pytest
 
+from ....src.base import CardMeta
 from ....src.presets import (
     DrawTwoCard,
     NumberCard,
@@ -28,6 +31,18 @@ from ....src.presets import (
     WildCard,
     WildDrawFourCard,
 )
+from ....src.presets import T_UnoRanks, T_UnoSuits
+
+
+class FrozenWildCard(WildCard, metaclass=CardMeta, rank_type=T_UnoRanks,
+                     suit_type=T_UnoSuits, frozen=True):
+    pass
+
+
+class FrozenWildDrawFourCard(WildDrawFourCard, metaclass=CardMeta,
+                             rank_type=T_UnoRanks, suit_type=T_UnoSuits,
+                             frozen=True):
+    pass
 
 
 def test_uno_card_init():
@@ -52,6 +67,13 @@ def test_uno_card_is_wild():
     assert not card.is_wild()
 
 
+def test_uno_card_kind_key():
+    assert NumberCard("5", "Red").kind_key() == (5, 0)
+    wild = WildDrawFourCard()
+    assert wild.kind_key() == (14, 4)
+    assert wild.change_suit("Blue").kind_key() == (14, 4)
+
+
 def test_uno_card_str():
     card1 = UnoCard("2", "Green")
     assert str(card1) == "Green 2"
@@ -158,6 +180,7 @@ def test_wild_card_effect():
     game.discard_cards(UnoCard("5", "Red"))
     game.play_card(WildCard(), player1, "Blue")
     assert game.discard_pile.cards[0].suit == 2
+    assert len(game.discard_pile) == 2
 
     with pytest.raises(ValueError):
         game.play_card(WildCard(), player1)
@@ -234,3 +257,47 @@ def test_draw_two_card_stacking():
 
     assert len(drawn) == 1
     assert len(current_player) == initial_hand_size + 1
+
+
+def test_frozen_wild_card_effect():
+    card = FrozenWildCard()
+    player1 = UnoPlayer("Player 1", [card])
+    player2 = UnoPlayer("Player 2")
+    game = UnoGame(player1, player2, draw_pile=UnoDeck())
+    game.discard_cards(UnoCard("5", "Red"))
+    assert game.play_card(card, player1, "Green") is True
+
+    top = game.get_top_card()
+    assert top is not None and top is not card
+    assert (top.get_suit(), top.is_wild()) == ("Green", False)
+    assert (card.get_suit(), card.is_wild()) == ("Wild", True)
+    assert len(game.discard_pile) == 2
+    assert {top, card} == {card, top}
+
+
+def test_frozen_wild_draw_four_card_effect():
+    card = FrozenWildDrawFourCard()
+    player1 = UnoPlayer("Player 1", [card])
+    player2 = UnoPlayer("Player 2")
+    game = UnoGame(player1, player2, draw_pile=UnoDeck())
+    game.discard_cards(UnoCard("5", "Red"))
+    assert game.play_card(card, player1, "Blue") is True
+
+    top = game.get_top_card()
+    assert top is not None and top.get_suit() == "Blue"
+    assert card.is_wild() is True
+    assert len(game.discard_pile) == 2
+    assert len(player2) == 4
+
+
+def test_uno_card_memory():
+    deck = UnoDeck()
+    card_sizes = {type(card).__name__: sys.getsizeof(card) for card in deck}
+    deck_size = sys.getsizeof(deck.cards) + sum(
+        sys.getsizeof(card) for card in deck)
+    report = f"bytes per card: {card_sizes}, bytes per deck: {deck_size}"
+
+    assert not any(hasattr(card, "__dict__") for card in deck), report
+    # Four slots plus the object and garbage collector headers
+    assert max(card_sizes.values()) <= 64, report
+    assert deck_size <= 108 * 64 + sys.getsizeof([None] * 108), report
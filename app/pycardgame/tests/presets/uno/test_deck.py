@@ -24,6 +24,8 @@ from ....src.presets import (
     SkipCard,
     UnoCard,
     UnoDeck,
+    UnoGame,
+    UnoPlayer,
     WildCard,
     WildDrawFourCard,
 )
@@ -45,6 +47,18 @@ def test_uno_deck_init():
         isinstance(card, WildDrawFourCard) for card in deck.cards[104:108])
 
 
+def test_uno_deck_reset():
+    deck = UnoDeck([])
+    deck.reset()
+    assert len(deck) == 108
+    assert deck == UnoDeck()
+    assert all(a is not b for a, b in zip(deck, UnoDeck._get_prototype()))
+
+    copied = copy(deck.cards[76])
+    assert isinstance(copied, DrawTwoCard)
+    assert copied == deck.cards[76]
+
+
 def test_uno_deck_shuffle():
     deck = UnoDeck()
     original_order = copy(deck.cards)
@@ -54,6 +68,24 @@ def test_uno_deck_shuffle():
     assert all(isinstance(card, UnoCard) for card in deck.cards)
 
 
+def test_uno_deck_composition_wild():
+    # Calling a suit changes a wild card on an indexed discard pile in place
+    game = UnoGame(UnoPlayer("Alice", [WildCard(), NumberCard("1", "Red")]),
+                   UnoPlayer("Bob", [NumberCard("2", "Green")]), seed=1)
+    game.discard_pile.add(NumberCard("5", "Green"))
+    pile = game.discard_pile.track_composition()
+    wild = game.players[0].hand[0]
+    assert game.play_card(wild, game.players[0], "Red")
+    assert wild in pile
+    assert pile.count(wild) == 1
+    assert pile.get_index(wild) == [0]
+    for name in ["Red", "Green", "Wild", "5"]:
+        expected = UnoDeck(pile.cards).count(name)  # type: ignore
+        assert pile.count(name) == expected  # type: ignore
+    pile.remove(wild)
+    assert wild not in pile and pile.count("Red") == 0  # type: ignore
+
+
 def test_uno_deck_str():
     deck = UnoDeck()
     assert str(deck) == f"UNO Deck with {len(deck.cards)} cards."
@@ -0,0 +1,262 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import random
+from array import array
+
+import pytest
+
+from ....src.envs import (
+    _card_action,
+    _card_kind,
+    Box,
+    Discrete,
+    DRAW_ACTION,
+    encode_observation,
+    N_ACTIONS,
+    N_CARD_KINDS,
+    observation_size,
+    ObservationEncoder,
+    UnoEnv,
+    VecUnoEnv,
+)
+from ....src.presets import (
+    DrawTwoCard,
+    NumberCard,
+    UnoDeck,
+    UnoGame,
+    UnoPlayer,
+    WildCard,
+    WildDrawFourCard,
+)
+
+
+def legal_actions(mask):
+    return [action for action, legal in enumerate(mask.tolist()) if legal]
+
+
+def test_card_kinds_and_actions():
+    cards = UnoDeck().cards
+    assert sorted({_card_kind(card) for card in cards}) == list(
+        range(N_CARD_KINDS))
+    assert N_CARD_KINDS == 54
+    assert N_ACTIONS == 61
+    assert DRAW_ACTION == 60
+    assert _card_action(NumberCard("1", "Green")) == 5
+    assert _card_action(WildCard()) == 52
+    assert _card_action(WildDrawFourCard()) == 56
+
+
+def test_encode_observation():
+    player1 = UnoPlayer("Alice", [NumberCard("1", "Green"),
+                                  NumberCard("1", "Green"), WildCard()])
+    player2 = UnoPlayer("Bob", [NumberCard("2", "Red")])
+    player3 = UnoPlayer("Carol", [NumberCard("3", "Red")] * 3)
+    game = UnoGame(player1, player2, player3)
+    obs = encode_observation(game, player1)
+    assert len(obs) == observation_size(3) == 132
+    assert obs[5] == 2.0
+    assert obs[52] == 1.0
+    assert sum(obs[54:74]) == 0.0
+
+    game.discard_cards(NumberCard("7", "Blue"))
+    game.draw_count = 2
+    game.reverse_direction()
+    obs = encode_observation(game, player1)
+    assert obs[54 + 7] == 1.0
+    assert obs[69 + 2] == 1.0
+    assert obs[74:78].tolist() == [2.0, -1.0, 3.0, 1.0]
+    assert obs[78 + 7 * 4 + 2] == 1.0
+    assert sum(obs[78:]) == 1.0
+
+
+def test_observation_encoder():
+    encoder = ObservationEncoder(2)
+    assert (encoder.top_rank, encoder.top_suit, encoder.draw_count,
+            encoder.direction, encoder.opponents, encoder.discard,
+            encoder.size) == (54, 69, 74, 75, 76, 77, 131)
+    assert repr(encoder) == "ObservationEncoder(n_players=2)"
+    with pytest.raises(ValueError):
+        ObservationEncoder(1)
+
+    player1 = UnoPlayer("Alice", [WildDrawFourCard(), DrawTwoCard("Red")])
+    player2 = UnoPlayer("Bob", [NumberCard("4", "Yellow")])
+    game = UnoGame(player1, player2)
+    wild = WildCard()
+    game.discard_cards(NumberCard("9", "Green"), wild, DrawTwoCard("Blue"),
+                       DrawTwoCard("Blue"))
+    wild._call_suit(game, "Red")
+
+    out = array("f", [9.0] * encoder.size)
+    assert encoder.encode(game, player1, out) is out
+    assert out[53] == 1.0 and out[12 * 4] == 1.0
+    assert out[76] == 1.0
+    assert out[77 + 12 * 4 + 2] == 2.0
+    assert out[77 + 9 * 4 + 1] == 1.0
+    assert out[77 + 52] == 1.0
+    assert sum(out) == 2.0 + 2.0 + 0.0 + 1.0 + 1.0 + 4.0
+
+    # The composition index gives the same result
+    game.discard_pile.track_composition()
+    wild._call_suit(game, "Blue")
+    tracked = encoder.encode(game, player1)
+    game.discard_pile.track_composition(False)
+    assert tracked.tolist() == encoder.encode(game, player1).tolist()
+
+    with pytest.raises(ValueError):
+        encoder.encode(game, player1, array("f", [0.0] * 10))
+    with pytest.raises(ValueError):
+        encoder.encode(UnoGame(player1, player2, UnoPlayer("Carol")), player1)
+
+
+def test_observation_encoder_batch():
+    encoder = ObservationEncoder(2)
+    games = [UnoGame(UnoPlayer("Alice"), UnoPlayer("Bob"), seed=i)
+             for i in range(3)]
+    for game in games:
+        game.start_game()
+    players = [game.players[1] for game in games]
+
+    batch = encoder.encode_batch(games, players)
+    assert batch.shape == (3, 131)
+    for row, game, player in zip(batch.tolist(), games, players):
+        assert row == encoder.encode(game, player).tolist()
+
+    out = array("f", bytes(4 * 3 * 131))
+    assert encoder.encode_batch(games, players, out) is out
+    assert out.tolist() == batch.cast("B").cast("f").tolist()
+
+    with pytest.raises(ValueError):
+        encoder.encode_batch(games, players[:2])
+    with pytest.raises(ValueError):
+        encoder.encode_batch(games, players, array("f", [0.0] * 131))
+
+
+def test_spaces():
+    space = Discrete(3)
+    assert space.contains(2)
+    assert not space.contains(3)
+    assert not space.contains(1.0)
+    assert space.sample(random.Random(0)) in range(3)
+    assert repr(space) == "Discrete(3)"
+
+    box = Box(0.0, 1.0, (2,))
+    assert box.contains(memoryview(encode_observation(
+        UnoGame(UnoPlayer("A"), UnoPlayer("B")), UnoPlayer("A")))[:2])
+    assert not box.contains(bytes(12))
+    assert repr(box) == "Box(low=0.0, high=1.0, shape=(2,))"
+
+
+def test_uno_env():
+    env = UnoEnv(3, max_turns=200, seed=1)
+    assert env.action_space.n == N_ACTIONS
+    assert env.observation_space.shape == (132,)
+    assert repr(env).startswith("UnoEnv(n_players=3, opponent=")
+
+    with pytest.raises(ValueError):
+        env.step(DRAW_ACTION)
+
+    obs, info = env.reset()
+    assert info == {}
+    assert obs.format == "f"
+    assert env.observation_space.contains(obs)
+    assert env.table is not None and env.table.decision is not None
+    assert env.table.decision.player is env.player
+
+    rng = random.Random(0)
+    total = 0.0
+    for _ in range(2000):
+        mask = env.action_mask()
+        assert mask[DRAW_ACTION]
+        obs, reward, terminated, truncated, info = env.step(
+            rng.choice(legal_actions(mask)))
+        total += reward
+        if terminated or truncated:
+            assert reward in (-1.0, 1.0) or truncated
+            assert legal_actions(env.action_mask()) == [DRAW_ACTION]
+            env.reset()
+    assert env.episodes > 1
+
+    with pytest.raises(ValueError):
+        env.step(N_ACTIONS)
+    with pytest.raises(ValueError):
+        UnoEnv(1)
+
+    # Episodes are reproducible from the seed
+    other = UnoEnv(3, max_turns=200, seed=5)
+    env.reset(seed=5)
+    other.reset()
+    for _ in range(50):
+        assert env.observe().tolist() == other.observe().tolist()
+        action = legal_actions(env.action_mask())[0]
+        env.step(action)
+        other.step(action)
+        if env.table.done:
+            break
+    assert env.episodes == 1
+
+
+def test_uno_env_actions():
+    env = UnoEnv(seed=0)
+    env.reset()
+    assert env.table is not None and env.player is not None
+    hand = env.player.hand
+    hand[:] = [NumberCard("5", "Red"), WildCard()]
+    env.table.game.discard_pile.add(NumberCard("1", "Blue"), to_top=True)
+    env.table._ask_card()
+    assert legal_actions(env.action_mask()) == [52, 53, 54, 55, 60]
+
+    with pytest.raises(ValueError):
+        env.step(5 * 4)
+    wild = hand[1]
+    env.step(54)
+    assert all(card is not wild for card in hand)
+    assert wild.get_suit() == "Blue"
+
+
+def test_vec_uno_env():
+    vec = VecUnoEnv(4, 2, max_turns=100, seed=3)
+    assert repr(vec).startswith("VecUnoEnv(n_envs=4, envs=[UnoEnv(")
+    obs, infos = vec.reset()
+    assert obs.shape == (4, 131)
+    assert infos == [{}] * 4
+    assert vec.observation_space.contains(obs)
+
+    rng = random.Random(1)
+    episodes = 0
+    for _ in range(300):
+        masks = vec.action_masks()
+        assert masks.shape == (4, N_ACTIONS)
+        actions = [rng.choice([a for a in range(N_ACTIONS) if masks[i, a]])
+                   for i in range(4)]
+        obs, rewards, dones, infos = vec.step(actions)
+        assert obs.shape == (4, 131)
+        for i in range(4):
+            if dones[i]:
+                episodes += 1
+                assert len(infos[i]["terminal_observation"]) == 131
+                assert rewards[i] != 0.0 or infos[i]["truncated"]
+                # The environment was reset for the next episode
+                table = vec.envs[i].table
+                assert table is not None and not table.done
+            else:
+                assert rewards[i] == 0.0
+    assert episodes > 0
+
+    with pytest.raises(ValueError):
+        vec.step([DRAW_ACTION])
+    with pytest.raises(ValueError):
+        VecUnoEnv(0)
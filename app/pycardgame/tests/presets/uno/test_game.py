@@ -14,17 +14,26 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import random
+from copy import deepcopy
+from itertools import islice
+
 import pytest
 
+from ....src.agents import RandomAgent
 from ....src.presets import (
+    _uno_rule,
     DrawTwoCard,
     NumberCard,
+    SkipCard,
     UnoCard,
     UnoDeck,
     UnoGame,
     UnoPlayer,
     WildCard,
+    WildDrawFourCard,
 )
+from ....src.rules import RuleTable
 
 
 def test_uno_player_init():
@@ -72,6 +81,20 @@ def test_uno_game_init():
     assert game.direction == 1
 
 
+def test_uno_game_seed():
+    game1 = UnoGame(UnoPlayer("Player 1"), seed=42)
+    game2 = UnoGame(UnoPlayer("Player 1"), seed=42)
+    assert game1.draw_pile == game2.draw_pile
+    assert game1.draw_pile != UnoDeck()
+
+    game1.start_game()
+    game2.start_game()
+    assert game1.players == game2.players
+
+    game3 = UnoGame(seed=42, draw_pile=UnoDeck())
+    assert game3.draw_pile == UnoDeck()
+
+
 def test_uno_game_check_valid_play():
     card1 = NumberCard("5", "Red")
     card2 = NumberCard("5", "Blue")
@@ -93,6 +116,25 @@ def test_uno_game_check_valid_play():
     assert game.check_valid_play(card1, card2) is False
 
 
+def test_uno_game_get_playable_cards():
+    class CompiledUnoGame(UnoGame):
+        rules = RuleTable(UnoCard, _uno_rule, 1)
+
+    hand = [NumberCard("5", "Red"), DrawTwoCard("Blue"), NumberCard("7", "Red"),
+            WildCard()]
+    for game in (UnoGame(UnoPlayer("Alice")),
+                 CompiledUnoGame(UnoPlayer("Alice"))):
+        game.get_current_player().add_cards(*hand)
+        game.discard_pile.add(NumberCard("7", "Blue"))
+        assert game.rule_state() == 0
+        assert game.get_playable_cards() == hand[1:]
+
+        game.discard_pile.add(DrawTwoCard("Green"), to_top=True)
+        game.draw_count = 2
+        assert game.rule_state() == 1
+        assert game.get_playable_cards() == [hand[1]]
+
+
 def test_uno_game_discard_cards():
     player = UnoPlayer("Player 1", [NumberCard("5", "Red")])
     game = UnoGame(player)
@@ -174,6 +216,204 @@ def test_uno_game_draw_cards():
     with pytest.raises(ValueError):
         game.draw_cards(player, 999)
 
+    # Draws across a reshuffle of the discard pile
+    game.discard_pile.add(*game.draw_pile.draw(100))
+    assert len(game.draw_cards(player, 7)) == 7
+    assert len(game.draw_pile) == 97
+    assert len(game.discard_pile) == 1
+    assert len(player) == 10
+
+    game.draw_pile.clear()
+    assert game.draw_cards(player, 5, partial=True) == []
+    with pytest.raises(ValueError):
+        game.draw_cards(player, 1)
+
+    # The current player draws by default
+    game.draw_pile.add(NumberCard("1", "Red"))
+    assert game.draw_cards() == [NumberCard("1", "Red")]
+    assert len(player) == 11
+
+
+def test_uno_game_reshuffle_discard_pile():
+    game = UnoGame(UnoPlayer("Alice"))
+    game.draw_pile.clear()
+    wild = WildCard()
+    top_card = NumberCard("3", "Blue")
+    game.discard_pile.add(top_card, wild, NumberCard("5", "Red"))
+    wild._call_suit(game, "Green")
+    assert wild.get_suit() == "Green"
+
+    game.reshuffle_discard_pile()
+    assert game.discard_pile.cards == [top_card]
+    assert len(game.draw_pile) == 2
+    assert wild in game.draw_pile
+    assert wild.get_suit() == "Wild"
+    assert wild.is_wild()
+
+    # Nothing to reshuffle
+    events: list = []
+    game.subscribe("pile_reshuffled", events.append)
+    game.reshuffle_discard_pile()
+    assert len(game.draw_pile) == 2
+    assert events == []
+
+    game.draw_pile.clear()
+    game.discard_pile.add(NumberCard("4", "Red"))
+    game.reshuffle_discard_pile()
+    assert events == [game]
+
+
+def test_uno_game_play_turn():
+    player1 = UnoPlayer("Alice", [NumberCard("5", "Red"), WildCard(),
+                                  SkipCard("Red")])
+    player2 = UnoPlayer("Bob", [NumberCard("7", "Blue")])
+    game = UnoGame(player1, player2)
+    game.discard_cards(NumberCard("1", "Red"))
+
+    with pytest.raises(ValueError):
+        game.play_turn(NumberCard("7", "Blue"))
+    with pytest.raises(ValueError):
+        game.play_turn(player1.hand[1])
+    assert len(player1) == 3
+
+    event = game.play_turn(player1.hand[0])
+    assert event.player is player1
+    assert event.card == NumberCard("5", "Red")
+    assert (event.suit, event.drawn, event.effects, event.winner) == (
+        None, (), (), None)
+    assert game.get_current_player() is player2
+
+    event = game.play_turn()
+    assert event.card is None
+    assert len(event.drawn) == 1
+    assert event.drawn[0] in player2
+    assert repr(event).startswith("TurnEvent(player='Bob', card=None, ")
+    assert game.get_current_player() is player1
+
+    event = game.play_turn(player1.hand[0], "Red")
+    assert (event.suit, event.effects) == ("Red", ("call_suit",))
+    game.play_turn()
+
+    event = game.play_turn(SkipCard("Red"))
+    assert event.effects == ("skip",)
+    assert event.winner is player1
+    assert repr(event).endswith("effects=('skip',), winner='Alice')")
+
+
+def test_uno_game_play_turn_penalty():
+    player1 = UnoPlayer("Alice", [WildDrawFourCard(), NumberCard("5", "Red")])
+    player2 = UnoPlayer("Bob", [NumberCard("7", "Blue")])
+    game = UnoGame(player1, player2, seed=3)
+    game.discard_cards(NumberCard("1", "Red"))
+
+    event = game.play_turn(player1.hand[0], "Red")
+    assert event.effects == ("call_suit", "draw_four")
+    assert len(event.penalty) == 4
+    assert list(event.penalty) == player2.hand[1:]
+    assert event.drawn == ()
+    assert "penalty=(" in repr(event)
+    assert game.get_current_player() is player1
+
+    event = game.play_turn(player1.hand[0])
+    assert event.penalty == ()
+
+
+def test_uno_game_turn_order():
+    def table(ring):
+        players = [UnoPlayer(f"P{i}") for i in range(100)]
+        game = UnoGame(*players, hand_size=1, seed=6).start_game()
+        return game.use_turn_order(ring)
+
+    game, reference = table(True), table(False)
+    assert len(game.turn_order) == 100
+    assert reference.turn_order is None
+    rng = random.Random(2)
+    while len(game.players) > 2:
+        assert game.get_next_player().name == reference.get_next_player().name
+        events = []
+        for state in (game, reference):
+            playable = state.get_playable_cards()
+            card = playable[0] if playable else None
+            suit = "Red" if card is not None and card.wild else None
+            events.append(state.play_turn(card, suit))
+        assert repr(events[0]) == repr(events[1])
+        # A player leaves as soon as their hand is empty, otherwise someone
+        # is eliminated, often the player about to play
+        if events[0].winner is not None:
+            seat = reference.current_player_index
+        else:
+            seat = rng.choice([reference.current_player_index,
+                               rng.randrange(len(reference.players))])
+        # The ring keeps the seating, while the last player takes the seat
+        # of a removed player in the list
+        name = reference.players[seat].name
+        reference.remove_players(reference.players[seat])
+        game.remove_players(
+            next(player for player in game.players if player.name == name))
+        assert game.get_current_player().name == \
+            reference.get_current_player().name
+        assert game.turn_order.get_current() is game.get_current_player()
+        assert [player.name for player in game.turn_order] == \
+            [player.name for player in reference.players]
+        assert sorted(map(id, game.turn_order)) == sorted(map(id, game.players))
+    assert game.get_next_player() is game.players[
+        1 - game.current_player_index]
+
+    # Reversing and setting the current player keep the ring in sync
+    game.add_players(UnoPlayer("Late"))
+    game.reverse_direction().set_current_player(0).next_player()
+    assert game.get_current_player() is game.players[-1]
+    assert game.turn_order.get_current() is game.players[-1]
+    copied = deepcopy(game, {id(random): random})
+    copied.next_player()
+    assert copied.turn_order.get_current() is copied.get_current_player()
+    assert copied.current_player_index == len(game.players) - 2
+    assert game.use_turn_order(False).turn_order is None
+
+
+def test_uno_game_iter_turns():
+    game = UnoGame(UnoPlayer("Alice"), UnoPlayer("Bob"), seed=4)
+    turns = game.iter_turns(RandomAgent(1))
+    first = next(turns)
+    assert first.player is game.players[0]
+    assert first.card is not None or first.drawn
+
+    # The game only advances as far as the events are consumed
+    events = [first] + list(islice(turns, 9))
+    assert len(events) == 10
+    assert sum(len(player) for player in game.players) + len(
+        game.draw_pile) + len(game.discard_pile) == 108
+
+    game = UnoGame(UnoPlayer("Alice"), UnoPlayer("Bob"), seed=4)
+    events = list(game.iter_turns([RandomAgent(1), RandomAgent(2)],
+                                  max_turns=1000))
+    assert events[-1].winner is not None or len(events) == 1000
+    assert all(event.winner is None for event in events[:-1])
+
+
+def test_uno_game_zobrist_hash():
+    players = [UnoPlayer(name) for name in "ABC"]
+    game = UnoGame(*players, seed=6).start_game()
+    hashes = {game.zobrist_hash()}
+    for _ in islice(game.iter_turns(RandomAgent(seed=6)), 300):
+        # The incremental hash matches the hash computed from scratch
+        value = game.zobrist_hash()
+        assert game.rehash().zobrist_hash() == value
+        hashes.add(value)
+    assert len(hashes) > 250
+
+    # The pending draw count and a called suit are part of the state
+    value = game.zobrist_hash()
+    game.draw_count += 2
+    assert game.zobrist_hash() != value
+    game.draw_count -= 2
+    assert game.zobrist_hash() == value
+    wild = WildCard()
+    game.discard_cards(wild)
+    red = game.zobrist_hash()
+    wild.suit = wild.SUITS.index("Blue")
+    assert game.zobrist_hash() != red
+
 
 def test_uno_game_reverse_direction():
     player1 = UnoPlayer("Player 1")
@@ -242,7 +482,10 @@ def test_uno_game_end_game():
 
     player2.add_cards(NumberCard("5", "Red"))
     game2 = UnoGame(player1, player2)
+    ended = []
+    game2.subscribe("game_ended", lambda game, winner: ended.append(winner))
     assert game2.end_game() is not None
+    assert ended == [player1]
 
 
 def test_uno_game_str():
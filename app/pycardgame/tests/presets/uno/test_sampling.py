@@ -0,0 +1,151 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from collections import Counter
+from itertools import islice
+
+import pytest
+
+from ....src.agents import RandomAgent
+from ....src.presets import (
+    NumberCard,
+    UnoDeck,
+    UnoGame,
+    UnoPlayer,
+    WildCard,
+)
+from ....src.sampling import Determinizer
+from ....src.tracking import CardTracker
+
+
+def played_game(n_turns=30):
+    players = [UnoPlayer(name) for name in "ABC"]
+    game = UnoGame(*players, seed=4).start_game()
+    for _ in islice(game.iter_turns(RandomAgent(seed=1)), n_turns):
+        pass
+    return game
+
+
+def hidden(game, observer):
+    return Counter(card.kind_key() for player in game.players
+                   if player is not observer for card in player.hand) + \
+        Counter(card.kind_key() for card in game.draw_pile.cards)
+
+
+def test_determinizer_sample_keys():
+    game = played_game()
+    observer = game.players[0]
+    sampler = Determinizer(game, observer, seed=1)
+    assert sampler.seat == 0
+    assert repr(sampler) == f"Determinizer(player='A', " \
+                            f"unseen={len(sampler._pool)})"
+
+    samples = sampler.sample_keys(20)
+    assert len(samples) == 20
+    for hands, draw_pile in samples:
+        assert sorted(hands) == [1, 2]
+        assert [len(hands[seat]) for seat in (1, 2)] == \
+            [len(game.players[seat].hand) for seat in (1, 2)]
+        assert len(draw_pile) == len(game.draw_pile)
+        # Every sample deals exactly the cards the observer has not seen
+        assert Counter(hands[1] + hands[2] + draw_pile) == \
+            hidden(game, observer)
+    assert len({tuple(hands[1]) for hands, _ in samples}) > 1
+    assert Determinizer(game, observer, seed=2).sample_keys(3) == \
+        Determinizer(game, observer, seed=2).sample_keys(3)
+
+
+def test_determinizer_tracker_and_known():
+    game = played_game()
+    observer = game.get_current_player()
+    tracker = CardTracker(game)
+    seat = (game.current_player_index + 1) % 3
+    known = game.players[seat].hand[:2]
+    sampler = Determinizer(game, tracker=tracker, known={seat: known},
+                           seed=3)
+    assert sampler.player is observer
+    for hands, _ in sampler.sample_hands(10):
+        assert hands[seat][:2] == known
+        assert len(hands[seat]) == len(game.players[seat].hand)
+
+    with pytest.raises(ValueError):
+        Determinizer(game, known={game.current_player_index: known})
+    with pytest.raises(ValueError):
+        Determinizer(game, known={seat: [observer.hand[0]] * 20})
+    with pytest.raises(ValueError):
+        Determinizer(game, known={
+            seat: game.players[seat].hand + game.draw_pile.cards[:1]})
+    # The hidden cards no longer match after the game changed behind the
+    # tracker's back
+    game.draw_pile.draw()
+    with pytest.raises(ValueError):
+        Determinizer(game, tracker=tracker)
+
+
+def test_determinizer_sample():
+    game = played_game()
+    observer = game.players[0]
+    state = Determinizer(game, observer, seed=5).sample()[0]
+    assert isinstance(state, UnoGame)
+    assert [p.name for p in state.players] == ["A", "B", "C"]
+    assert state.players[0].hand == observer.hand
+    assert state.players[0] is not observer
+    assert state.get_top_card() == game.get_top_card()
+    assert len(state.draw_pile) == len(game.draw_pile)
+    assert state.current_player_index == game.current_player_index
+    assert state.direction == game.direction
+    assert state.draw_count == game.draw_count
+
+    # Playing on the sample does not affect the game
+    before = [list(player.hand) for player in game.players]
+    for _ in islice(state.iter_turns(RandomAgent(seed=2)), 50):
+        pass
+    assert [player.hand for player in game.players] == before
+
+
+def test_determinizer_wild_cards():
+    alice = UnoPlayer("Alice", [WildCard()])
+    bob = UnoPlayer("Bob", [NumberCard("1", "Red")])
+    game = UnoGame(alice, bob, draw_pile=UnoDeck(cards=[]))
+    game.draw_pile.clear()
+    game.discard_pile.add(*[card for card in UnoDeck().cards
+                            if card.kind_key() != (1, 0) and
+                            card.kind_key() != (13, 4)],
+                          NumberCard("1", "Red"), WildCard(), WildCard(),
+                          WildCard())
+    state = Determinizer(game, alice).sample()[0]
+    assert len(state.draw_pile) == 0
+    assert state.players[1].hand == bob.hand
+    # Wild cards are copied, because playing them calls a suit
+    assert state.players[0].hand[0] is not alice.hand[0]
+
+
+def test_determinizer_private_cards():
+    game = played_game()
+    sampler = Determinizer(game, seed=3)
+    prototypes = {id(card) for card in UnoDeck._get_prototype()}
+    hands, draw_pile = sampler.sample_hands()[0]
+    cards = [card for hand in hands.values() for card in hand] + draw_pile
+    state = sampler.sample()[0]
+    cards += state.draw_pile.cards + [card for player in state.players
+                                      for card in player.hand]
+    assert not any(id(card) in prototypes for card in cards)
+
+    # Changing a sampled card does not change new decks
+    expected = [repr(card) for card in UnoDeck().cards]
+    for card in cards:
+        card.suit = 3
+    assert [repr(card) for card in UnoDeck().cards] == expected
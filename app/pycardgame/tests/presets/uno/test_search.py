@@ -0,0 +1,157 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pickle
+import random
+import time
+from itertools import islice
+
+import pytest
+
+from ....src.agents import CALLABLE_SUITS, Table
+from ....src.presets import NumberCard, UnoDeck, UnoGame, UnoPlayer, WildCard
+from ....src.search import _rollout, _values, MCTSAgent
+from ....src.seeding import SeedSequence
+
+
+def new_game(seed=3):
+    return UnoGame(*[UnoPlayer(name) for name in "AB"], seed=seed).start_game()
+
+
+def rigged_game(hand_a, hand_b, top):
+    draw_pile = UnoDeck()
+    draw_pile.remove(*hand_a, *hand_b, top)
+    game = UnoGame(UnoPlayer("Alice", hand_a), UnoPlayer("Bob", hand_b),
+                   draw_pile=draw_pile)
+    game.discard_pile.add(top)
+    return game
+
+
+def test_mcts_agent_init():
+    agent = MCTSAgent(seed=1)
+    assert agent.iterations == 1000
+    assert agent.seed_sequence == SeedSequence(1)
+    assert repr(agent) == ("MCTSAgent(iterations=1000, time_limit=None, "
+                           "trees=1, workers=0)")
+    assert agent.set_seed(SeedSequence(2)).seed_sequence == SeedSequence(2)
+
+    with pytest.raises(ValueError):
+        MCTSAgent(iterations=None)
+    with pytest.raises(ValueError):
+        MCTSAgent(trees=0)
+
+
+def test_mcts_agent_search():
+    game = new_game()
+    hands = [list(player.hand) for player in game.players]
+    agent = MCTSAgent(iterations=60, trees=2, seed=1)
+    action = agent.search(game)
+    assert sum(agent.visits.values()) == 120
+    assert agent.visits[action] == max(agent.visits.values())
+    # Searching does not change the game
+    assert [player.hand for player in game.players] == hands
+
+    # Every search of an agent is seeded differently, and reseeding repeats
+    first = agent.visits
+    agent.search(game)
+    assert agent.visits != first
+    agent.set_seed(1).search(game)
+    assert agent.visits == first
+
+
+def test_mcts_agent_workers():
+    game = new_game()
+    serial = MCTSAgent(iterations=40, trees=2, seed=5)
+    parallel = MCTSAgent(iterations=40, trees=2, workers=2, seed=5)
+    try:
+        for _ in range(2):
+            assert parallel.search(game) == serial.search(game)
+            assert parallel.visits == serial.visits
+        assert parallel._executor is not None
+
+        # The agent can be pickled, e.g. for a tournament, without its pool
+        copy = pickle.loads(pickle.dumps(parallel))
+        assert copy._executor is None
+        assert copy.search(game) == serial.search(game)
+        assert copy.visits == serial.visits
+    finally:
+        parallel.close()
+    assert parallel._executor is None
+    assert parallel.close() is parallel
+
+
+def test_mcts_agent_time_limit():
+    game = new_game()
+    agent = MCTSAgent(iterations=None, time_limit=0.05, trees=2, seed=1)
+    start = time.time()
+    agent.search(game)
+    assert time.time() - start < 1.0
+    assert sum(agent.visits.values()) > 2
+
+    # Every tree completes at least one iteration
+    agent = MCTSAgent(iterations=None, time_limit=0.0, trees=3, seed=1)
+    agent.search(game)
+    assert sum(agent.visits.values()) == 3
+
+
+def test_mcts_agent_decide():
+    # The last card wins at once
+    game = rigged_game([NumberCard("5", "Red")],
+                       [NumberCard("2", "Green"), NumberCard("4", "Yellow")],
+                       NumberCard("5", "Green"))
+    agent = MCTSAgent(iterations=30, seed=2)
+    decision = Table(game).decision
+    assert decision is not None
+    assert agent.decide([decision]) == [game.players[0].hand[0]]
+
+    # The suit of a wild card is chosen with the card
+    game = rigged_game([WildCard(), NumberCard("1", "Red")],
+                       [NumberCard("2", "Green")], NumberCard("5", "Green"))
+    table = Table(game)
+    assert table.decision is not None
+    card = agent.decide([table.decision])[0]
+    assert card is game.players[0].hand[0]
+    assert len(agent._suits) == 1
+    table.resolve(card)
+    suit = agent.decide([table.decision])[0]
+    assert isinstance(suit, str) and suit in CALLABLE_SUITS
+    assert agent._suits == {}
+
+    # Without a remembered suit, only suits for the chosen card are searched
+    table = Table(game)
+    table.resolve(game.players[0].hand[0])
+    assert table.decision is not None
+    suit = agent.decide([table.decision])[0]
+    assert isinstance(suit, str) and suit in CALLABLE_SUITS
+    assert all(action is not None and action[0] == WildCard().kind_key()
+               for action in agent.visits)
+
+
+def test_mcts_agent_game():
+    game = new_game(seed=8)
+    agent = MCTSAgent(iterations=20, seed=3)
+    events = list(islice(game.iter_turns(agent), 30))
+    assert len(events) > 0
+    assert agent._suits == {}
+
+
+def test_mcts_values():
+    game = rigged_game([NumberCard("1", "Red")],
+                       [NumberCard("2", "Red"), NumberCard("3", "Red")],
+                       NumberCard("5", "Red"))
+    assert _values(game, game.players[1]) == [0.0, 1.0]
+    assert _values(game, None) == pytest.approx([0.6, 0.4])
+    assert _rollout(game, random.Random(1), 0) == pytest.approx([0.6, 0.4])
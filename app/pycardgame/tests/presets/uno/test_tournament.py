@@ -0,0 +1,138 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+
+import pytest
+
+from ....src.agents import Agent, RandomAgent
+from ....src.seeding import SeedSequence
+from ....src.tournament import Elo, play_match, Tournament
+
+
+class DrawingAgent(Agent):
+    def decide(self, decisions):
+        return [decision.options[-1] for decision in decisions]
+
+
+def make_agents():
+    return {"random1": RandomAgent(), "random2": RandomAgent(),
+            "drawing": DrawingAgent()}
+
+
+def test_elo():
+    elo = Elo(k=32)
+    assert elo.get("Alice") == 1500
+    assert elo.expected("Alice", "Bob") == 0.5
+
+    elo.update(["Alice", "Bob"], "Alice")
+    assert elo.get("Alice") == 1516
+    assert elo.get("Bob") == 1484
+    assert elo.expected("Alice", "Bob") > 0.5
+
+    # Draws move ratings towards each other
+    elo.update(["Alice", "Bob"])
+    assert 1500 < elo.get("Alice") < 1516
+
+    # The winner of a multiplayer game beats everybody else
+    elo = Elo()
+    elo.update(["Alice", "Bob", "Carol"], "Carol")
+    assert elo.get("Carol") == 1532
+    assert elo.get("Alice") == elo.get("Bob") == 1484
+    assert [name for name, _ in elo.standings()] == ["Carol", "Alice", "Bob"]
+    assert repr(elo).startswith("Elo(k=32.0, initial=1500.0, ratings={")
+
+
+def test_play_match():
+    agents = [RandomAgent(), DrawingAgent()]
+    result = play_match(3, ("a", "b"), agents, SeedSequence(1), 400)
+    assert result["match"] == 3
+    assert result["seats"] == ["a", "b"]
+    assert result["winner"] in ("a", "b", None)
+    assert 0 < result["turns"] <= 400
+    assert play_match(3, ("a", "b"), agents, SeedSequence(1), 400) == result
+
+
+def test_tournament_schedule():
+    tournament = Tournament(make_agents(), n_players=2, rounds=2)
+    schedule = tournament.schedule()
+    assert len(schedule) == 2 * 3 * 2
+    assert schedule[:2] == [("random1", "random2"), ("random2", "random1")]
+    assert len(Tournament(make_agents(), n_players=3).schedule()) == 3
+    assert repr(tournament) == (
+        "Tournament(agents=['random1', 'random2', 'drawing'], n_players=2, "
+        "rounds=2, max_turns=1000)")
+
+    with pytest.raises(ValueError):
+        Tournament(make_agents(), n_players=4)
+    with pytest.raises(ValueError):
+        Tournament(make_agents(), n_players=1)
+
+
+def test_tournament_play():
+    sequential = Tournament(make_agents(), max_turns=300, seed=7, workers=0)
+    results = list(sequential.run())
+    assert [result["match"] for result in results] == list(range(6))
+    standings = sequential.elo.standings()
+    assert len(standings) == 3
+
+    # Worker processes give the same results and ratings
+    parallel = Tournament(make_agents(), max_turns=300, seed=7, workers=2)
+    assert parallel.play() == standings
+    assert parallel.results == sequential.results
+
+
+def test_tournament_resume(tmp_path):
+    path = tmp_path / "results.jsonl"
+    full = Tournament(make_agents(), max_turns=300, seed=3, workers=0,
+                      results_path=path)
+    standings = full.play()
+    lines = path.read_text().splitlines()
+    assert len(lines) == 6
+    assert json.loads(lines[0])["match"] == 0
+
+    # Simulate a crash during the fourth write
+    path.write_text("\n".join(lines[:3]) + "\n" + lines[3][:10])
+    resumed = Tournament(make_agents(), max_turns=300, seed=3, workers=0,
+                         results_path=path)
+    new = list(resumed.run())
+    assert [result["match"] for result in new] == [3, 4, 5]
+    assert resumed.elo.standings() == standings
+    assert path.read_text().splitlines() == lines
+
+    # A crash right before the newline of the last result
+    path.write_text("\n".join(lines[:5]) + "\n" + lines[5])
+    resumed = Tournament(make_agents(), max_turns=300, seed=3, workers=0,
+                         results_path=path)
+    assert [result["match"] for result in resumed.run()] == [5]
+    assert path.read_bytes() == ("\n".join(lines) + "\n").encode()
+
+    # A complete but unreadable line and the ones after it
+    path.write_text("\n".join(lines[:2] + ["{}"] + lines[2:]) + "\n")
+    resumed = Tournament(make_agents(), max_turns=300, seed=3, workers=0,
+                         results_path=path)
+    new = list(resumed.run())
+    assert [result["match"] for result in new] == [2, 3, 4, 5]
+    assert path.read_text().splitlines() == lines
+
+    # Nothing is left to play
+    assert list(Tournament(make_agents(), max_turns=300, seed=3, workers=0,
+                           results_path=path).run()) == []
+
+    other = Tournament({"a": RandomAgent(), "b": RandomAgent()},
+                       results_path=path, workers=0)
+    with pytest.raises(ValueError):
+        list(other.run())
@@ -0,0 +1,161 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from collections import Counter
+
+import pytest
+
+from ....src.agents import RandomAgent
+from ....src.presets import (
+    NumberCard,
+    UnoDeck,
+    UnoGame,
+    UnoPlayer,
+    WildCard,
+    WildDrawFourCard,
+)
+from ....src.tracking import CardTracker
+
+
+def expected_unseen(game, player):
+    composition = Counter(card.kind_key() for card in UnoDeck().cards)
+    return (composition
+            - Counter(card.kind_key() for card in game.discard_pile.cards)
+            - Counter(card.kind_key() for card in player.hand))
+
+
+def test_tracker_init():
+    players = [UnoPlayer("Alice"), UnoPlayer("Bob")]
+    game = UnoGame(*players, seed=1).start_game()
+    tracker = CardTracker(game)
+    assert sum(tracker.composition.values()) == 108
+    for player in players:
+        assert tracker.unseen(player) == expected_unseen(game, player)
+        assert tracker.total(player) == 108 - 7 - 1
+    assert repr(tracker).endswith("players=2)")
+
+    with pytest.raises(ValueError):
+        tracker.total(UnoPlayer("Carol"))
+
+
+def test_tracker_before_start():
+    players = [UnoPlayer("Alice"), UnoPlayer("Bob")]
+    game = UnoGame(*players, seed=1)
+    tracker = CardTracker(game)
+    game.start_game()
+    top = game.get_top_card()
+    assert top is not None
+    for player in players:
+        assert tracker.unseen(player) == expected_unseen(game, player)
+        assert tracker.total(player) == 100
+    assert tracker.count(players[0], top) == (
+        expected_unseen(game, players[0])[top.kind_key()])
+
+
+def test_tracker_events():
+    alice = UnoPlayer("Alice", [NumberCard("5", "Red"), WildCard()])
+    bob = UnoPlayer("Bob", [NumberCard("7", "Blue")])
+    game = UnoGame(alice, bob, draw_pile=UnoDeck(cards=[
+        NumberCard("1", "Green"), NumberCard("5", "Red")]))
+    game.discard_pile.add(NumberCard("3", "Red"))
+    tracker = CardTracker(game)
+    red_five = NumberCard("5", "Red")
+    assert tracker.count(alice, red_five) == 1
+    assert tracker.count(bob, red_five) == 2
+
+    game.play_turn(alice.hand[0])
+    assert tracker.count(alice, red_five) == 1
+    assert tracker.count(bob, red_five) == 1
+    assert tracker.total(bob) == 105
+
+    game.play_turn()
+    assert tracker.count(bob, (1, 1)) == 1
+    assert tracker.total(bob) == 104
+    assert tracker.total(alice) == 105
+
+    # A wild card is tracked as such after a suit was called for it
+    game.play_turn(alice.hand[0], "Green")
+    assert tracker.count(bob, WildCard()) == 3
+    assert tracker.probability(bob, WildCard()) == pytest.approx(3 / 103)
+
+    tracker.detach()
+    assert game._listeners == {}
+    game.play_turn()
+    assert tracker.total(bob) == 103
+
+
+def test_tracker_matches_game():
+    players = [UnoPlayer(name) for name in "ABC"]
+    game = UnoGame(*players, seed=4).start_game()
+    tracker = CardTracker(game)
+    reshuffles: list = []
+    game.subscribe("pile_reshuffled", reshuffles.append)
+    for _ in game.iter_turns(RandomAgent(seed=1), max_turns=600):
+        for player in players:
+            assert tracker.unseen(player) == expected_unseen(game, player)
+            assert tracker.total(player) == sum(
+                expected_unseen(game, player).values())
+    assert reshuffles
+
+
+def assert_synced(tracker, players):
+    fresh = CardTracker(tracker.game, tracker.composition).detach()
+    for player in players:
+        assert tracker.unseen(player) == fresh.unseen(player)
+        assert tracker.total(player) == fresh.total(player)
+
+
+def test_tracker_reshuffle_during_effect():
+    alice = UnoPlayer("Alice", [WildDrawFourCard(), NumberCard("5", "Red")])
+    bob = UnoPlayer("Bob", [NumberCard("7", "Blue")])
+    game = UnoGame(alice, bob, draw_pile=UnoDeck(cards=[
+        NumberCard("1", "Green"), NumberCard("2", "Green")]), seed=1)
+    game.discard_pile.add(WildDrawFourCard(), *(
+        NumberCard(rank, "Yellow") for rank in range(1, 7)))
+    tracker = CardTracker(game)
+    reshuffles: list = []
+    game.subscribe("pile_reshuffled", reshuffles.append)
+    # The forced draw empties the draw pile and reshuffles the discards,
+    # including another Wild Draw Four that must not be confused with the
+    # one just played
+    game.play_turn(alice.hand[0], "Red")
+    assert reshuffles
+    assert len(bob) == 5
+    assert_synced(tracker, [alice, bob])
+
+
+def test_tracker_matches_sync():
+    for seed in range(6):
+        players = [UnoPlayer(name) for name in "ABCD"]
+        game = UnoGame(*players, seed=seed).start_game()
+        tracker = CardTracker(game)
+        for _ in game.iter_turns(RandomAgent(seed=seed), max_turns=400):
+            assert_synced(tracker, players)
+
+
+def test_tracker_probability():
+    player = UnoPlayer("Alice")
+    game = UnoGame(player)
+    tracker = CardTracker(game, composition={(5, 0): 2})
+    assert tracker.probability(player, NumberCard("5", "Red")) == 1.0
+    game.draw_pile = UnoDeck(cards=[NumberCard("5", "Red")] * 2)
+    game.draw_cards(player, 2)
+    assert tracker.total(player) == 0
+    assert tracker.probability(player, NumberCard("5", "Red")) == 0.0
+    # Untracked players are ignored
+    game.draw_pile.add(NumberCard("5", "Red"))
+    game.draw_cards(UnoPlayer("Bob"))
+    assert tracker.total(player) == 0
@@ -0,0 +1,156 @@
+# PyCardGame - A base library for creating card games in Python
+# Copyright (C) 2025  Popa-42
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import random
+
+import pytest
+
+from ....src.poker import PokerCard, PokerDeck
+from ....src.whist import (
+    resolve_tricks,
+    trick_winner,
+    WhistGame,
+    WhistPlayer,
+)
+
+
+def card(name):
+    return PokerCard(*name.split(" of "))
+
+
+def code(name):
+    c = card(name)
+    return c.rank << 2 | c.suit
+
+
+def reference_winner(codes, trump):
+    # Pairwise comparison: a trump beats any other suit, otherwise only
+    # a higher card of the same suit beats the current winner
+    best = 0
+    for i, c in enumerate(codes[1:], 1):
+        b = codes[best]
+        if c & 3 == b & 3:
+            if c >> 2 > b >> 2:
+                best = i
+        elif c & 3 == trump:
+            best = i
+    return best
+
+
+def test_trick_winner():
+    trick = [code("10 of Hearts"), code("Ace of Clubs"), code("2 of Spades"),
+             code("Jack of Hearts")]
+    assert trick_winner(trick) == 3
+    assert trick_winner(trick, trump=3) == 2
+    assert trick_winner(trick, trump=0) == 1
+    assert trick_winner(trick, trump=1) == 3
+
+
+def test_resolve_tricks_matches_reference():
+    rng = random.Random(3)
+    tricks = [rng.sample(range(52), 4) for _ in range(500)]
+    for trump in (None, 0, 1, 2, 3):
+        assert resolve_tricks(tricks, trump) == [
+            reference_winner(trick, trump) for trick in tricks]
+        assert [trick_winner(trick, trump) for trick in tricks] == \
+            resolve_tricks(tricks, trump)
+
+
+def test_whist_game_init():
+    players = [WhistPlayer(name) for name in "ABCD"]
+    game = WhistGame(*players, trump="Spades", seed=1)
+    assert game.hand_size == 13
+    assert game._trump_index() == 3
+    assert WhistGame(*players)._trump_index() == 4
+    assert str(game) == "Whist game of 4 players (Spades)"
+    assert str(WhistGame()) == "Whist game of 0 players (no trump)"
+    assert repr(players[0]) == "WhistPlayer('A', hand=[], tricks=0)"
+
+    with pytest.raises(ValueError):
+        WhistGame(*players, trump="Stars")  # type: ignore
+
+
+def test_whist_game_trick():
+    alice = WhistPlayer("Alice", [card("10 of Hearts"), card("2 of Clubs")])
+    bob = WhistPlayer("Bob", [card("Ace of Hearts"), card("3 of Spades")])
+    carol = WhistPlayer("Carol", [card("4 of Spades"), card("5 of Clubs")])
+    game = WhistGame(alice, bob, carol, trump="Spades", hand_size=2)
+    game.draw_pile = PokerDeck(cards=[])
+    events = []
+    game.subscribe("card_played", lambda g, p, c: events.append(p.name))
+
+    assert game.check_valid_play(card("2 of Clubs"))
+    assert game.get_playable_cards() == alice.hand
+    assert game.play_card(alice.hand[0]) is None
+    assert game.get_current_player() is bob
+    # Bob must follow with the Ace of Hearts
+    assert game.get_playable_cards() == [card("Ace of Hearts")]
+    with pytest.raises(ValueError):
+        game.play_card(bob.hand[1])
+    with pytest.raises(ValueError):
+        game.play_card(carol.hand[0], carol)
+    with pytest.raises(ValueError):
+        game.play_card(card("Ace of Hearts"))
+    assert game.play_card(bob.hand[0], bob) is None
+    # Carol has no hearts and trumps the trick
+    assert game.get_playable_cards() == carol.hand
+    assert game.play_card(carol.hand[0]) is carol
+    assert carol.tricks == 1
+    assert len(game.discard_pile) == 3
+    assert game.get_current_player() is carol
+    assert not game.game_ended
+
+    game.play_card(carol.hand[0])
+    game.play_card(alice.hand[0])
+    assert game.play_card(bob.hand[0]) is bob
+    assert game.game_ended
+    assert events == ["Alice", "Bob", "Carol", "Carol", "Alice", "Bob"]
+    # Won tricks are never shuffled back into the draw pile
+    assert len(game.reshuffle_discard_pile().draw_pile) == 0
+
+    # Bob and Carol both won a trick
+    assert game.end_game() is None
+    bob.tricks = 2
+    ended = []
+    game.subscribe("game_ended", lambda g, winner: ended.append(winner))
+    assert game.end_game() is bob
+    assert ended == [bob]
+    assert WhistGame().determine_winner() is None
+
+
+def test_whist_game_full():
+    players = [WhistPlayer(name) for name in "ABCD"]
+    game = WhistGame(*players, trump="Hearts", seed=5)
+    started = []
+    game.subscribe("game_started", lambda g: started.append(len(g.draw_pile)))
+    game.start_game()
+    assert started == [0]
+    assert all(len(player.hand) == 13 for player in players)
+    rng = random.Random(5)
+    winners = []
+    hashes = {game.zobrist_hash()}
+    while not game.game_ended:
+        winner = game.play_card(rng.choice(game.get_playable_cards()))
+        value = game.zobrist_hash()
+        assert game.rehash().zobrist_hash() == value
+        hashes.add(value)
+        if winner is not None:
+            winners.append(winner)
+            assert game.get_current_player() is winner
+    assert len(winners) == 13
+    assert sum(player.tricks for player in players) == 13
+    assert len(game.discard_pile) == 52
+    assert len(hashes) == 53